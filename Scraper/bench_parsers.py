@@ -0,0 +1,128 @@
+"""
+Parsing micro-benchmark for the AICTE listing and IIRS pages.
+
+Builds HTML fixtures shaped like the live pages from the records in
+jobs.json (repeated up to the requested number of cards) and saves them
+under data/fixtures, then times every available parser backend on them.
+Saved fixtures are reused, so a real page saved as
+data/fixtures/aicte_<cards>.html is benchmarked as-is.
+
+Run with:
+    python bench_parsers.py
+    python bench_parsers.py --cards 1000 5000 20000 --repeat 5
+"""
+import argparse
+import html
+import json
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from internship_scraper.aicte_scraper import parse_aicte_internships
+from internship_scraper.html_parser import available_backends
+from internship_scraper.iirs_scraper import _detail_page_content
+
+FIXTURE_DIR = Path("data") / "fixtures"
+
+
+def _card(rec: Dict[str, str]) -> str:
+    e = {k: html.escape(str(v)) for k, v in rec.items()}
+    link = e["job_link"].replace("https://internship.aicte-india.org/", "")
+    return f"""
+<div class="card internship-item">
+  <div class="internship-primary-info">
+    <h3 class="job-title">{e['job_title']}</h3>
+    <h5 class="company-name">{e['company_name']}</h5>
+    <ul class="job-attributes">
+      <li class="wfh"><i class="fa fa-home"></i> <span>{e['wfh']}</span></li>
+      <li class="posted-on"><i class="fa fa-clock"></i> <span>{e['posted_on']}</span></li>
+      <li class="location"><i class="fa fa-map-marker"></i> <span>{e['location']}</span></li>
+    </ul>
+  </div>
+  <ul class="job-supplement-attributes">
+    <li class="start-date">Starts <span>{e['start_date']}</span></li>
+    <li class="duration">Duration <span>{e['duration']}</span></li>
+    <li class="apply-by">Apply by <span>{e['apply_by']}</span></li>
+  </ul>
+  <div class="btn-wrap">
+    <a class="btn btn-outline" href="#">Share</a>
+    <a class="btn btn-primary" href="{link}">View Details</a>
+  </div>
+</div>"""
+
+
+def aicte_fixture(records: List[Dict[str, str]], cards: int) -> str:
+    body = "".join(_card(records[i % len(records)]) for i in range(cards))
+    return (
+        "<html><head><title>AICTE Internships</title>"
+        "<script>var analytics = {};</script></head><body>"
+        "<header><nav><a href='/'>Home</a></nav></header>"
+        f"<div class='internships-list'>{body}</div>"
+        "<footer>AICTE</footer></body></html>"
+    )
+
+
+def iirs_fixture(records: List[Dict[str, str]], paragraphs: int) -> str:
+    text = "".join(
+        f"<p>{html.escape(records[i % len(records)]['job_title'])} - duration 6 months, "
+        f"stipend Rs. 10,000 per month, remote sensing and GIS. Last date 30/11/2025.</p>"
+        for i in range(paragraphs)
+    )
+    return (
+        "<html><body><header><nav><a href='/internship'>Internship</a></nav></header>"
+        f"<main><h1>External Student Internship</h1>{text}<aside>Related</aside></main>"
+        "<footer>IIRS</footer></body></html>"
+    )
+
+
+def load_fixture(name: str, build) -> str:
+    path = FIXTURE_DIR / name
+    if not path.exists():
+        FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(build(), encoding="utf-8")
+    return path.read_text(encoding="utf-8")
+
+
+def best_time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on scraper fixtures.")
+    parser.add_argument("--cards", type=int, nargs="+", default=[1000, 5000, 20000],
+                        help="AICTE cards per fixture")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    parser.add_argument("--jobs", default="jobs.json", help="Records used to fill the fixtures")
+    args = parser.parse_args()
+
+    records = [r for r in json.loads(Path(args.jobs).read_text(encoding="utf-8"))
+               if r.get("source") == "AICTE Internship"]
+    backends = available_backends()
+
+    print(f"{'fixture':>18} | " + " | ".join(f"{name:>12}" for name in backends) + "  (ms)")
+    print("-" * (21 + 15 * len(backends)))
+
+    for cards in args.cards:
+        page = load_fixture(f"aicte_{cards}.html", lambda: aicte_fixture(records, cards))
+        reference = parse_aicte_internships(page, parser="html.parser")
+        timings = []
+        for name in backends:
+            if parse_aicte_internships(page, parser=name) != reference:
+                print(f"[WARN] {name} output differs from html.parser on aicte_{cards}.html")
+            timings.append(best_time(lambda: parse_aicte_internships(page, parser=name), args.repeat))
+        print(f"{'aicte ' + str(cards):>18} | " + " | ".join(f"{t * 1e3:>12.1f}" for t in timings))
+
+    page = load_fixture("iirs_detail.html", lambda: iirs_fixture(records, 200))
+    timings = []
+    for name in backends:
+        timings.append(best_time(lambda: _detail_page_content(page, parser=name), args.repeat))
+    print(f"{'iirs detail':>18} | " + " | ".join(f"{t * 1e3:>12.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
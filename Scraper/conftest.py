@@ -0,0 +1 @@
+# Makes the internship_scraper package importable when pytest runs from here.
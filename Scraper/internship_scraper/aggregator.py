@@ -1,37 +1,161 @@
-from typing import List, Dict
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, List, Dict, Optional, Set, Tuple
 
-from .aicte_scraper import fetch_aicte_html, parse_aicte_internships
-from .skill_india_client import fetch_skill_india_programs, parse_skill_india_programs
+from .aicte_scraper import fetch_aicte_internships
+from .skill_india_client import IncompleteSourceError, iter_skill_india_pages
 from .iirs_scraper import fetch_iirs_internships
+from .config import HTTP_CACHE_DIR, RECORD_STORE_PATH
+from .fetcher import Fetcher
+from .http_cache import HttpCache
+from .record_store import RecordStore
 
 
-def aggregate_internships() -> List[Dict[str, str]]:
-    all_records: List[Dict[str, str]] = []
+PROGRESS_PREFIX = "[PROGRESS] "
+
+
+def report_progress(source: str, status: str, records: Optional[int] = None) -> None:
+    # machine-readable progress line, parsed by the backend's scraper job runner
+    payload = {"source": source, "status": status}
+    if records is not None:
+        payload["records"] = records
+    print(PROGRESS_PREFIX + json.dumps(payload), flush=True)
+
+
+# source name -> its records are streamed in this order by aggregate_internships
+SOURCES = ["AICTE", "Skill India", "IIRS"]
+
+Batch = List[Dict[str, str]]
 
-    # --- AICTE ---
-    try:
-        aicte_html = fetch_aicte_html()
-        aicte_records = parse_aicte_internships(aicte_html)
-        all_records.extend(aicte_records)
-    except Exception as e:  
-        print(f"[WARN] Failed to fetch/parse AICTE internships: {e}")
 
-    # --- Skill India ---
+async def _single_batch(fetch: Awaitable[Batch]) -> AsyncIterator[Batch]:
+    yield await fetch
+
+
+async def _skill_india_batches(fetcher: Fetcher) -> AsyncIterator[Batch]:
+    failed_pages: List[int] = []
+    async for page in iter_skill_india_pages(fetcher, failed_pages=failed_pages):
+        yield page
+    if failed_pages:
+        raise IncompleteSourceError(f"Skill India pages {failed_pages} could not be fetched", [])
+
+
+def _source_batches(source: str, fetcher: Fetcher) -> AsyncIterator[Batch]:
+    if source == "AICTE":
+        return _single_batch(fetch_aicte_internships(fetcher))
+    if source == "Skill India":
+        return _skill_india_batches(fetcher)
+    return _single_batch(fetch_iirs_internships(fetcher))
+
+
+async def _run_source(source: str, batches: AsyncIterator[Batch], queue: asyncio.Queue) -> bool:
+    # streams one source into the queue, reporting progress; returns whether it completed
+    report_progress(source, "running")
+    count = 0
     try:
-        skill_json = fetch_skill_india_programs(1, 10000)
-        skill_records = parse_skill_india_programs(skill_json)
-        all_records.extend(skill_records)
-    except Exception as e: 
-        print(f"[WARN] Failed to fetch/parse Skill India internships: {e}")
+        async for batch in batches:
+            count += len(batch)
+            await queue.put((source, batch))
+    except Exception as e:
+        if count:
+            print(f"[WARN] {source} internships incomplete: {e}")
+            report_progress(source, "partial", count)
+        else:
+            print(f"[WARN] Failed to fetch/parse {source} internships: {e}")
+            report_progress(source, "failed", 0)
+        return False
+    finally:
+        # end-of-source marker
+        await queue.put((source, None))
+    report_progress(source, "done", count)
+    return True
+
 
-    # --- IIRS (ISRO) ---
+async def stream_internships(
+    complete_sources: Set[str], fetcher: Optional[Fetcher] = None
+) -> AsyncIterator[Tuple[str, Batch]]:
+    """Fetch all sources concurrently and yield (source, records) batches as they arrive.
+
+    A run takes as long as the slowest source. Once the stream is exhausted,
+    complete_sources holds the record "source" labels of sources fetched in full.
+    """
+    own_fetcher = fetcher is None
+    if own_fetcher:
+        fetcher = Fetcher(cache=HttpCache(HTTP_CACHE_DIR) if HTTP_CACHE_DIR else None)
+
+    # a small queue keeps producers from running far ahead of the consumer
+    queue: asyncio.Queue = asyncio.Queue(maxsize=len(SOURCES))
+    labels: Dict[str, Set[str]] = {source: set() for source in SOURCES}
+    tasks = {
+        source: asyncio.create_task(_run_source(source, _source_batches(source, fetcher), queue))
+        for source in SOURCES
+    }
+    finished = 0
     try:
-        iirs_records = fetch_iirs_internships()
-        all_records.extend(iirs_records)
-    except Exception as e:  
-        print(f"[WARN] Failed to fetch/parse IIRS internships: {e}")
+        while finished < len(tasks):
+            source, batch = await queue.get()
+            if batch is None:
+                finished += 1
+                continue
+            labels[source].update(rec["source"] for rec in batch)
+            yield source, batch
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        if own_fetcher:
+            await fetcher.close()
+
+    for source, task in tasks.items():
+        # a source that came back empty is not trusted to have no listings
+        if await task:
+            complete_sources.update(labels[source])
+
+    if fetcher.cache is not None:
+        print(f"[CACHE] {fetcher.cache.summary()}")
+
+
+async def aggregate_internships_async(
+    fetcher: Optional[Fetcher] = None,
+) -> Tuple[List[Dict[str, str]], Set[str]]:
+    """Fetch all sources concurrently and collect their records.
+
+    Returns:
+        Tuple of (records, complete_sources) where complete_sources holds the
+        record "source" labels of sources that were fetched in full
+    """
+    per_source: Dict[str, Batch] = {source: [] for source in SOURCES}
+    complete_sources: Set[str] = set()
+    async for source, batch in stream_internships(complete_sources, fetcher):
+        per_source[source].extend(batch)
 
-    for idx, rec in enumerate(all_records, start=1):
-        rec["job_id"] = idx
+    # same record order as the sequential scraper: AICTE, Skill India, IIRS
+    all_records = [rec for source in SOURCES for rec in per_source[source]]
+    return all_records, complete_sources
 
-    return all_records
+
+def aggregate_internships_with_delta(
+    store_path: str = RECORD_STORE_PATH,
+) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+    """Scrape all sources and assign stable, content-derived job_ids.
+
+    Returns:
+        Tuple of (records, delta) where delta lists the added, changed and
+        removed records since the previous run (see RecordStore.apply)
+    """
+    records, complete_sources = asyncio.run(aggregate_internships_async())
+
+    store = RecordStore(store_path)
+    # a source that failed, came back partial or empty keeps its previous listings
+    delta = store.apply(records, complete_sources)
+    store.save()
+
+    print(
+        f"[DELTA] {len(delta['added'])} added, {len(delta['changed'])} changed, "
+        f"{len(delta['removed'])} removed, {delta['unchanged']} unchanged"
+    )
+    return records, delta
+
+
+def aggregate_internships() -> List[Dict[str, str]]:
+    records, _ = aggregate_internships_with_delta()
+    return records
@@ -1,67 +1,116 @@
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Set
 
-import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
 from .config import AICTE_LIST_URL, AICTE_DETAIL_BASE, HEADERS
+from .fetcher import Fetcher
+from .html_parser import Selector, get_backend
 from .models import base_record
 
 
-def fetch_aicte_html() -> str:
-    resp = requests.get(AICTE_LIST_URL, headers=HEADERS, timeout=20)
-    resp.raise_for_status()
-    return resp.text
-
-
-def parse_aicte_internships(html: str) -> List[Dict[str, str]]:
-    soup = BeautifulSoup(html, "html.parser")
+async def fetch_aicte_html(fetcher: Fetcher) -> str:
+    return await fetcher.get_text(AICTE_LIST_URL, headers=HEADERS, timeout=20)
+
+
+async def fetch_aicte_internships(fetcher: Fetcher) -> List[Dict[str, str]]:
+    # parsed records are reused from the HTTP cache when the listing is unchanged
+    return await fetcher.fetch_parsed(
+        "GET", AICTE_LIST_URL, parse_aicte_internships, headers=HEADERS, timeout=20
+    )
+
+
+_CARD = Selector("div.internships-list div.card.internship-item")
+
+# heading (tag, class) inside .internship-primary-info -> record field
+_HEADING_FIELDS = {
+    ("h3", "job-title"): "job_title",
+    ("h5", "company-name"): "company_name",
+}
+
+# <li class=...><span>value</span></li> -> (enclosing <ul> class, record field)
+_ATTRIBUTE_FIELDS = {
+    "wfh": ("job-attributes", "wfh"),
+    "posted-on": ("job-attributes", "posted_on"),
+    "location": ("job-attributes", "location"),
+    "start-date": ("job-supplement-attributes", "start_date"),
+    "duration": ("job-supplement-attributes", "duration"),
+    "apply-by": ("job-supplement-attributes", "apply_by"),
+}
+
+
+def _walk_card(
+    backend: Any,
+    node: Any,
+    rec: Dict[str, str],
+    found: Set[str],
+    primary: bool = False,
+    list_class: Optional[str] = None,
+    li_field: Optional[str] = None,
+    btn_wrap: bool = False,
+) -> None:
+    # one depth-first pass over the card; the flags track which of the
+    # original per-field CSS selectors the current element sits under
+    for el in backend.children(node):
+        tag = backend.tag(el)
+        classes = backend.classes(el)
+
+        field = None
+        if tag in ("h3", "h5") and primary:
+            for cls in classes:
+                field = _HEADING_FIELDS.get((tag, cls))
+                if field:
+                    break
+        elif tag == "span" and li_field:
+            field = li_field
+        elif tag == "a" and btn_wrap and "btn" in classes and "btn-primary" in classes:
+            field = "job_link"
+
+        if field:
+            # like select_one, the first match of each field wins
+            if field not in found:
+                found.add(field)
+                if field == "job_link":
+                    href = backend.attr(el, "href")
+                    if href is not None:
+                        rec["job_link"] = urljoin(AICTE_DETAIL_BASE, href)
+                else:
+                    rec[field] = backend.text(el)
+            continue
+
+        child_li_field = li_field
+        if tag == "li":
+            for cls in classes:
+                if cls in _ATTRIBUTE_FIELDS:
+                    required_list, attr_field = _ATTRIBUTE_FIELDS[cls]
+                    if list_class == required_list and (primary or required_list != "job-attributes"):
+                        child_li_field = attr_field
+                    break
+        child_list_class = list_class
+        if tag == "ul":
+            if "job-attributes" in classes:
+                child_list_class = "job-attributes"
+            elif "job-supplement-attributes" in classes:
+                child_list_class = "job-supplement-attributes"
+
+        _walk_card(
+            backend, el, rec, found,
+            primary or "internship-primary-info" in classes,
+            child_list_class,
+            child_li_field,
+            btn_wrap or "btn-wrap" in classes,
+        )
+
+
+def parse_aicte_internships(html: str, parser: Optional[str] = None) -> List[Dict[str, str]]:
+    backend = get_backend(parser)
+    root = backend.parse(html)
     results: List[Dict[str, str]] = []
 
-    for card in soup.select("div.internships-list div.card.internship-item"):
-        primary = card.select_one(".internship-primary-info")
-
+    for card in backend.select(root, _CARD):
         rec = base_record()
         rec["source"] = "AICTE Internship"
 
-        if primary:
-            job_title_el = primary.select_one("h3.job-title")
-            if job_title_el:
-                rec["job_title"] = job_title_el.get_text(strip=True)
-
-            company_el = primary.select_one("h5.company-name")
-            if company_el:
-                rec["company_name"] = company_el.get_text(strip=True)
-
-            attr = primary.select_one("ul.job-attributes")
-            if attr:
-                wfh_el = attr.select_one("li.wfh span")
-                posted_el = attr.select_one("li.posted-on span")
-                location_el = attr.select_one("li.location span")
-
-                if wfh_el:
-                    rec["wfh"] = wfh_el.get_text(strip=True)
-                if posted_el:
-                    rec["posted_on"] = posted_el.get_text(strip=True)
-                if location_el:
-                    rec["location"] = location_el.get_text(strip=True)
-
-        supp = card.select_one("ul.job-supplement-attributes")
-        if supp:
-            start_el = supp.select_one("li.start-date span")
-            duration_el = supp.select_one("li.duration span")
-            apply_el = supp.select_one("li.apply-by span")
-
-            if start_el:
-                rec["start_date"] = start_el.get_text(strip=True)
-            if duration_el:
-                rec["duration"] = duration_el.get_text(strip=True)
-            if apply_el:
-                rec["apply_by"] = apply_el.get_text(strip=True)
-
-        link_el = card.select_one(".btn-wrap a.btn.btn-primary")
-        if link_el and link_el.has_attr("href"):
-            rec["job_link"] = urljoin(AICTE_DETAIL_BASE, link_el["href"])
+        _walk_card(backend, card, rec, set())
 
         results.append(rec)
 
@@ -0,0 +1,144 @@
+import os
+from typing import Any, Dict, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+
+from .models import base_record
+
+# Columns every record has (job_id is an integer, the rest are strings)
+STRING_COLUMNS = [name for name in base_record() if name != "job_id"]
+
+# Derived columns (duration_months, job_title_clean, location_tokens, domain_auto)
+# are what the sih-backend ML scripts need. The rules below must stay in sync
+# with parse_duration_to_months, simple_location_tokens and
+# build_domain_from_title in sih-backend/job_catalogue.py;
+# sih-backend/tests/test_job_catalogue.py checks that they do.
+
+# bump when the derived columns or their rules change, so stale catalogues are ignored
+CATALOGUE_VERSION = "1"
+
+
+def parse_duration_to_months(duration_str: str) -> float:
+    if not isinstance(duration_str, str):
+        return 0.0
+    s = duration_str.lower().strip()
+    num = "".join(ch for ch in s if ch.isdigit())
+    value = float(num) if num else 0.0
+    if "month" in s:
+        return value
+    if "week" in s:
+        return value / 4.0
+    if "year" in s:
+        return value * 12.0
+    return 0.0
+
+
+def location_tokens(loc_str: str) -> List[str]:
+    if not isinstance(loc_str, str):
+        return []
+    return sorted(set(loc_str.lower().replace(",", " ").split()))
+
+
+def domain_from_title(title: str) -> str:
+    if not isinstance(title, str):
+        return "other"
+    t = title.lower()
+    if "data science" in t or "data analyst" in t:
+        return "data science"
+    if "machine learning" in t or "aiml" in t or " ai" in t:
+        return "machine learning"
+    if "python" in t:
+        return "python"
+    if "web" in t or "full stack" in t or "frontend" in t:
+        return "web development"
+    if "android" in t or "app" in t or "mobile" in t:
+        return "app development"
+    if "cyber" in t or "security" in t:
+        return "cyber security"
+    if "devops" in t or "cloud" in t:
+        return "cloud devops"
+    if "digital marketing" in t or "marketing" in t:
+        return "digital marketing"
+    if "vlsi" in t or "embedded" in t:
+        return "vlsi/embedded"
+    return "other"
+
+
+def _schema() -> Any:
+    fields = [pa.field("job_id", pa.int64())]
+    fields += [pa.field(name, pa.string()) for name in STRING_COLUMNS]
+    fields += [
+        pa.field("duration_months", pa.float64()),
+        pa.field("job_title_clean", pa.string()),
+        pa.field("location_tokens", pa.list_(pa.string())),
+        pa.field("domain_auto", pa.string()),
+    ]
+    return pa.schema(fields, metadata={"catalogue_version": CATALOGUE_VERSION})
+
+
+def _batch(records: List[Dict[str, Any]], schema: Any) -> Any:
+    columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+    for rec in records:
+        columns["job_id"].append(int(rec["job_id"]))
+        for name in STRING_COLUMNS:
+            value = rec.get(name)
+            columns[name].append("" if value is None else str(value))
+        columns["duration_months"].append(parse_duration_to_months(rec.get("duration")))
+        columns["job_title_clean"].append((rec.get("job_title") or "").lower())
+        columns["location_tokens"].append(location_tokens(rec.get("location")))
+        columns["domain_auto"].append(domain_from_title(rec.get("job_title")))
+    return pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+class CatalogueWriter:
+    """Writes records, batch by batch, to a typed columnar catalogue.
+
+    A path ending in .parquet writes Parquet; anything else (e.g. jobs.arrow)
+    writes an uncompressed Arrow IPC file, which readers can memory-map.
+    The file appears under its final name only once close() succeeds.
+    """
+
+    def __init__(self, path: str) -> None:
+        if pa is None:
+            raise RuntimeError("pyarrow is required to write the columnar catalogue")
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.schema = _schema()
+        self.rows = 0
+        if path.endswith(".parquet"):
+            self._writer = pq.ParquetWriter(self.tmp_path, self.schema)
+            self._sink = None
+        else:
+            self._sink = pa.OSFile(self.tmp_path, "wb")
+            self._writer = pa.ipc.new_file(self._sink, self.schema)
+
+    def __enter__(self) -> "CatalogueWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close(discard=exc_type is not None)
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        self._writer.write_batch(_batch(records, self.schema))
+        self.rows += len(records)
+
+    def close(self, discard: bool = False) -> None:
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+        if discard:
+            os.remove(self.tmp_path)
+        else:
+            os.replace(self.tmp_path, self.path)
+
+
+def write_catalogue(records: List[Dict[str, Any]], path: str) -> int:
+    with CatalogueWriter(path) as writer:
+        writer.write(records)
+    return writer.rows
@@ -1,3 +1,4 @@
+import os
 from typing import Dict
 
 
@@ -5,6 +6,25 @@ AICTE_LIST_URL: str = "https://internship.aicte-india.org/fetch_city.php?city="
 AICTE_DETAIL_BASE: str = "https://internship.aicte-india.org/"
 
 SKILL_INDIA_URL: str = "https://api-fe.skillindiadigital.gov.in/api/internship/get-programs"
+SKILL_INDIA_PAGE_SIZE: int = 500
+SKILL_INDIA_MAX_PARALLEL_PAGES: int = 4
+SKILL_INDIA_PAGE_RETRIES: int = 2
+
+# HTTP fetching
+REQUEST_TIMEOUT: float = 30.0
+MAX_CONNECTIONS_PER_HOST: int = 4
+MAX_RETRIES: int = 3
+BACKOFF_BASE: float = 1.0
+BACKOFF_MAX: float = 10.0
+
+# HTML parser backend: "auto", "selectolax", "lxml" or "html.parser"
+HTML_PARSER: str = os.environ.get("SCRAPER_HTML_PARSER", "auto")
+
+# on-disk conditional-GET cache (relative to the working directory); empty disables it
+HTTP_CACHE_DIR: str = os.environ.get("SCRAPER_HTTP_CACHE_DIR", os.path.join("data", "http_cache"))
+
+# records of previous runs, used for stable job_ids and delta output
+RECORD_STORE_PATH: str = os.environ.get("SCRAPER_RECORD_STORE", os.path.join("data", "record_store.json"))
 
 HEADERS: Dict[str, str] = {
     "User-Agent": "Mozilla/5.0 (compatible; ShivamtrixScraper/4.32; +https://local.itshivam.in)",
@@ -0,0 +1,204 @@
+import asyncio
+import random
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from .config import (
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    MAX_CONNECTIONS_PER_HOST,
+    MAX_RETRIES,
+    REQUEST_TIMEOUT,
+)
+from .http_cache import HttpCache
+
+# transient responses worth another attempt
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _parser_name(parse: Callable[[str], Any]) -> str:
+    return f"{parse.__module__}.{parse.__qualname__}"
+
+
+class Fetcher:
+    """Shared async HTTP client with a per-host concurrency limit and retries.
+
+    With an HttpCache, fetch_parsed() sends conditional requests and reuses
+    the records parsed last time when the response has not changed.
+
+    Usage:
+        async with Fetcher() as fetcher:
+            html = await fetcher.get_text(url, headers=HEADERS)
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = MAX_CONNECTIONS_PER_HOST,
+        timeout: float = REQUEST_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+        cache: Optional[HttpCache] = None,
+    ) -> None:
+        self.cache = cache
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        # one pool per TLS mode; IIRS is fetched without certificate checks
+        self._clients: Dict[bool, httpx.AsyncClient] = {}
+
+    async def __aenter__(self) -> "Fetcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    def _client(self, verify: bool) -> httpx.AsyncClient:
+        client = self._clients.get(verify)
+        if client is None:
+            client = httpx.AsyncClient(
+                verify=verify,
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+            self._clients[verify] = client
+        return client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return limit
+
+    def backoff(self, attempt: int) -> float:
+        # exponential backoff with jitter so parallel retries do not line up
+        delay = min(BACKOFF_MAX, self.backoff_base * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        json: Any = None,
+        timeout: Optional[float] = None,
+        verify: bool = True,
+    ) -> httpx.Response:
+        client = self._client(verify)
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._host_limit(url):
+                    resp = await client.request(
+                        method,
+                        url,
+                        headers=headers,
+                        json=json,
+                        timeout=self.timeout if timeout is None else timeout,
+                    )
+            except httpx.TransportError:
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if resp.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                    # 304 answers a conditional request and is handled by fetch_parsed
+                    if resp.status_code != 304:
+                        resp.raise_for_status()
+                    return resp
+            await asyncio.sleep(self.backoff(attempt))
+        raise AssertionError("unreachable")
+
+    async def get_text(self, url: str, **kwargs: Any) -> str:
+        resp = await self.request("GET", url, **kwargs)
+        return resp.text
+
+    async def post_json(self, url: str, payload: Any, **kwargs: Any) -> Any:
+        resp = await self.request("POST", url, json=payload, **kwargs)
+        return resp.json()
+
+    def cached_parsed(
+        self, method: str, url: str, parse: Callable[[str], Any], *, json: Any = None
+    ) -> Any:
+        """Result of parse for the last successful fetch of this request, or None."""
+        if self.cache is None:
+            return None
+        entry = self.cache.load(self.cache.make_key(method, url, json))
+        return self.cache.load_parsed(entry, _parser_name(parse)) if entry is not None else None
+
+    async def fetch_parsed(
+        self,
+        method: str,
+        url: str,
+        parse: Callable[[str], Any],
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        json: Any = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Fetch url and return parse(body text).
+
+        parse runs in a worker thread and must return JSON-serialisable data
+        when a cache is configured.
+        """
+        if self.cache is None:
+            resp = await self.request(method, url, headers=headers, json=json, **kwargs)
+            return await asyncio.to_thread(parse, resp.text)
+
+        cache = self.cache
+        key = cache.make_key(method, url, json)
+        entry = cache.load(key)
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.conditional_headers())
+
+        resp = await self.request(method, url, headers=request_headers, json=json, **kwargs)
+        cache.stats["requests"] += 1
+        cache.stats["bytes_downloaded"] += len(resp.content)
+
+        if entry is not None and resp.status_code == 304:
+            cache.stats["not_modified"] += 1
+            content, content_hash = None, entry.content_hash
+        else:
+            content, content_hash = resp.content, cache.content_hash(resp.content)
+            if entry is not None and content_hash == entry.content_hash:
+                cache.stats["unchanged"] += 1
+                content = None
+            else:
+                cache.stats["changed"] += 1
+                entry = None
+
+        # 304 keeps the old validators unless the server sent new ones
+        etag = resp.headers.get("ETag") or (entry.etag if entry else None)
+        last_modified = resp.headers.get("Last-Modified") or (entry.last_modified if entry else None)
+        encoding = entry.encoding if entry is not None else resp.encoding
+        parser = _parser_name(parse)
+
+        parsed = None
+        if entry is not None:
+            parsed = cache.load_parsed(entry, parser)
+            if parsed is not None:
+                cache.stats["parses_skipped"] += 1
+        if parsed is None:
+            text = resp.text if content is not None else cache.load_body(entry)
+            if text is None:
+                # cached body vanished; fetch it again unconditionally and
+                # keep only the validators that came with the new body
+                resp = await self.request(method, url, headers=headers, json=json, **kwargs)
+                cache.stats["requests"] += 1
+                cache.stats["bytes_downloaded"] += len(resp.content)
+                content, content_hash = resp.content, cache.content_hash(resp.content)
+                etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+                encoding, text = resp.encoding, resp.text
+            parsed = await asyncio.to_thread(parse, text)
+
+        cache.store(key, content, content_hash, etag, last_modified, encoding, parsed, parser)
+        return parsed
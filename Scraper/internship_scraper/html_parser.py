@@ -0,0 +1,211 @@
+"""HTML parsing backends shared by the AICTE and IIRS scrapers.
+
+The scrapers only need a handful of operations (CSS select, child walk, text,
+attributes, removing tags), so they go through a small backend object instead
+of calling BeautifulSoup directly. Available backends, fastest first:
+
+    selectolax    selectolax's lexbor parser (optional dependency)
+    lxml          lxml.html with selectors precompiled to XPath (needs cssselect)
+    html.parser   BeautifulSoup with Python's built-in parser (always available)
+
+"auto" picks the fastest one installed. Set SCRAPER_HTML_PARSER to force one.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+from .config import HTML_PARSER
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional dependency
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+    from lxml import etree
+    from lxml.cssselect import CSSSelector
+except ImportError:  # optional dependency
+    CSSSelector = None
+
+# lxml refuses str input that carries an XML encoding declaration
+_XML_DECLARATION_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
+class Selector:
+    """A CSS selector compiled once per backend and reused for every document."""
+
+    def __init__(self, css: str) -> None:
+        self.css = css
+        self.compiled = soupsieve.compile(css)
+        self._xpath = None
+
+    @property
+    def xpath(self) -> Any:
+        if self._xpath is None:
+            self._xpath = CSSSelector(self.css)
+        return self._xpath
+
+
+class SoupBackend:
+    """BeautifulSoup with the given tree builder; selectors run precompiled."""
+
+    def __init__(self, builder: str = "html.parser") -> None:
+        self.name = builder
+        self.builder = builder
+
+    def parse(self, html: str) -> Any:
+        return BeautifulSoup(html, self.builder)
+
+    def select(self, node: Any, selector: Selector) -> List[Any]:
+        return selector.compiled.select(node)
+
+    def select_one(self, node: Any, selector: Selector) -> Optional[Any]:
+        return selector.compiled.select_one(node)
+
+    def children(self, node: Any) -> List[Any]:
+        return node.find_all(True, recursive=False)
+
+    def text(self, node: Any, separator: str = "") -> str:
+        return node.get_text(separator, strip=True)
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        value = node.get(name)
+        if isinstance(value, list):
+            return " ".join(value)
+        return value
+
+    def tag(self, node: Any) -> str:
+        return node.name
+
+    def classes(self, node: Any) -> List[str]:
+        return node.get("class") or []
+
+    def parent(self, node: Any) -> Optional[Any]:
+        return node.parent
+
+    def remove_tags(self, node: Any, tags: List[str]) -> None:
+        for tag in node.find_all(tags):
+            tag.decompose()
+
+
+class LxmlBackend:
+    """lxml.html tree; CSS selectors run as precompiled XPath."""
+
+    name = "lxml"
+
+    def parse(self, html: str) -> Any:
+        html = _XML_DECLARATION_RE.sub("", html, count=1)
+        root = lxml.html.document_fromstring(html or "<html></html>")
+        # bs4 leaves script/style contents out of get_text(); match that
+        etree.strip_elements(root, "script", "style", with_tail=False)
+        return root
+
+    def select(self, node: Any, selector: Selector) -> List[Any]:
+        return selector.xpath(node)
+
+    def select_one(self, node: Any, selector: Selector) -> Optional[Any]:
+        matches = selector.xpath(node)
+        return matches[0] if matches else None
+
+    def children(self, node: Any) -> List[Any]:
+        # skip comments and processing instructions
+        return [el for el in node if isinstance(el.tag, str)]
+
+    def text(self, node: Any, separator: str = "") -> str:
+        pieces = (piece.strip() for piece in node.itertext())
+        return separator.join(piece for piece in pieces if piece)
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.get(name)
+
+    def tag(self, node: Any) -> str:
+        return node.tag
+
+    def classes(self, node: Any) -> List[str]:
+        return (node.get("class") or "").split()
+
+    def parent(self, node: Any) -> Optional[Any]:
+        return node.getparent()
+
+    def remove_tags(self, node: Any, tags: List[str]) -> None:
+        for el in [el for el in node.iter(*tags) if el is not node]:
+            # drop_tree keeps the text that follows the element
+            el.drop_tree()
+
+
+class SelectolaxBackend:
+    """selectolax (lexbor) backend; the C parser is several times faster than bs4."""
+
+    name = "selectolax"
+
+    def parse(self, html: str) -> Any:
+        tree = LexborHTMLParser(html)
+        # bs4 leaves script/style contents out of get_text(); match that
+        tree.strip_tags(["script", "style"])
+        return tree
+
+    def select(self, node: Any, selector: Selector) -> List[Any]:
+        return node.css(selector.css)
+
+    def select_one(self, node: Any, selector: Selector) -> Optional[Any]:
+        return node.css_first(selector.css)
+
+    def children(self, node: Any) -> List[Any]:
+        return list(node.iter(include_text=False))
+
+    def text(self, node: Any, separator: str = "") -> str:
+        pieces = (piece.strip() for piece in node.text(deep=True, separator="\0").split("\0"))
+        return separator.join(piece for piece in pieces if piece)
+
+    def attr(self, node: Any, name: str) -> Optional[str]:
+        return node.attributes.get(name)
+
+    def tag(self, node: Any) -> str:
+        return node.tag
+
+    def classes(self, node: Any) -> List[str]:
+        return (node.attributes.get("class") or "").split()
+
+    def parent(self, node: Any) -> Optional[Any]:
+        return node.parent
+
+    def remove_tags(self, node: Any, tags: List[str]) -> None:
+        node.strip_tags(tags)
+
+
+def available_backends() -> List[str]:
+    names = []
+    if LexborHTMLParser is not None:
+        names.append("selectolax")
+    if CSSSelector is not None:
+        names.append("lxml")
+    names.append("html.parser")
+    return names
+
+
+_backends: Dict[str, Any] = {}
+
+
+def get_backend(name: Optional[str] = None) -> Any:
+    name = name or HTML_PARSER
+    if name == "auto":
+        name = available_backends()[0]
+    backend = _backends.get(name)
+    if backend is None:
+        if name == "selectolax":
+            if LexborHTMLParser is None:
+                raise RuntimeError("selectolax is not installed")
+            backend = SelectolaxBackend()
+        elif name == "lxml":
+            if CSSSelector is None:
+                raise RuntimeError("lxml and cssselect are not installed")
+            backend = LxmlBackend()
+        elif name == "html.parser":
+            backend = SoupBackend()
+        else:
+            raise ValueError(f"Unknown HTML parser backend: {name}")
+        _backends[name] = backend
+    return backend
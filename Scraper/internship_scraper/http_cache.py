@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+from collections import Counter
+from typing import Any, Dict, Optional
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class CacheEntry:
+    """Validators and content hash of the last response seen for a request."""
+
+    def __init__(self, key: str, meta: Dict[str, Any]) -> None:
+        self.key = key
+        self.etag: Optional[str] = meta.get("etag")
+        self.last_modified: Optional[str] = meta.get("last_modified")
+        self.content_hash: str = meta["content_hash"]
+        self.encoding: str = meta.get("encoding") or "utf-8"
+        self.parsed_by: Optional[str] = meta.get("parsed_by")
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """On-disk response cache for conditional GET/POST requests.
+
+    Entries are keyed by method, URL and request body. Each entry keeps three files:
+        <key>.json         ETag, Last-Modified, content hash and encoding
+        <key>.body         raw response bytes
+        <key>.parsed.json  records parsed from that body, so unchanged
+                           responses skip parsing entirely
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.stats: Counter = Counter()
+
+    @staticmethod
+    def make_key(method: str, url: str, body: Any = None) -> str:
+        raw = json.dumps([method.upper(), url, body], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        # an entry is only usable if its body was written too
+        if not os.path.exists(self._path(key, ".body")):
+            return None
+        try:
+            with open(self._path(key, ".json"), "r", encoding="utf-8") as f:
+                return CacheEntry(key, json.load(f))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def load_body(self, entry: CacheEntry) -> Optional[str]:
+        try:
+            with open(self._path(entry.key, ".body"), "rb") as f:
+                return f.read().decode(entry.encoding, errors="replace")
+        except OSError:
+            return None
+
+    def load_parsed(self, entry: CacheEntry, parser: str) -> Any:
+        if entry.parsed_by != parser:
+            return None
+        try:
+            with open(self._path(entry.key, ".parsed.json"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(
+        self,
+        key: str,
+        content: Optional[bytes],
+        content_hash: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        encoding: Optional[str],
+        parsed: Any,
+        parser: str,
+    ) -> None:
+        # content is None when the cached body is still current (304 / same bytes)
+        if content is not None:
+            _atomic_write(self._path(key, ".body"), content)
+        _atomic_write(
+            self._path(key, ".parsed.json"),
+            json.dumps(parsed, ensure_ascii=False).encode("utf-8"),
+        )
+        meta = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_hash": content_hash,
+            "encoding": encoding,
+            "parsed_by": parser,
+        }
+        _atomic_write(self._path(key, ".json"), json.dumps(meta).encode("utf-8"))
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"{s['requests']} requests, {s['not_modified']} not modified (304), "
+            f"{s['unchanged']} unchanged, {s['changed']} new/changed, "
+            f"{s['parses_skipped']} parses skipped, {s['bytes_downloaded']} bytes downloaded"
+        )
@@ -1,11 +1,11 @@
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
 import re
 from datetime import datetime
-import urllib3
 
+from .fetcher import Fetcher
+from .html_parser import Selector, get_backend
 from .models import base_record
 
 BASE_URL = "https://www.iirs.gov.in"
@@ -22,52 +22,61 @@ HEADERS = {
     "Connection": "keep-alive",
 }
 
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# the IIRS site's certificate chain does not verify, so TLS checks are off
+VERIFY_TLS = False
 
-_session = requests.Session()
-_session.headers.update(HEADERS)
-_session.verify = False
 
-
-def fetch_iirs_internships() -> List[Dict[str, str]]:
+async def fetch_iirs_internships(fetcher: Fetcher) -> List[Dict[str, str]]:
     results: List[Dict[str, str]] = []
 
     try:
-        resp = _session.get(START_URL, timeout=25)
-        resp.raise_for_status()
+        # the parsed main page (record + detail links) comes from the HTTP cache when unchanged
+        main_record, links = await fetcher.fetch_parsed(
+            "GET", START_URL, _parse_start_page, headers=HEADERS, timeout=25, verify=VERIFY_TLS
+        )
     except Exception as e:  
         print(f"[WARN] Error accessing {START_URL}: {e}")
         return results
 
-    _parse_main_page(resp.text, START_URL, results)
+    results.append(main_record)
+
+    # detail pages are fetched concurrently; gather keeps the page order
+    details = await asyncio.gather(*(_fetch_detail(fetcher, url, text) for url, text in links))
+    results.extend(detail for detail in details if detail)
 
     results = _deduplicate_results(results)
     return results
 
 
+def _parse_start_page(html: str) -> Tuple[Dict[str, str], List[Tuple[str, str]]]:
+    return _parse_main_page(html, START_URL)
 
 
-def _parse_main_page(html: str, page_url: str, results: List[Dict[str, str]]) -> None:
-    soup = BeautifulSoup(html, "html.parser")
+def _parse_main_page(html: str, page_url: str) -> Tuple[Dict[str, str], List[Tuple[str, str]]]:
+    # returns the main page record and the (url, title) detail links to follow
+    backend = get_backend()
+    root = backend.parse(html)
 
-    content = _extract_main_content(soup)
+    content = _extract_main_content(backend, root)
     title = "IIRS External Student Internship / Project / Dissertation"
 
     data = _parse_details_to_record(content, title, page_url)
-    results.append(data)
 
+    links: List[Tuple[str, str]] = []
+    seen = set()
     keywords = ["intern", "project", "dissertation", "training"]
-    for a in soup.find_all("a", href=True):
-        text = a.get_text(strip=True)
+    for a in backend.select(root, _LINKS):
+        text = backend.text(a)
         if not text:
             continue
         if any(kw in text.lower() for kw in keywords):
-            href = a["href"]
+            href = backend.attr(a, "href")
             full_url = _build_full_url(href)
-            if full_url != page_url:
-                detail = _fetch_detail(full_url, text)
-                if detail:
-                    results.append(detail)
+            # repeated links are deduplicated afterwards anyway; skip the refetch
+            if full_url != page_url and full_url not in seen:
+                seen.add(full_url)
+                links.append((full_url, text))
+    return data, links
 
 
 def _build_full_url(href: str) -> str:
@@ -79,32 +88,44 @@ def _build_full_url(href: str) -> str:
         return f"{BASE_URL}/{href}"
 
 
-def _fetch_detail(url: str, title: str) -> Optional[Dict[str, str]]:
+async def _fetch_detail(fetcher: Fetcher, url: str, title: str) -> Optional[Dict[str, str]]:
     try:
-        resp = _session.get(url, timeout=25)
-        resp.raise_for_status()
+        content = await fetcher.fetch_parsed(
+            "GET", url, _detail_page_content, headers=HEADERS, timeout=25, verify=VERIFY_TLS
+        )
     except Exception as e: 
         print(f"[WARN] Error fetching {url}: {e}")
         return None
-    soup = BeautifulSoup(resp.text, "html.parser")
-    content = _extract_main_content(soup)
     return _parse_details_to_record(content, title, url)
 
 
-def _extract_main_content(soup: BeautifulSoup) -> str:
-    selectors = ["main", "article", ".content", ".main-content", "#content", ".page-content", ".container"]
+def _detail_page_content(html: str, parser: Optional[str] = None) -> str:
+    backend = get_backend(parser)
+    return _extract_main_content(backend, backend.parse(html))
+
+
+# candidate containers for the page body, most specific first
+_MAIN_SELECTORS = [
+    Selector(css)
+    for css in ["main", "article", ".content", ".main-content", "#content", ".page-content", ".container"]
+]
+_BODY = Selector("body")
+_CHROME_TAGS = ["nav", "footer", "aside", "header"]
+_LINKS = Selector("a[href]")
+
+
+def _extract_main_content(backend: Any, root: Any) -> str:
     main = None
-    for s in selectors:
-        main = soup.select_one(s)
-        if main:
+    for selector in _MAIN_SELECTORS:
+        main = backend.select_one(root, selector)
+        if main is not None:
             break
-    if not main:
-        main = soup.find("body")
-    if main:
-        for tag in main.find_all(["nav", "footer", "aside", "header"]):
-            tag.decompose()
-        return main.get_text(" ", strip=True)
-    return soup.get_text(" ", strip=True)
+    if main is None:
+        main = backend.select_one(root, _BODY)
+    if main is not None:
+        backend.remove_tags(main, _CHROME_TAGS)
+        return backend.text(main, " ")
+    return backend.text(root, " ")
 
 
 def _parse_details_to_record(text: str, title: str, url: str) -> Dict[str, str]:
@@ -0,0 +1,82 @@
+import gzip
+import json
+import os
+from contextlib import nullcontext
+from typing import Any, Dict, IO, Optional, Set
+
+from .aggregator import stream_internships
+from .catalogue import CatalogueWriter
+from .config import RECORD_STORE_PATH
+from .record_store import RecordStore
+
+
+def open_text(path: str, mode: str = "r", compress: Optional[bool] = None) -> IO[str]:
+    # .gz paths are transparently (de)compressed unless told otherwise
+    if compress is None:
+        compress = path.endswith(".gz")
+    if compress:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _write_line(f: IO[str], obj: Any) -> None:
+    f.write(json.dumps(obj, ensure_ascii=False))
+    f.write("\n")
+
+
+async def scrape_to_ndjson(
+    out_path: str,
+    delta_path: Optional[str] = None,
+    store_path: str = RECORD_STORE_PATH,
+    catalogue_path: Optional[str] = None,
+) -> Dict[str, int]:
+    """Scrape all sources, writing one JSON record per line as batches arrive.
+
+    Records are never collected into one list: each batch gets its stable
+    job_ids and is written out before the next one is awaited. The delta is
+    written the same way, one {"op": "added"|"changed"|"removed", "record": ...}
+    per line. With catalogue_path, each batch is also appended to the columnar
+    catalogue. Files are written under a temporary name and renamed at the end,
+    so readers never see a half-written file, and removed if the scrape fails.
+
+    Returns:
+        Counts of records written and of added/changed/removed/unchanged records
+    """
+    store = RecordStore(store_path)
+    store.begin()
+    counts = {"records": 0, "added": 0, "changed": 0, "removed": 0, "unchanged": 0}
+    complete_sources: Set[str] = set()
+
+    tmp_out = out_path + ".tmp"
+    tmp_delta = delta_path + ".tmp" if delta_path else None
+    try:
+        with open_text(tmp_out, "w", out_path.endswith(".gz")) as out, \
+                (open_text(tmp_delta, "w", delta_path.endswith(".gz")) if delta_path else open(os.devnull, "w")) as delta, \
+                (CatalogueWriter(catalogue_path) if catalogue_path else nullcontext()) as catalogue:
+            async for _, batch in stream_internships(complete_sources):
+                for rec in batch:
+                    status = store.assign(rec)
+                    counts[status] += 1
+                    counts["records"] += 1
+                    _write_line(out, rec)
+                    if status != "unchanged":
+                        _write_line(delta, {"op": status, "record": rec})
+                if catalogue is not None:
+                    catalogue.write(batch)
+
+            # a source that failed, came back partial or empty keeps its previous listings
+            for rec in store.finish(complete_sources):
+                counts["removed"] += 1
+                _write_line(delta, {"op": "removed", "record": rec})
+    except BaseException:
+        # a source raised (or the run was cancelled): leave no partial files behind
+        for path in (tmp_out, tmp_delta):
+            if path and os.path.exists(path):
+                os.remove(path)
+        raise
+
+    os.replace(tmp_out, out_path)
+    if delta_path:
+        os.replace(tmp_delta, delta_path)
+    store.save()
+    return counts
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Set
+
+# 48-bit IDs stay exact in JSON numbers, JavaScript and pandas float columns
+ID_HEX_DIGITS = 12
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(value: str) -> str:
+    return _SPACE_RE.sub(" ", (value or "").strip().lower())
+
+
+def record_key(rec: Dict[str, str]) -> str:
+    # identity of a listing across runs: its link if it has one, else what it is and who offers it
+    source = _normalize(rec.get("source", ""))
+    link = (rec.get("job_link") or "").strip()
+    if link:
+        return f"{source}|{link}"
+    return "|".join([
+        source,
+        _normalize(rec.get("job_title", "")),
+        _normalize(rec.get("company_name", "")),
+        _normalize(rec.get("duration", "")),
+    ])
+
+
+def stable_job_id(key: str) -> int:
+    return int(hashlib.sha1(key.encode("utf-8")).hexdigest()[:ID_HEX_DIGITS], 16)
+
+
+def content_hash(rec: Dict[str, str]) -> str:
+    body = {k: v for k, v in rec.items() if k != "job_id"}
+    return hashlib.sha1(json.dumps(body, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class RecordStore:
+    """Records from previous runs, persisted as JSON, used to assign stable
+    job_ids and to work out what changed since the last run.
+
+    File layout: {"updated_at": ..., "records": {key: {"job_id", "hash", "record"}}}
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f).get("records", {})
+        self._ids = {entry["job_id"]: key for key, entry in self.entries.items()}
+
+    def _assign_id(self, key: str) -> int:
+        entry = self.entries.get(key)
+        if entry is not None:
+            return entry["job_id"]
+        job_id = stable_job_id(key)
+        # hash collision with a different listing: probe to the next free ID
+        while job_id in self._ids and self._ids[job_id] != key:
+            job_id += 1
+        return job_id
+
+    def begin(self) -> None:
+        """Start a run; records are then fed one by one through assign()."""
+        self._occurrences: Counter = Counter()
+        self._seen: Set[str] = set()
+
+    def assign(self, rec: Dict[str, str]) -> str:
+        """Give rec its stable job_id (in place) and classify it.
+
+        Returns:
+            "added", "changed" or "unchanged" compared with the previous run
+        """
+        key = record_key(rec)
+        self._occurrences[key] += 1
+        # identical listings within one run are told apart by their position
+        if self._occurrences[key] > 1:
+            key = f"{key}#{self._occurrences[key]}"
+        self._seen.add(key)
+
+        job_id = self._assign_id(key)
+        rec["job_id"] = job_id
+        digest = content_hash(rec)
+
+        previous = self.entries.get(key)
+        if previous is None:
+            status = "added"
+        elif previous["hash"] != digest:
+            status = "changed"
+        else:
+            status = "unchanged"
+
+        self.entries[key] = {"job_id": job_id, "hash": digest, "record": rec}
+        self._ids[job_id] = key
+        return status
+
+    def finish(self, complete_sources: Iterable[str]) -> List[Dict[str, str]]:
+        """End a run and return the records that disappeared since the last one.
+
+        Records from previous runs are only reported as removed when their source
+        was fetched in full this run, so a failing source does not wipe its
+        listings downstream.
+        """
+        complete = set(complete_sources)
+        removed = []
+        for key in list(self.entries):
+            if key in self._seen:
+                continue
+            entry = self.entries[key]
+            if entry["record"].get("source") in complete:
+                removed.append(entry["record"])
+                del self.entries[key]
+                del self._ids[entry["job_id"]]
+        return removed
+
+    def apply(self, records: List[Dict[str, str]], complete_sources: Iterable[str]) -> Dict[str, Any]:
+        """Assign stable job_ids to a whole run of records (in place).
+
+        Returns:
+            The delta: added and changed records, removed records and the
+            number of unchanged records
+        """
+        delta: Dict[str, Any] = {"added": [], "changed": [], "removed": [], "unchanged": 0}
+        self.begin()
+        for rec in records:
+            status = self.assign(rec)
+            if status == "unchanged":
+                delta["unchanged"] += 1
+            else:
+                delta[status].append(rec)
+        delta["removed"] = self.finish(complete_sources)
+        return delta
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"updated_at": datetime.now().isoformat(), "records": self.entries},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, self.path)
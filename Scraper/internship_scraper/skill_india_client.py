@@ -1,29 +1,176 @@
-from typing import List, Dict, Any
+import asyncio
+import json
+import math
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional
+
+from .config import (
+    HEADERS,
+    SKILL_INDIA_MAX_PARALLEL_PAGES,
+    SKILL_INDIA_PAGE_RETRIES,
+    SKILL_INDIA_PAGE_SIZE,
+    SKILL_INDIA_URL,
+)
+from .fetcher import Fetcher
+from .models import base_record
 
-import requests
+# keys the API has been seen to use for the total number of programs
+_TOTAL_KEYS = ("TotalCount", "TotalRecords", "TotalRecord", "Total", "Count")
 
-from .config import SKILL_INDIA_URL, HEADERS
-from .models import base_record
 
+class IncompleteSourceError(Exception):
+    """Some pages could not be fetched; records holds everything that was."""
 
-def fetch_skill_india_programs(page_number: int = 1, page_size: int = 10000) -> Dict[str, Any]:
-    payload = {
-        "PageNumber": page_number,
-        "PageSize": page_size,
-    }
+    def __init__(self, message: str, records: List[Dict[str, str]]) -> None:
+        super().__init__(message)
+        self.records = records
 
+
+def _request_headers() -> Dict[str, str]:
     headers = HEADERS.copy()
     headers["Content-Type"] = "application/json"
     headers["Accept"] = "application/json"
+    return headers
 
-    resp = requests.post(SKILL_INDIA_URL, headers=headers, json=payload, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
 
+def _payload(page_number: int, page_size: int) -> Dict[str, int]:
+    return {
+        "PageNumber": page_number,
+        "PageSize": page_size,
+    }
 
-def parse_skill_india_programs(api_json: Dict[str, Any]) -> List[Dict[str, str]]:
-    results: List[Dict[str, str]] = []
 
+async def fetch_skill_india_programs(
+    fetcher: Fetcher, page_number: int = 1, page_size: int = SKILL_INDIA_PAGE_SIZE
+) -> Dict[str, Any]:
+    return await fetcher.post_json(
+        SKILL_INDIA_URL, _payload(page_number, page_size), headers=_request_headers(), timeout=30
+    )
+
+
+def _total_count(api_json: Dict[str, Any]) -> Optional[int]:
+    for container in (api_json.get("Data") or {}, api_json):
+        if not isinstance(container, dict):
+            continue
+        for key in _TOTAL_KEYS:
+            value = container.get(key)
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+    return None
+
+
+def _parse_page_text(text: str) -> Dict[str, Any]:
+    api_json = json.loads(text)
+    return {
+        "total": _total_count(api_json),
+        "records": list(parse_skill_india_programs(api_json)),
+    }
+
+
+async def _fetch_page(fetcher: Fetcher, page_number: int, page_size: int) -> Optional[Dict[str, Any]]:
+    # the fetcher already retries transport errors; this also covers truncated or invalid JSON
+    payload = _payload(page_number, page_size)
+    for attempt in range(SKILL_INDIA_PAGE_RETRIES + 1):
+        try:
+            return await fetcher.fetch_parsed(
+                "POST", SKILL_INDIA_URL, _parse_page_text,
+                headers=_request_headers(), json=payload, timeout=30,
+            )
+        except Exception as e:
+            print(f"[WARN] Skill India page {page_number} attempt {attempt + 1} failed: {e}")
+            if attempt < SKILL_INDIA_PAGE_RETRIES:
+                await asyncio.sleep(fetcher.backoff(attempt))
+
+    # resume from the page fetched by an earlier run rather than losing it
+    cached = fetcher.cached_parsed("POST", SKILL_INDIA_URL, _parse_page_text, json=payload)
+    if cached is not None:
+        print(f"[WARN] Skill India page {page_number}: using records from the previous run")
+    return cached
+
+
+async def iter_skill_india_pages(
+    fetcher: Fetcher,
+    page_size: int = SKILL_INDIA_PAGE_SIZE,
+    max_parallel: int = SKILL_INDIA_MAX_PARALLEL_PAGES,
+    failed_pages: Optional[List[int]] = None,
+) -> AsyncIterator[List[Dict[str, str]]]:
+    """Yield the catalogue page by page, in page order.
+
+    Page 1 tells how many programs exist; the remaining pages are fetched
+    with at most max_parallel requests in flight, so only that many pages are
+    held in memory at once. When the API reports no total, pages are fetched
+    until one comes back short, or until max_parallel pages in a row fail
+    (a server that errors past the last page would otherwise be asked
+    forever). Pages that still fail after retries are appended to
+    failed_pages and skipped.
+    """
+    failed = failed_pages if failed_pages is not None else []
+
+    first = await _fetch_page(fetcher, 1, page_size)
+    if first is None:
+        raise RuntimeError("Skill India: first page could not be fetched")
+    yield first["records"]
+
+    total = first["total"]
+    last_page = math.ceil(total / page_size) if total is not None else None
+    if len(first["records"]) < page_size and last_page is None:
+        return
+
+    window: Deque = deque()
+    next_page = 2
+    exhausted = False
+    consecutive_failures = 0
+
+    def schedule() -> None:
+        nonlocal next_page
+        while len(window) < max_parallel and not exhausted and (last_page is None or next_page <= last_page):
+            window.append((next_page, asyncio.create_task(_fetch_page(fetcher, next_page, page_size))))
+            next_page += 1
+
+    schedule()
+    try:
+        while window:
+            page_number, task = window.popleft()
+            page = await task
+            if page is None:
+                failed.append(page_number)
+                consecutive_failures += 1
+                if last_page is None and consecutive_failures >= max_parallel:
+                    # no total to stop at: take a run of failures as the end
+                    exhausted = True
+                    for _, pending in window:
+                        pending.cancel()
+                    window.clear()
+            else:
+                consecutive_failures = 0
+                if last_page is None and len(page["records"]) < page_size:
+                    # short page: this is the end; drop pages scheduled past it
+                    exhausted = True
+                    for _, pending in window:
+                        pending.cancel()
+                    window.clear()
+                if page["records"]:
+                    yield page["records"]
+            schedule()
+    finally:
+        for _, pending in window:
+            pending.cancel()
+
+
+async def fetch_skill_india_internships(
+    fetcher: Fetcher, page_size: int = SKILL_INDIA_PAGE_SIZE
+) -> List[Dict[str, str]]:
+    records: List[Dict[str, str]] = []
+    failed_pages: List[int] = []
+    async for page in iter_skill_india_pages(fetcher, page_size, failed_pages=failed_pages):
+        records.extend(page)
+    if failed_pages:
+        raise IncompleteSourceError(f"Skill India pages {failed_pages} could not be fetched", records)
+    return records
+
+
+def parse_skill_india_programs(api_json: Dict[str, Any]) -> Iterator[Dict[str, str]]:
+    # yields records one at a time so callers can stream a page without building a list
     data = api_json.get("Data") or {}
     programs = data.get("UserProgramDetailsDTOS") or []
 
@@ -77,6 +224,4 @@ def parse_skill_india_programs(api_json: Dict[str, Any]) -> List[Dict[str, str]]
         else:
             rec["credits_available"] = ""
 
-        results.append(rec)
-
-    return results
+        yield rec
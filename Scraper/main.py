@@ -1,15 +1,61 @@
+import argparse
+import asyncio
 import json
+from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-from internship_scraper.aggregator import aggregate_internships
+from internship_scraper.aggregator import aggregate_internships_with_delta
+from internship_scraper.catalogue import write_catalogue
+from internship_scraper.output import scrape_to_ndjson
 
 
-def main() -> None:
-    records = aggregate_internships()
+def write_json(catalogue_path: Optional[str] = None) -> None:
+    records, delta = aggregate_internships_with_delta()
     out_path = Path("jobs.json")
     out_path.write_text(json.dumps(records, indent=2, ensure_ascii=False), encoding="utf-8")
     print(f"✔ jobs.json generated with {len(records)} records (each with job_id).")
 
+    # what changed since the previous run, for consumers that update incrementally
+    delta_path = Path("jobs_delta.json")
+    delta = {"generated_at": datetime.now().isoformat(), **delta}
+    delta_path.write_text(json.dumps(delta, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"✔ jobs_delta.json generated ({len(delta['added'])} added, "
+          f"{len(delta['changed'])} changed, {len(delta['removed'])} removed).")
+
+    if catalogue_path:
+        rows = write_catalogue(records, catalogue_path)
+        print(f"✔ {catalogue_path} generated with {rows} rows.")
+
+
+def write_ndjson(out_path: str, delta_path: str, catalogue_path: Optional[str] = None) -> None:
+    counts = asyncio.run(scrape_to_ndjson(out_path, delta_path, catalogue_path=catalogue_path))
+    print(f"✔ {out_path} generated with {counts['records']} records (each with job_id).")
+    print(f"✔ {delta_path} generated ({counts['added']} added, "
+          f"{counts['changed']} changed, {counts['removed']} removed).")
+    if catalogue_path:
+        print(f"✔ {catalogue_path} generated with {counts['records']} rows.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scrape internships from all sources.")
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json",
+                        help="json: one jobs.json array; ndjson: one record per line, written as sources arrive")
+    parser.add_argument("--gzip", action="store_true", help="gzip the ndjson output")
+    parser.add_argument("--output", help="ndjson output path (default jobs.ndjson[.gz])")
+    parser.add_argument("--delta-output", help="ndjson delta path (default jobs_delta.ndjson[.gz])")
+    parser.add_argument("--catalogue", nargs="?", const="jobs.arrow",
+                        help="also write a columnar catalogue with derived columns (needs pyarrow): "
+                             "Arrow IPC by default (jobs.arrow), Parquet for a .parquet path")
+    args = parser.parse_args()
+
+    if args.format == "json":
+        write_json(args.catalogue)
+        return
+
+    suffix = ".ndjson.gz" if args.gzip else ".ndjson"
+    write_ndjson(args.output or f"jobs{suffix}", args.delta_output or f"jobs_delta{suffix}", args.catalogue)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,8 @@
+"""Record builders shared by the tests."""
+from internship_scraper.models import base_record
+
+
+def record(title, source="test", link="", **fields):
+    rec = base_record()
+    rec.update(job_title=title, company_name="Acme", source=source, job_link=link, **fields)
+    return rec
@@ -0,0 +1,50 @@
+import asyncio
+import os
+
+import httpx
+
+from internship_scraper.fetcher import Fetcher
+from internship_scraper.http_cache import HttpCache
+
+URL = "https://example.com/jobs"
+
+
+def parse_lines(text):
+    return text.splitlines()
+
+
+def fetcher_with(cache, handler):
+    fetcher = Fetcher(cache=cache, max_retries=0)
+    fetcher._clients[True] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return fetcher
+
+
+def test_refetch_after_vanished_body_stores_new_validators(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    responses = iter([
+        httpx.Response(200, content=b"a\nb", headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}),
+        # the conditional request says "not modified" without repeating validators
+        httpx.Response(304),
+        httpx.Response(200, content=b"a\nb\nc", headers={"ETag": '"v2"'}),
+    ])
+
+    async def run():
+        async with fetcher_with(cache, lambda request: next(responses)) as fetcher:
+            assert await fetcher.fetch_parsed("GET", URL, parse_lines) == ["a", "b"]
+            key = cache.make_key("GET", URL)
+            # no parsed records, and the body disappears after the entry is loaded
+            os.remove(os.path.join(str(tmp_path), key + ".parsed.json"))
+            load_body = cache.load_body
+            cache.load_body = lambda entry: None
+            parsed = await fetcher.fetch_parsed("GET", URL, parse_lines)
+            cache.load_body = load_body
+            return key, parsed
+
+    key, parsed = asyncio.run(run())
+    assert parsed == ["a", "b", "c"]
+    entry = cache.load(key)
+    assert entry.etag == '"v2"'
+    assert entry.last_modified is None
+    assert entry.content_hash == cache.content_hash(b"a\nb\nc")
+    assert cache.load_body(entry) == "a\nb\nc"
+    assert cache.stats["requests"] == 3
@@ -0,0 +1,107 @@
+from pathlib import Path
+from urllib.parse import urljoin
+
+import pytest
+from bs4 import BeautifulSoup
+
+from internship_scraper import html_parser, iirs_scraper
+from internship_scraper.aicte_scraper import parse_aicte_internships
+from internship_scraper.config import AICTE_DETAIL_BASE
+from internship_scraper.html_parser import available_backends
+from internship_scraper.models import base_record
+
+FIXTURES = Path(__file__).parent / "fixtures"
+AICTE_HTML = (FIXTURES / "aicte_cards.html").read_text(encoding="utf-8")
+IIRS_HTML = (FIXTURES / "iirs_page.html").read_text(encoding="utf-8")
+
+backends = pytest.mark.parametrize("backend", available_backends())
+
+
+def select_one_reference(html):
+    """The original BeautifulSoup select_one parser the single-pass walk replaced."""
+    soup = BeautifulSoup(html, "html.parser")
+    results = []
+    for card in soup.select("div.internships-list div.card.internship-item"):
+        rec = base_record()
+        rec["source"] = "AICTE Internship"
+
+        def text(root, css, field):
+            el = root.select_one(css) if root else None
+            if el:
+                rec[field] = el.get_text(strip=True)
+
+        primary = card.select_one(".internship-primary-info")
+        text(primary, "h3.job-title", "job_title")
+        text(primary, "h5.company-name", "company_name")
+        attr = primary.select_one("ul.job-attributes") if primary else None
+        text(attr, "li.wfh span", "wfh")
+        text(attr, "li.posted-on span", "posted_on")
+        text(attr, "li.location span", "location")
+
+        supp = card.select_one("ul.job-supplement-attributes")
+        text(supp, "li.start-date span", "start_date")
+        text(supp, "li.duration span", "duration")
+        text(supp, "li.apply-by span", "apply_by")
+
+        link = card.select_one(".btn-wrap a.btn.btn-primary")
+        if link and link.has_attr("href"):
+            rec["job_link"] = urljoin(AICTE_DETAIL_BASE, link["href"])
+        results.append(rec)
+    return results
+
+
+def test_html_parser_matches_select_one_reference():
+    records = parse_aicte_internships(AICTE_HTML, parser="html.parser")
+
+    assert records == select_one_reference(AICTE_HTML)
+    # the cards outside div.internships-list are not picked up
+    assert len(records) == 4
+
+    full, no_primary, nested_supplement, empty = records
+    # nested spans are flattened, only the first span of an item counts
+    assert full["job_title"] == "DataScienceIntern"
+    assert full["wfh"] == "Yes(remote)"
+    assert full["posted_on"] == "2 days ago"
+    assert full["duration"] == "3Months"
+    # the first primary button wins
+    assert full["job_link"] == "https://internship.aicte-india.org/internship-details/1001"
+
+    # headings and job attributes only count inside the primary block
+    assert no_primary["job_title"] == ""
+    assert no_primary["wfh"] == ""
+    assert no_primary["location"] == ""
+    assert no_primary["duration"] == "6 Weeks"
+    assert no_primary["job_link"] == ""
+
+    # a supplement list inside the primary block still counts
+    assert nested_supplement["start_date"] == "1 Dec' 25"
+    assert nested_supplement["apply_by"] == "25 Nov' 25"
+    assert nested_supplement["location"] == "Mumbai"
+
+    assert empty == {**base_record(), "source": "AICTE Internship"}
+
+
+@backends
+def test_aicte_backends_match_html_parser(backend):
+    expected = parse_aicte_internships(AICTE_HTML, parser="html.parser")
+
+    assert parse_aicte_internships(AICTE_HTML, parser=backend) == expected
+
+
+@backends
+def test_iirs_detail_content_backends_match_html_parser(backend):
+    expected = iirs_scraper._detail_page_content(IIRS_HTML, parser="html.parser")
+
+    assert iirs_scraper._detail_page_content(IIRS_HTML, parser=backend) == expected
+    # header, nav and script text are dropped
+    assert "Home" not in expected
+    assert "var x" not in expected
+
+
+@backends
+def test_iirs_main_page_backends_match_html_parser(backend, monkeypatch):
+    monkeypatch.setattr(html_parser, "HTML_PARSER", "html.parser")
+    expected = iirs_scraper._parse_main_page(IIRS_HTML, iirs_scraper.START_URL)
+
+    monkeypatch.setattr(html_parser, "HTML_PARSER", backend)
+    assert iirs_scraper._parse_main_page(IIRS_HTML, iirs_scraper.START_URL) == expected
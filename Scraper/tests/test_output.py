@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+import pytest
+
+from internship_scraper import output
+from factories import record
+
+
+def fake_stream(batches, error=None):
+    async def stream_internships(complete_sources):
+        for source, batch in batches:
+            complete_sources.add(source)
+            yield source, batch
+        if error is not None:
+            raise error
+    return stream_internships
+
+
+def test_failed_scrape_leaves_no_temp_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        output, "stream_internships",
+        fake_stream([("test", [record("Intern")])], RuntimeError("source broke")),
+    )
+    out_path = str(tmp_path / "jobs.ndjson.gz")
+    delta_path = str(tmp_path / "jobs.delta.ndjson")
+    store_path = str(tmp_path / "records.json")
+    catalogue_path = str(tmp_path / "jobs.arrow")
+
+    with pytest.raises(RuntimeError, match="source broke"):
+        asyncio.run(output.scrape_to_ndjson(out_path, delta_path, store_path, catalogue_path))
+
+    # no output, delta or catalogue (final or .tmp), and the record store is not saved
+    assert list(tmp_path.iterdir()) == []
+
+
+def read_ndjson(path):
+    with output.open_text(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_second_run_writes_ids_and_delta(tmp_path, monkeypatch):
+    out_path = str(tmp_path / "jobs.ndjson.gz")
+    delta_path = str(tmp_path / "jobs.delta.ndjson")
+    store_path = str(tmp_path / "records.json")
+
+    def run(batches):
+        monkeypatch.setattr(output, "stream_internships", fake_stream(batches))
+        return asyncio.run(output.scrape_to_ndjson(out_path, delta_path, store_path))
+
+    run([("test", [record("Kept"), record("Edited"), record("Gone")])])
+    first = {rec["job_title"]: rec["job_id"] for rec in read_ndjson(out_path)}
+
+    edited = record("Edited")
+    edited["stipend"] = "5000"
+    counts = run([("test", [edited, record("New"), record("Kept")])])
+
+    jobs = read_ndjson(out_path)
+    delta = read_ndjson(delta_path)
+    assert counts == {"records": 3, "added": 1, "changed": 1, "removed": 1, "unchanged": 1}
+    assert [rec["job_title"] for rec in jobs] == ["Edited", "New", "Kept"]
+    assert jobs[0]["job_id"] == first["Edited"]
+    assert jobs[2]["job_id"] == first["Kept"]
+    assert [(line["op"], line["record"]["job_title"]) for line in delta] == [
+        ("changed", "Edited"),
+        ("added", "New"),
+        ("removed", "Gone"),
+    ]
+    assert delta[2]["record"]["job_id"] == first["Gone"]
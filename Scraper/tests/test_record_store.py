@@ -0,0 +1,59 @@
+from internship_scraper import record_store
+from internship_scraper.record_store import RecordStore, record_key
+from factories import record
+
+
+def test_job_ids_are_stable_across_runs_and_reloads(tmp_path):
+    path = str(tmp_path / "records.json")
+    store = RecordStore(path)
+    first = [record("Data Intern", link="https://x/1"), record("Web Intern")]
+    store.apply(first, {"test"})
+    store.save()
+
+    # a new process, the same listings in another order, one of them edited
+    second = [record("Web Intern"), record("Data Intern (paid)", link="https://x/1")]
+    delta = RecordStore(path).apply(second, {"test"})
+
+    assert second[1]["job_id"] == first[0]["job_id"]  # same link
+    assert second[0]["job_id"] == first[1]["job_id"]  # same title/company/duration
+    assert first[0]["job_id"] != first[1]["job_id"]
+    assert [rec["job_title"] for rec in delta["changed"]] == ["Data Intern (paid)"]
+    assert delta["added"] == [] and delta["removed"] == []
+    assert delta["unchanged"] == 1
+
+
+def test_key_ignores_case_and_spacing_without_a_link():
+    assert record_key(record("Data  Intern ")) == record_key(record("data intern"))
+    assert record_key(record("Data Intern", source="b")) != record_key(record("Data Intern"))
+
+
+def test_identical_listings_in_one_run_get_their_own_ids(tmp_path):
+    store = RecordStore(str(tmp_path / "records.json"))
+    first = [record("Intern"), record("Intern")]
+    store.apply(first, {"test"})
+    second = [record("Intern"), record("Intern")]
+    delta = store.apply(second, {"test"})
+
+    assert first[0]["job_id"] != first[1]["job_id"]
+    assert [rec["job_id"] for rec in second] == [rec["job_id"] for rec in first]
+    assert delta["unchanged"] == 2
+
+
+def test_hash_collisions_probe_to_a_free_id(tmp_path, monkeypatch):
+    monkeypatch.setattr(record_store, "stable_job_id", lambda key: 7)
+    store = RecordStore(str(tmp_path / "records.json"))
+    records = [record("One"), record("Two"), record("Three")]
+    store.apply(records, {"test"})
+    assert [rec["job_id"] for rec in records] == [7, 8, 9]
+
+
+def test_removed_only_when_the_source_was_fetched_in_full(tmp_path):
+    store = RecordStore(str(tmp_path / "records.json"))
+    store.apply([record("Kept", source="test"), record("Gone", source="b")], {"test", "b"})
+
+    # source b failed this run: its listing is kept
+    delta = store.apply([record("Kept", source="test")], {"test"})
+    assert delta["removed"] == []
+
+    delta = store.apply([record("Kept", source="test")], {"test", "b"})
+    assert [rec["job_title"] for rec in delta["removed"]] == ["Gone"]
@@ -0,0 +1,85 @@
+import asyncio
+from json import dumps
+
+import pytest
+
+from internship_scraper import skill_india_client
+from internship_scraper.skill_india_client import iter_skill_india_pages
+
+PAGE_SIZE = 2
+
+
+class FakeFetcher:
+    """Serves `pages` full pages of programs and fails every page after them."""
+
+    def __init__(self, pages: int, total=None, short_last: bool = False):
+        self.pages = pages
+        self.total = total
+        self.short_last = short_last
+        self.requested = []
+
+    def backoff(self, attempt: int) -> float:
+        return 0
+
+    def cached_parsed(self, method, url, parse, *, json=None):
+        return None
+
+    async def fetch_parsed(self, method, url, parse, *, headers=None, json=None, **kwargs):
+        page_number = json["PageNumber"]
+        self.requested.append(page_number)
+        if page_number > self.pages:
+            raise RuntimeError(f"HTTP 500 for page {page_number}")
+        size = 1 if self.short_last and page_number == self.pages else PAGE_SIZE
+        data = {
+            "UserProgramDetailsDTOS": [
+                {"Name": f"Program {page_number}.{i}"} for i in range(size)
+            ]
+        }
+        if self.total is not None:
+            data["TotalCount"] = self.total
+        return parse(dumps({"Data": data}))
+
+
+def collect(fetcher, max_parallel=3):
+    failed = []
+
+    async def run():
+        titles = []
+        async for page in iter_skill_india_pages(
+            fetcher, page_size=PAGE_SIZE, max_parallel=max_parallel, failed_pages=failed
+        ):
+            titles.extend(record["job_title"] for record in page)
+        return titles
+
+    return asyncio.run(asyncio.wait_for(run(), timeout=5)), failed
+
+
+@pytest.fixture(autouse=True)
+def no_retries(monkeypatch):
+    monkeypatch.setattr(skill_india_client, "SKILL_INDIA_PAGE_RETRIES", 0)
+
+
+def test_no_total_stops_after_a_run_of_failures():
+    fetcher = FakeFetcher(pages=3)
+    titles, failed = collect(fetcher, max_parallel=3)
+
+    assert len(titles) == 3 * PAGE_SIZE
+    assert failed == [4, 5, 6]
+    assert max(fetcher.requested) <= 3 + 3 + 3
+
+
+def test_no_total_stops_at_short_page():
+    fetcher = FakeFetcher(pages=3, short_last=True)
+    titles, failed = collect(fetcher)
+
+    assert len(titles) == 2 * PAGE_SIZE + 1
+    assert failed == []
+
+
+def test_known_total_fetches_exactly_the_pages():
+    fetcher = FakeFetcher(pages=4, total=4 * PAGE_SIZE)
+    titles, failed = collect(fetcher)
+
+    assert titles[0] == "Program 1.0" and titles[-1] == "Program 4.1"
+    assert sorted(fetcher.requested) == [1, 2, 3, 4]
+    assert failed == []
@@ -12,22 +12,52 @@ Features:
 - Allocation system for approved applications
 - Rule-based matching engine for recommendations
 
+Storage is pluggable (see app/storage): in-memory by default, or a SQLAlchemy
+database when SAMARTH_DATABASE_URL is set.
+
 TODO: 
-- Replace dummy data storage with actual database (SQLAlchemy/PostgreSQL)
 - Add password hashing (bcrypt)
 - Add JWT token authentication
 - Integrate with scraper service
 - Replace rule-based matching with ML model
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.routes import student_routes, admin_routes, internship_routes
+from app.storage import init_store, close_store
+from app.utils.helpers import initialize_dummy_data
+from app.services.catalogue import refresh_catalogue
+from app.services.model_server import MODEL_SERVER
+from app.services.scraper_jobs import SCRAPER_JOBS
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Startup: connect the store, seed dummy data, warm the catalogue mirror and
+    load the model. Shutdown: cancel running scraper jobs, stop the model
+    server and close the store.
+    """
+    store = await init_store()
+    await initialize_dummy_data(store)
+    await refresh_catalogue()
+    await MODEL_SERVER.start()
+    try:
+        yield
+    finally:
+        await SCRAPER_JOBS.stop()
+        await MODEL_SERVER.stop()
+        await close_store()
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="SAMARTH Backend API",
     description="FastAPI backend for SAMARTH internship platform",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -1,39 +1,45 @@
 """
 Admin routes for login, dashboard, managing internships, applications, and allocations.
 """
-from fastapi import APIRouter, HTTPException, Header, Depends
+from fastapi import APIRouter, HTTPException, Header, Depends, Request
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
-from app.schemas.admin_schema import AdminLogin, AdminResponse, AdminSummary
+from app.schemas.admin_schema import (
+    AdminLogin,
+    AdminResponse,
+    AdminSummary,
+    InternshipCounts,
+    RecommenderStats
+)
 from app.schemas.internship_schema import InternshipCreate, InternshipResponse
 from app.schemas.application_schema import ApplicationResponse, AllocationResponse, AllocationCreate
 from app.utils.helpers import (
-    ADMINS_DB,
-    INTERNSHIPS_DB,
-    APPLICATIONS_DB,
-    ALLOCATIONS_DB,
-    STUDENTS_DB,
-    get_next_id,
     create_token,
     verify_token
 )
+from app.storage import DuplicateKeyError, get_store
+from app.services.catalogue import save_internship
+from app.services.model_server import MODEL_SERVER
+from app.services.recommendation_cache import RECOMMENDATION_CACHE
+from app.services.summary_stream import notify_summary_changed, summary_events
 from datetime import datetime
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
-def get_current_admin(authorization: Optional[str] = Header(None)):
+async def get_current_admin(authorization: Optional[str] = Header(None)):
     """Dependency to get current authenticated admin."""
     if not authorization:
         raise HTTPException(status_code=401, detail="Authorization header missing")
     
     token = authorization.replace("Bearer ", "") if authorization.startswith("Bearer ") else authorization
-    user_info = verify_token(token)
+    user_info = await verify_token(token)
     
     if not user_info or user_info.get("user_type") != "admin":
         raise HTTPException(status_code=401, detail="Invalid or expired token")
     
     admin_id = user_info.get("user_id")
-    admin = ADMINS_DB.get(admin_id)
+    admin = await get_store().get_admin(admin_id)
     
     if not admin:
         raise HTTPException(status_code=404, detail="Admin not found")
@@ -47,11 +53,7 @@ async def login_admin(credentials: AdminLogin):
     Login as admin.
     """
     # Find admin by email
-    admin = None
-    for a in ADMINS_DB.values():
-        if a["email"] == credentials.email:
-            admin = a
-            break
+    admin = await get_store().get_admin_by_email(credentials.email)
     
     if not admin:
         raise HTTPException(status_code=401, detail="Invalid email or password")
@@ -61,7 +63,7 @@ async def login_admin(credentials: AdminLogin):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     # Generate token
-    token = create_token(admin["id"], "admin", admin["email"])
+    token = await create_token(admin["id"], "admin", admin["email"])
     
     return AdminResponse(
         admin_id=admin["id"],
@@ -74,27 +76,53 @@ async def login_admin(credentials: AdminLogin):
 async def get_summary(current_admin: dict = Depends(get_current_admin)):
     """
     Get admin dashboard summary with total submissions, allocations, and interns.
+    Counters are maintained on every apply/allocate, so this is O(1).
     """
-    total_submissions = len(APPLICATIONS_DB)
-    total_allocations = len(ALLOCATIONS_DB)
-    
-    # Count unique students who have been allocated
-    allocated_student_ids = set(
-        allocation["student_id"] for allocation in ALLOCATIONS_DB.values()
-    )
-    total_interns = len(allocated_student_ids)
+    summary = await get_store().summary()
     
-    # Count pending applications
-    pending_applications = sum(
-        1 for app in APPLICATIONS_DB.values() 
-        if app["status"] == "pending"
+    return AdminSummary(**summary)
+
+
+@router.get("/summary/stream")
+async def stream_summary(request: Request, current_admin: dict = Depends(get_current_admin)):
+    """
+    Stream the dashboard summary as Server-Sent Events.
+    An event is pushed whenever the counters change.
+    """
+    return StreamingResponse(
+        summary_events(request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
+
+
+@router.get("/summary/internships/{internship_id}", response_model=InternshipCounts)
+async def get_internship_counts(
+    internship_id: int,
+    current_admin: dict = Depends(get_current_admin)
+):
+    """
+    Get application and allocation counts for one internship.
+    """
+    counts = await get_store().internship_counts(internship_id)
     
-    return AdminSummary(
-        total_submissions=total_submissions,
-        total_allocations=total_allocations,
-        total_interns=total_interns,
-        pending_applications=pending_applications
+    return InternshipCounts(internship_id=internship_id, **counts)
+
+
+@router.get("/recommender/stats", response_model=RecommenderStats)
+async def get_recommender_stats(current_admin: dict = Depends(get_current_admin)):
+    """
+    Get the recommendation model server's mode, batching counters and
+    p50/p99 request latency over the most recent requests, plus the
+    recommendation cache's size and hit rate.
+    """
+    cache = RECOMMENDATION_CACHE.stats()
+    return RecommenderStats(
+        **MODEL_SERVER.stats(),
+        cache_entries=cache["entries"],
+        cache_hits=cache["hits"],
+        cache_misses=cache["misses"],
+        cache_hit_rate=cache["hit_rate"]
     )
 
 
@@ -106,10 +134,7 @@ async def add_internship(
     """
     Manually add a new internship (admin-only).
     """
-    internship_id = get_next_id(INTERNSHIPS_DB)
-    
     new_internship = {
-        "id": internship_id,
         "title": internship_data.title,
         "description": internship_data.description,
         "skills_required": internship_data.skills_required,
@@ -120,7 +145,7 @@ async def add_internship(
         "created_at": datetime.now()
     }
     
-    INTERNSHIPS_DB[internship_id] = new_internship
+    new_internship = await save_internship(new_internship)
     
     return InternshipResponse(**new_internship)
 
@@ -131,7 +156,7 @@ async def get_all_internships(current_admin: dict = Depends(get_current_admin)):
     View all internships (both scraper and admin-added).
     """
     internships = []
-    for internship in INTERNSHIPS_DB.values():
+    for internship in await get_store().list_internships():
         internships.append(InternshipResponse(**internship))
     
     return internships
@@ -143,7 +168,7 @@ async def get_all_applications(current_admin: dict = Depends(get_current_admin))
     View all applications.
     """
     applications = []
-    for application in APPLICATIONS_DB.values():
+    for application in await get_store().list_applications():
         applications.append(ApplicationResponse(**application))
     
     return applications
@@ -158,25 +183,24 @@ async def allocate_internship(
     """
     Allocate an internship to a student (approve their application).
     """
+    store = get_store()
+    
     # Check if application exists
-    application = APPLICATIONS_DB.get(application_id)
+    application = await store.get_application(application_id)
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
     # Check if already allocated
-    for allocation in ALLOCATIONS_DB.values():
-        if allocation["application_id"] == application_id:
-            raise HTTPException(status_code=400, detail="Application already allocated")
+    if await store.get_allocation_by_application(application_id):
+        raise HTTPException(status_code=400, detail="Application already allocated")
     
     # Get internship details
-    internship = INTERNSHIPS_DB.get(application["internship_id"])
+    internship = await store.get_internship(application["internship_id"])
     if not internship:
         raise HTTPException(status_code=404, detail="Internship not found")
     
-    # Create allocation
-    allocation_id = get_next_id(ALLOCATIONS_DB)
+    # Create allocation (the store also marks the application as allocated)
     new_allocation = {
-        "id": allocation_id,
         "application_id": application_id,
         "student_id": application["student_id"],
         "student_name": application["student_name"],
@@ -186,9 +210,10 @@ async def allocate_internship(
         "allocated_at": datetime.now()
     }
     
-    ALLOCATIONS_DB[allocation_id] = new_allocation
-    
-    # Update application status
-    application["status"] = "allocated"
+    try:
+        new_allocation = await store.create_allocation(new_allocation)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Application already allocated")
+    notify_summary_changed()
     
     return AllocationResponse(**new_allocation)
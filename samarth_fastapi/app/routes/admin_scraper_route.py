@@ -1,38 +1,60 @@
-from fastapi import APIRouter
-import subprocess
-import json
-import os
+from fastapi import APIRouter, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
 
-router = APIRouter()
+from app.schemas.scraper_schema import (
+    ScraperJobResponse,
+    ScraperResultsPage,
+    ScraperTriggerResponse
+)
+from app.services.scraper_jobs import SCRAPER_JOBS, read_results_page
 
-SCRAPER_PATH = "Scraper/main.py"
-JOBS_JSON_PATH = "Scraper/jobs.json"
+router = APIRouter()
 
 
-@router.post("/admin/run-scraper")
-def run_scraper():
+@router.post("/admin/run-scraper", response_model=ScraperTriggerResponse, status_code=202)
+async def run_scraper():
     """
-    Runs the external scraper and returns scraped internships
+    Starts the external scraper in the background and returns its job ID
+    immediately. If a run is already in progress, that job is returned.
     """
+    job, coalesced = SCRAPER_JOBS.start()
+    return ScraperTriggerResponse(**job.to_dict(), coalesced=coalesced)
 
-    try:
-        result = subprocess.run(
-            ["python", SCRAPER_PATH],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
-
-    if not os.path.exists(JOBS_JSON_PATH):
-        return {"status": "error", "message": "jobs.json not found"}
-
-    with open(JOBS_JSON_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return {
-        "status": "success",
-        "scraped_count": len(data),
-        "internships": data
-    }
+
+@router.get("/admin/run-scraper/{job_id}", response_model=ScraperJobResponse)
+async def get_scraper_job(job_id: str):
+    """
+    Status of a scraper run: per-source progress, record counts and duration.
+    """
+    job = SCRAPER_JOBS.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scraper job not found")
+    return ScraperJobResponse(**job.to_dict())
+
+
+@router.get("/admin/run-scraper/{job_id}/results", response_model=ScraperResultsPage)
+async def get_scraper_results(
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """
+    Page through the internships scraped by a finished run.
+    Only the requested page is read from the run's output file.
+    """
+    job = SCRAPER_JOBS.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scraper job not found")
+    if job.status == "running":
+        raise HTTPException(status_code=409, detail="Scraper job is still running")
+    if job.status in ("failed", "cancelled"):
+        raise HTTPException(status_code=409, detail=f"Scraper job {job.status}: {job.error}")
+
+    internships = await run_in_threadpool(read_results_page, job.output_path, offset, limit)
+    return ScraperResultsPage(
+        job_id=job.id,
+        total=job.record_count or 0,
+        offset=offset,
+        limit=limit,
+        internships=internships
+    )
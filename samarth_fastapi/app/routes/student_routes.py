@@ -1,7 +1,7 @@
 """
 Student routes for registration, login, profile, search, recommendations, and applications.
 """
-from fastapi import APIRouter, HTTPException, Header, Depends
+from fastapi import APIRouter, HTTPException, Header, Depends, Query, Response
 from typing import List,Optional
 
 from app.schemas.student_schema import (
@@ -19,32 +19,34 @@ from app.schemas.internship_schema import (
 )
 from app.schemas.application_schema import ApplicationResponse
 from app.utils.helpers import (
-    STUDENTS_DB,
-    APPLICATIONS_DB,
-    get_next_id,
     create_token,
-    verify_token,
-    INTERNSHIPS_DB
+    verify_token
 )
+from app.storage import DuplicateKeyError, get_store
+from app.services.catalogue import get_cached_internships, refresh_catalogue
 from app.services.matching_engine import get_recommendations
+from app.services.model_server import MODEL_SERVER
+from app.services.recommendation_cache import RECOMMENDATION_CACHE
+from app.services.summary_stream import notify_summary_changed
+from app.services.search_index import SEARCH_INDEX
 from datetime import datetime
 
 router = APIRouter(prefix="/student", tags=["Student"])
 
 
-def get_current_student(authorization: Optional[str] = Header(None)):
+async def get_current_student(authorization: Optional[str] = Header(None)):
     """Dependency to get current authenticated student."""
     if not authorization:
         raise HTTPException(status_code=401, detail="Authorization header missing")
     
     token = authorization.replace("Bearer ", "") if authorization.startswith("Bearer ") else authorization
-    user_info = verify_token(token)
+    user_info = await verify_token(token)
     
     if not user_info or user_info.get("user_type") != "student":
         raise HTTPException(status_code=401, detail="Invalid or expired token")
     
     student_id = user_info.get("user_id")
-    student = STUDENTS_DB.get(student_id)
+    student = await get_store().get_student(student_id)
     
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
@@ -57,15 +59,14 @@ async def register_student(student_data: StudentRegister):
     """
     Register a new student.
     """
+    store = get_store()
+    
     # Check if email already exists
-    for student in STUDENTS_DB.values():
-        if student["email"] == student_data.email:
-            raise HTTPException(status_code=400, detail="Email already registered")
+    if await store.get_student_by_email(student_data.email):
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create new student
-    student_id = get_next_id(STUDENTS_DB)
     new_student = {
-        "id": student_id,
         "email": student_data.email,
         "password": student_data.password,  # TODO: Hash password in production
         "full_name": student_data.full_name,
@@ -76,10 +77,14 @@ async def register_student(student_data: StudentRegister):
         "created_at": datetime.now()
     }
     
-    STUDENTS_DB[student_id] = new_student
+    try:
+        new_student = await store.create_student(new_student)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    student_id = new_student["id"]
     
     # Generate token
-    token = create_token(student_id, "student", student_data.email)
+    token = await create_token(student_id, "student", student_data.email)
     
     return StudentResponse(
         student_id=student_id,
@@ -95,11 +100,7 @@ async def login_student(credentials: StudentLogin):
     Login a student.
     """
     # Find student by email
-    student = None
-    for s in STUDENTS_DB.values():
-        if s["email"] == credentials.email:
-            student = s
-            break
+    student = await get_store().get_student_by_email(credentials.email)
     
     if not student:
         raise HTTPException(status_code=401, detail="Invalid email or password")
@@ -109,7 +110,7 @@ async def login_student(credentials: StudentLogin):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     # Generate token
-    token = create_token(student["id"], "student", student["email"])
+    token = await create_token(student["id"], "student", student["email"])
     
     return StudentResponse(
         student_id=student["id"],
@@ -145,16 +146,21 @@ async def update_profile(
     Update current student's profile.
     """
     # Update fields if provided
+    updates = {}
     if profile_update.full_name is not None:
-        current_student["full_name"] = profile_update.full_name
+        updates["full_name"] = profile_update.full_name
     if profile_update.phone is not None:
-        current_student["phone"] = profile_update.phone
+        updates["phone"] = profile_update.phone
     if profile_update.skills is not None:
-        current_student["skills"] = profile_update.skills
+        updates["skills"] = profile_update.skills
     if profile_update.interests is not None:
-        current_student["interests"] = profile_update.interests
+        updates["interests"] = profile_update.interests
     if profile_update.location is not None:
-        current_student["location"] = profile_update.location
+        updates["location"] = profile_update.location
+    
+    if updates:
+        current_student = await get_store().update_student(current_student["id"], updates)
+        RECOMMENDATION_CACHE.invalidate_student(current_student["id"])
     
     return StudentProfile(
         id=current_student["id"],
@@ -170,36 +176,41 @@ async def update_profile(
 
 @router.get("/internships/search", response_model=List[InternshipResponse])
 async def search_internships(
+    response: Response,
     keyword: Optional[str] = None,
     location: Optional[str] = None,
-    skills: Optional[str] = None
+    skills: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100)
 ):
     """
     Search internships by keyword, location, or skills.
     Skills should be comma-separated.
+
+    Every word of `keyword` must start a word of the title or description,
+    and every word of `location` must start a word of the location
+    ("data sci" finds "Data Science", "ew Del" does not find "New Delhi").
+    Skills match whole skill names (case-insensitive); any one is enough.
+    Results are ranked by relevance (title hits, then skill hits, then
+    description hits) and paginated with offset/limit; the total number of
+    matches is returned in the X-Total-Count header.
     """
-    results = []
     skills_list = [s.strip() for s in skills.split(",")] if skills else []
-    
-    for internship in INTERNSHIPS_DB.values():
-        # Keyword search
-        if keyword:
-            keyword_lower = keyword.lower()
-            if (keyword_lower not in internship["title"].lower() and 
-                keyword_lower not in internship["description"].lower()):
-                continue
-        
-        # Location search
-        if location:
-            if location.lower() not in internship["location"].lower():
-                continue
-        
-        # Skills search
-        if skills_list:
-            internship_skills = [s.lower() for s in internship["skills_required"]]
-            if not any(skill.lower() in internship_skills for skill in skills_list):
-                continue
-        
+
+    await refresh_catalogue()
+    internships = get_cached_internships()
+    internship_ids, total = SEARCH_INDEX.search(
+        keyword=keyword,
+        location=location,
+        skills=skills_list,
+        offset=offset,
+        limit=limit
+    )
+    response.headers["X-Total-Count"] = str(total)
+
+    results = []
+    for internship_id in internship_ids:
+        internship = internships[internship_id]
         results.append(InternshipResponse(
             id=internship["id"],
             title=internship["title"],
@@ -222,13 +233,24 @@ async def get_recommendations_endpoint(
 ):
     """
     Get personalized internship recommendations for the current student.
+    Scored by the XGBoost model server when it is loaded, otherwise by the
+    rule-based matching engine; repeat calls with an unchanged profile and
+    catalogue are served from the recommendation cache.
     """
     # Use current student's ID from token
     limit = request.limit if request and request.limit else 10
-    recommendations = get_recommendations(
-        student_id=current_student["id"],
-        limit=limit
-    )
+    version = await refresh_catalogue()
+    recommendations = RECOMMENDATION_CACHE.get(current_student, version, limit)
+    if recommendations is not None:
+        return recommendations
+
+    recommendations = await MODEL_SERVER.recommend(current_student, limit)
+    if recommendations is None:
+        recommendations = await get_recommendations(
+            student_id=current_student["id"],
+            limit=limit
+        )
+    RECOMMENDATION_CACHE.put(current_student, version, limit, recommendations)
     
     return recommendations
 
@@ -241,8 +263,10 @@ async def apply_for_internship(
     """
     Apply for an internship. Only allowed for admin-added internships.
     """
+    store = get_store()
+    
     # Check if internship exists
-    internship = INTERNSHIPS_DB.get(internship_id)
+    internship = await store.get_internship(internship_id)
     if not internship:
         raise HTTPException(status_code=404, detail="Internship not found")
     
@@ -254,15 +278,11 @@ async def apply_for_internship(
         )
     
     # Check if already applied
-    for application in APPLICATIONS_DB.values():
-        if (application["student_id"] == current_student["id"] and 
-            application["internship_id"] == internship_id):
-            raise HTTPException(status_code=400, detail="Already applied for this internship")
+    if await store.find_application(current_student["id"], internship_id):
+        raise HTTPException(status_code=400, detail="Already applied for this internship")
     
     # Create application
-    application_id = get_next_id(APPLICATIONS_DB)
     new_application = {
-        "id": application_id,
         "student_id": current_student["id"],
         "student_name": current_student["full_name"],
         "student_email": current_student["email"],
@@ -272,6 +292,10 @@ async def apply_for_internship(
         "applied_at": datetime.now()
     }
     
-    APPLICATIONS_DB[application_id] = new_application
+    try:
+        new_application = await store.create_application(new_application)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Already applied for this internship")
+    notify_summary_changed()
     
     return ApplicationResponse(**new_application)
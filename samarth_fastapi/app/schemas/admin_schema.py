@@ -1,6 +1,7 @@
 """
 Admin-related Pydantic schemas for request/response validation.
 """
+from typing import Dict, Optional
 from pydantic import BaseModel, EmailStr
 
 
@@ -23,3 +24,28 @@ class AdminSummary(BaseModel):
     total_allocations: int
     total_interns: int
     pending_applications: int
+    applications_by_status: Dict[str, int] = {}
+
+
+class InternshipCounts(BaseModel):
+    """Schema for per-internship application and allocation counts."""
+    internship_id: int
+    applications: int
+    allocations: int
+
+
+class RecommenderStats(BaseModel):
+    """Schema for model server counters and latency."""
+    mode: str  # "model" or "rules"
+    error: Optional[str] = None
+    requests: int
+    fallbacks: int
+    batches: int
+    avg_batch_size: float
+    latency_p50_ms: Optional[float] = None
+    latency_p99_ms: Optional[float] = None
+    latency_window: int
+    cache_entries: int
+    cache_hits: int
+    cache_misses: int
+    cache_hit_rate: float
@@ -0,0 +1,33 @@
+"""
+Scraper job-related Pydantic schemas.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+
+class ScraperJobResponse(BaseModel):
+    """Schema for a scraper run's status."""
+    job_id: str
+    status: str  # "running", "succeeded", "failed", "cancelled"
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    duration_seconds: float
+    sources: Dict[str, Dict[str, Any]]  # source -> {"status": ..., "records": ...}
+    record_count: Optional[int] = None
+    imported_count: Optional[int] = None
+    error: Optional[str] = None
+
+
+class ScraperTriggerResponse(ScraperJobResponse):
+    """Schema for triggering a scraper run."""
+    coalesced: bool  # True if an already running job was returned
+
+
+class ScraperResultsPage(BaseModel):
+    """Schema for a page of scraped internships."""
+    job_id: str
+    total: int
+    offset: int
+    limit: int
+    internships: List[Dict[str, Any]]
@@ -0,0 +1,143 @@
+"""
+Catalogue Service - Single write path for internships.
+
+Every internship write goes through here so that derived structures (like
+the search index) stay in sync with the data. The service keeps a local
+mirror of the internships in the store; the mirror is reloaded whenever the
+store's catalogue version moves because another worker wrote to it.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+from app.storage import get_store
+from app.services.recommendation_cache import RECOMMENDATION_CACHE
+from app.services.search_index import SEARCH_INDEX
+
+# Local mirror of the store's internships, and the store version it reflects
+_internships: Dict[int, Dict[str, Any]] = {}
+_catalogue_version: Optional[int] = None
+
+
+def get_catalogue_version() -> int:
+    """Return the store catalogue version the local mirror reflects (-1 if not loaded)."""
+    return -1 if _catalogue_version is None else _catalogue_version
+
+
+def get_cached_internships() -> Dict[int, Dict[str, Any]]:
+    """Return the local mirror of internships, keyed by ID (call refresh_catalogue first)."""
+    return _internships
+
+
+async def refresh_catalogue() -> int:
+    """
+    Make sure the local mirror and search index match the store.
+
+    Returns:
+        The current catalogue version
+    """
+    global _internships, _catalogue_version
+    store = get_store()
+    version = await store.catalogue_version()
+    if version != _catalogue_version:
+        internships = await store.list_internships()
+        _internships = {internship["id"]: internship for internship in internships}
+        SEARCH_INDEX.rebuild(internships)
+        RECOMMENDATION_CACHE.clear()
+        _catalogue_version = version
+    return version
+
+
+async def _apply_local_writes(stored: List[Dict[str, Any]]) -> None:
+    """Fold our own writes into the mirror, or reload if others wrote too."""
+    global _internships, _catalogue_version
+    version = await get_store().catalogue_version()
+    if _catalogue_version is not None and version == _catalogue_version + 1:
+        for internship in stored:
+            _internships[internship["id"]] = internship
+        SEARCH_INDEX.add_many(stored)
+        RECOMMENDATION_CACHE.clear()
+        _catalogue_version = version
+    else:
+        await refresh_catalogue()
+
+
+def _apply_unpublished_writes(stored: List[Dict[str, Any]]) -> None:
+    """Fold writes made without a version bump into the mirror; the version stays put."""
+    for internship in stored:
+        _internships[internship["id"]] = internship
+    SEARCH_INDEX.add_many(stored)
+
+
+def _external_key(record: Dict[str, Any]) -> str:
+    """Build a key identifying a scraped record across scraper runs."""
+    link = str(record.get("job_link") or "").strip()
+    if link:
+        return link
+    return "|".join(
+        str(record.get(field) or "").strip().lower()
+        for field in ("source", "job_title", "company_name", "duration")
+    )
+
+
+def _scraped_to_internship(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a scraper (jobs.json) record into an internship dict."""
+    domain = str(record.get("domain") or "")
+    skills = [d.strip() for d in domain.split(",") if d.strip()]
+    description = str(record.get("description") or "").strip()
+    if not description:
+        description = str(record.get("company_name") or "").strip()
+
+    return {
+        "title": str(record.get("job_title") or "").strip(),
+        "description": description,
+        "skills_required": skills,
+        "location": str(record.get("location") or "").strip(),
+        "source": "scraper",
+        "apply_url": str(record.get("job_link") or "").strip() or None,
+        "admin_can_apply": False,
+        "external_key": _external_key(record),
+        "created_at": datetime.now()
+    }
+
+
+async def save_internship(internship: Dict[str, Any]) -> Dict[str, Any]:
+    """Insert a new internship and update the search index."""
+    stored = await get_store().create_internship(internship)
+    await _apply_local_writes([stored])
+    return stored
+
+
+async def import_scraped_internships(records: Iterable[Dict[str, Any]], publish: bool = True) -> int:
+    """
+    Import scraper records into the catalogue with one bulk upsert.
+
+    Records already imported by a previous run (same job link, or same
+    source/title/company/duration) are updated in place instead of duplicated.
+    An import split into several calls passes publish=False and calls
+    publish_catalogue_writes() after the last one, so the catalogue version
+    moves (and other workers reload, and cached recommendations are dropped)
+    once per import rather than once per call.
+
+    Returns:
+        Number of records imported or updated
+    """
+    # Later duplicates of the same record win, as they would with one-by-one writes
+    internships: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        internship = _scraped_to_internship(record)
+        internships[internship["external_key"]] = internship
+
+    if not internships:
+        return 0
+
+    stored = await get_store().upsert_internships(list(internships.values()), bump_version=publish)
+    if publish:
+        await _apply_local_writes(stored)
+    else:
+        _apply_unpublished_writes(stored)
+    return len(stored)
+
+
+async def publish_catalogue_writes() -> None:
+    """Bump the catalogue version once for writes imported with publish=False."""
+    await get_store().bump_catalogue_version()
+    await _apply_local_writes([])
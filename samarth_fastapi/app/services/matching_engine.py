@@ -2,9 +2,21 @@
 Matching Engine Service - Rule-based scoring model for internship recommendations.
 TODO: Replace with ML-based matching in production.
 """
-from typing import List, Dict, Any
-from app.utils.helpers import INTERNSHIPS_DB, STUDENTS_DB
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+import numpy as np
+from scipy import sparse
+from app.storage import get_store
 from app.schemas.internship_schema import InternshipResponse, RecommendationResponse
+from app.services.catalogue import (
+    get_cached_internships,
+    get_catalogue_version,
+    refresh_catalogue
+)
+
+# Maximum number of interest keywords whose postings are memoized
+# (least recently used ones are evicted first)
+MAX_INTEREST_POSTINGS = 4096
 
 
 def calculate_match_score(
@@ -68,13 +80,190 @@ def calculate_match_score(
     return round(score, 2)
 
 
-def get_recommendations(
+class InternshipFeatureMatrix:
+    """
+    Precomputed internship features for batch scoring.
+
+    Rows follow catalogue (ID) order. Skills are stored as a sparse
+    internship x skill indicator matrix, locations as integer codes into a
+    table of distinct locations, and interest keywords as memoized boolean
+    postings over the lowercase title + description text.
+    Interests are free-text substrings, so their postings are built on first
+    use rather than up front, and kept in an LRU memo.
+    """
+
+    def __init__(self, internships: List[Dict[str, Any]]):
+        self.internships = internships
+        self.size = len(internships)
+
+        # Skill indicator matrix (deduplicated, lowercase)
+        self.skill_vocab: Dict[str, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        skill_counts = np.zeros(self.size, dtype=np.float64)
+        for row, internship in enumerate(internships):
+            required = set(skill.lower() for skill in internship.get("skills_required", []))
+            skill_counts[row] = len(required)
+            for skill in required:
+                rows.append(row)
+                cols.append(self.skill_vocab.setdefault(skill, len(self.skill_vocab)))
+        self.skills = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+            shape=(self.size, len(self.skill_vocab))
+        )
+        self.skill_counts = skill_counts
+
+        # Location codes
+        self.locations: List[str] = []
+        location_codes: Dict[str, int] = {}
+        self.location_codes = np.empty(self.size, dtype=np.int64)
+        for row, internship in enumerate(internships):
+            location = (internship.get("location") or "").lower()
+            code = location_codes.get(location)
+            if code is None:
+                code = location_codes[location] = len(self.locations)
+                self.locations.append(location)
+            self.location_codes[row] = code
+
+        # Text searched for interest keywords
+        self.texts = [
+            (internship.get("title") or "").lower() + " " +
+            (internship.get("description") or "").lower()
+            for internship in internships
+        ]
+        self._interest_postings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def interest_postings(self, interest: str) -> np.ndarray:
+        """Boolean mask of internships whose text contains `interest`."""
+        postings = self._interest_postings.get(interest)
+        if postings is not None:
+            self._interest_postings.move_to_end(interest)
+            return postings
+        postings = np.fromiter(
+            (interest in text for text in self.texts),
+            dtype=bool,
+            count=self.size
+        )
+        self._interest_postings[interest] = postings
+        if len(self._interest_postings) > MAX_INTEREST_POSTINGS:
+            self._interest_postings.popitem(last=False)
+        return postings
+
+    def score(self, student: Dict[str, Any]) -> np.ndarray:
+        """
+        Score one student against every internship in a single batch.
+
+        Produces the same values as calculate_match_score, row by row.
+        """
+        scores = np.zeros(self.size, dtype=np.float64)
+        if not self.size:
+            return scores
+
+        # 1. Skill Match (0-50 points)
+        student_vector = np.zeros(len(self.skill_vocab), dtype=np.float64)
+        for skill in set(skill.lower() for skill in student.get("skills", [])):
+            col = self.skill_vocab.get(skill)
+            if col is not None:
+                student_vector[col] = 1.0
+        matched_skills = self.skills @ student_vector
+        has_skills = self.skill_counts > 0
+        scores[has_skills] += matched_skills[has_skills] / self.skill_counts[has_skills] * 50
+
+        # 2. Location Match (0-30 points), computed once per distinct location
+        student_location = (student.get("location") or "").lower()
+        if student_location:
+            location_table = np.zeros(len(self.locations), dtype=np.float64)
+            for code, location in enumerate(self.locations):
+                if not location:
+                    continue
+                if student_location == location:
+                    location_table[code] = 30
+                elif student_location in location or location in student_location:
+                    location_table[code] = 15
+            scores += location_table[self.location_codes]
+
+        # 3. Interest Match (0-20 points)
+        student_interests = set(interest.lower() for interest in student.get("interests", []))
+        if student_interests:
+            matched_interests = np.zeros(self.size, dtype=np.float64)
+            for interest in student_interests:
+                matched_interests += self.interest_postings(interest)
+            scores += matched_interests / len(student_interests) * 20
+
+        return np.round(scores, 2)
+
+
+_feature_matrix: Optional[InternshipFeatureMatrix] = None
+_feature_matrix_version: Optional[int] = None
+
+
+def get_feature_matrix() -> InternshipFeatureMatrix:
+    """Return the feature matrix, rebuilding it if the catalogue mirror changed."""
+    global _feature_matrix, _feature_matrix_version
+    version = get_catalogue_version()
+    if _feature_matrix is None or _feature_matrix_version != version:
+        _feature_matrix = InternshipFeatureMatrix(list(get_cached_internships().values()))
+        _feature_matrix_version = version
+    return _feature_matrix
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, highest first.
+
+    Ties are broken by row order, matching a stable descending sort.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+        threshold = scores[candidates].min()
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)[:k - len(above)]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(len(scores))
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+def build_recommendation(internship: Dict[str, Any], score: float) -> RecommendationResponse:
+    """Turn a scored internship dict into a RecommendationResponse."""
+    # Determine if student can apply
+    # Apply button logic: if source == "admin" → apply=true, if source == "scraper" → apply=false
+    can_apply = internship.get("source") == "admin"
+    
+    # Convert internship dict to InternshipResponse
+    internship_response = InternshipResponse(
+        id=internship["id"],
+        title=internship["title"],
+        description=internship["description"],
+        skills_required=internship["skills_required"],
+        location=internship["location"],
+        source=internship["source"],
+        admin_can_apply=internship["admin_can_apply"],
+        apply_url=internship.get("apply_url"),
+        created_at=internship["created_at"]
+    )
+    
+    return RecommendationResponse(
+        internship=internship_response,
+        score=score,
+        can_apply=can_apply
+    )
+
+
+async def get_recommendations(
     student_id: int,
     limit: int = 10
 ) -> List[RecommendationResponse]:
     """
     Get personalized internship recommendations for a student.
     
+    All internships are scored in one batch against the precomputed feature
+    matrix; only the top `limit` rows are turned into response models.
+    
     Args:
         student_id: ID of the student
         limit: Maximum number of recommendations to return
@@ -82,41 +271,15 @@ def get_recommendations(
     Returns:
         List of recommendations sorted by score (highest first)
     """
-    student = STUDENTS_DB.get(student_id)
+    student = await get_store().get_student(student_id)
     if not student:
         return []
     
-    recommendations = []
-    
-    # Calculate scores for all internships
-    for internship_id, internship in INTERNSHIPS_DB.items():
-        score = calculate_match_score(internship, student)
-        
-        # Determine if student can apply
-        # Apply button logic: if source == "admin" → apply=true, if source == "scraper" → apply=false
-        can_apply = internship.get("source") == "admin"
-        
-        # Convert internship dict to InternshipResponse
-        internship_response = InternshipResponse(
-            id=internship["id"],
-            title=internship["title"],
-            description=internship["description"],
-            skills_required=internship["skills_required"],
-            location=internship["location"],
-            source=internship["source"],
-            admin_can_apply=internship["admin_can_apply"],
-            apply_url=internship.get("apply_url"),
-            created_at=internship["created_at"]
-        )
-        
-        recommendations.append(
-            RecommendationResponse(
-                internship=internship_response,
-                score=score,
-                can_apply=can_apply
-            )
-        )
+    await refresh_catalogue()
+    features = get_feature_matrix()
+    scores = features.score(student)
     
-    # Sort by score (highest first) and return top N
-    recommendations.sort(key=lambda x: x.score, reverse=True)
-    return recommendations[:limit]
+    return [
+        build_recommendation(features.internships[row], float(scores[row]))
+        for row in top_k_indices(scores, limit)
+    ]
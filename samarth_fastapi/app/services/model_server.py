@@ -0,0 +1,275 @@
+"""
+Model Server Service - XGBoost recommendations from a warm, batched model.
+
+The booster trained by sih-backend/train_xgb_model.py, its TF-IDF vectorizer
+and the feature matrix of the current catalogue are loaded once and kept in
+memory. Concurrent recommendation requests are queued and scored together:
+the batcher waits up to MAX_BATCH_WAIT_MS for more requests (at most
+MAX_BATCH_SIZE), builds all their feature rows and makes one prediction
+call in a worker thread, so the event loop never blocks on inference.
+
+Features are the ones sih-backend computes (its match_features module is
+imported from SAMARTH_SIH_BACKEND_DIR, by default the repository's
+sih-backend/). Students map onto them as
+skills -> skills, interests -> preferred domains and location -> preferred
+locations; fields the app does not collect (CGPA, experience, WFH and
+duration preferences) take the "no preference" values.
+
+The scientific stack (pandas, scikit-learn, xgboost) is optional: when it
+or the model files are missing, or SAMARTH_RECOMMENDER=rules, the server
+stays disabled and the rule-based matching engine answers instead.
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.schemas.internship_schema import RecommendationResponse
+from app.services.catalogue import get_cached_internships, get_catalogue_version
+from app.services.matching_engine import build_recommendation, top_k_indices
+
+logger = logging.getLogger(__name__)
+
+RECOMMENDER_ENV = "SAMARTH_RECOMMENDER"  # "model" (default, falls back to rules) or "rules"
+# the repository's sih-backend/, wherever the app is started from
+SIH_BACKEND_DIR = os.getenv(
+    "SAMARTH_SIH_BACKEND_DIR",
+    str(Path(__file__).resolve().parents[3] / "sih-backend")
+)
+MODEL_PATH = os.path.join(SIH_BACKEND_DIR, "models", "xgb_match_model.json")
+TFIDF_DIR = os.path.join(SIH_BACKEND_DIR, "models", "tfidf")
+JOBS_PATH = os.path.join(SIH_BACKEND_DIR, "data", "jobs.json")
+
+# Requests scored per prediction call, and how long the first one waits for company
+MAX_BATCH_SIZE = 64
+MAX_BATCH_WAIT_MS = 5
+
+# Latencies kept for the p50/p99 figures
+LATENCY_WINDOW = 1000
+
+
+def _student_row(student: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an app student onto the sih-backend student fields."""
+    return {
+        "skills": ",".join(student.get("skills", [])),
+        "preferred_domains": ",".join(student.get("interests", [])),
+        "preferred_locations": student.get("location") or "",
+        "wfh_preference": "Any",
+        "min_duration_months": 0,
+        "cgpa": 0,
+    }
+
+
+class _CatalogueFeatures:
+    """Job-side features of one catalogue version."""
+
+    def __init__(self, internships: List[Dict[str, Any]], version: int, vectorizer, modules):
+        pd, job_catalogue, match_features, tfidf_artifacts = modules
+        self.internships = internships
+        self.version = version
+
+        jobs_df = pd.DataFrame({
+            "job_title": [internship.get("title") or "" for internship in internships],
+            "description": [internship.get("description") or "" for internship in internships],
+            "location": [internship.get("location") or "" for internship in internships],
+            "wfh": "",
+            "duration": "",
+        })
+        jobs_df = job_catalogue.add_derived_columns(jobs_df)
+        job_tfidf = vectorizer.transform(tfidf_artifacts.job_text_corpus(jobs_df))
+        self.matrix = match_features.JobFeatureMatrix(jobs_df, job_tfidf)
+
+
+class _Request:
+    def __init__(self, student: Dict[str, Any], limit: int, future: asyncio.Future):
+        self.student = student
+        self.limit = limit
+        self.future = future
+
+
+class ModelServer:
+    """Loads the model once and micro-batches recommendation requests."""
+
+    def __init__(self, max_batch_size: int = MAX_BATCH_SIZE, max_wait_ms: float = MAX_BATCH_WAIT_MS):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.ready = False
+        self.error: Optional[str] = None
+        self.requests = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.fallbacks = 0
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # one batch at a time: XGBoost already spreads a prediction over all cores
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-server")
+        self._features: Optional[_CatalogueFeatures] = None
+
+    def _load(self) -> None:
+        """Import the ML stack and load the booster and vectorizer (worker thread)."""
+        backend_dir = os.path.abspath(SIH_BACKEND_DIR)
+        if backend_dir not in sys.path:
+            sys.path.append(backend_dir)
+
+        import pandas as pd
+        import xgboost
+        import job_catalogue
+        import match_features
+        import tfidf_artifacts
+
+        self._modules = (pd, job_catalogue, match_features, tfidf_artifacts)
+        self._booster = xgboost.Booster(model_file=MODEL_PATH)
+        jobs_df = job_catalogue.load_jobs(JOBS_PATH)
+        self._vectorizer, _ = tfidf_artifacts.load_or_build_tfidf(jobs_df, JOBS_PATH, TFIDF_DIR)
+
+    async def start(self) -> None:
+        """Load the model and start the batcher; on failure, stay disabled."""
+        if os.getenv(RECOMMENDER_ENV, "model") == "rules":
+            self.error = f"disabled by {RECOMMENDER_ENV}=rules"
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self._load)
+        except Exception as exc:  # missing optional dependency or model files
+            self.error = f"{type(exc).__name__}: {exc}"
+            logger.warning("Model server disabled, using rule-based matching (%s)", self.error)
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+        self.ready = True
+
+    async def stop(self) -> None:
+        """Stop the batcher and fail any queued requests."""
+        self.ready = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._queue is not None and not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+
+    async def recommend(
+        self,
+        student: Dict[str, Any],
+        limit: int = 10
+    ) -> Optional[List[RecommendationResponse]]:
+        """
+        Top `limit` internships for a student by model score (0-100).
+
+        Returns None when the model is not available, so the caller can fall
+        back to the rule-based engine. Call refresh_catalogue first.
+        """
+        if not self.ready:
+            self.fallbacks += 1
+            return None
+        started = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Request(student, limit, future))
+        try:
+            ranked = await future
+        except Exception as exc:
+            logger.warning("Model batch failed, using rule-based matching", exc_info=exc)
+            self.fallbacks += 1
+            return None
+        self._latencies.append(time.perf_counter() - started)
+        self.requests += 1
+        return [build_recommendation(internship, score) for internship, score in ranked]
+
+    async def _next_batch(self) -> List[_Request]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            try:
+                # snapshot the mirror on the event loop; features rebuild off it
+                version = get_catalogue_version()
+                internships = None
+                if self._features is None or self._features.version != version:
+                    internships = list(get_cached_internships().values())
+                results = await loop.run_in_executor(
+                    self._executor, self._score_batch, batch, internships, version
+                )
+            except Exception as exc:
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(exc)
+                continue
+            self.batches += 1
+            self.batched_requests += len(batch)
+            for request, ranked in zip(batch, results):
+                if not request.future.done():
+                    request.future.set_result(ranked)
+
+    def _score_batch(self, batch: List[_Request], internships, version: int):
+        """Score every request of a batch with one prediction call (worker thread)."""
+        _, _, match_features, _ = self._modules
+        if internships is not None:
+            self._features = _CatalogueFeatures(
+                internships, version, self._vectorizer, self._modules
+            )
+        features = self._features
+        size = features.matrix.size
+        if size == 0:
+            return [[] for _ in batch]
+
+        profiles = [match_features.student_profile(_student_row(r.student)) for r in batch]
+        student_vecs = self._vectorizer.transform([p["text"] for p in profiles])
+        X = np.vstack([
+            features.matrix.features(profile, student_vecs[i])
+            for i, profile in enumerate(profiles)
+        ]).astype(np.float32, copy=False)
+        scores = self._booster.inplace_predict(X).reshape(len(batch), size)
+
+        results = []
+        for request, student_scores in zip(batch, scores):
+            results.append([
+                (features.internships[row], round(float(student_scores[row]) * 100, 2))
+                for row in top_k_indices(student_scores, request.limit)
+            ])
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """Request/batch counters and p50/p99 latency over the recent window."""
+        latencies = np.array(self._latencies) * 1000
+        return {
+            "mode": "model" if self.ready else "rules",
+            "error": self.error,
+            "requests": self.requests,
+            "fallbacks": self.fallbacks,
+            "batches": self.batches,
+            "avg_batch_size": round(self.batched_requests / self.batches, 2) if self.batches else 0.0,
+            "latency_p50_ms": round(float(np.percentile(latencies, 50)), 2) if len(latencies) else None,
+            "latency_p99_ms": round(float(np.percentile(latencies, 99)), 2) if len(latencies) else None,
+            "latency_window": len(latencies),
+        }
+
+
+# Shared server for the application
+MODEL_SERVER = ModelServer()
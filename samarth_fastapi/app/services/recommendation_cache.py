@@ -0,0 +1,135 @@
+"""
+Recommendation Cache Service - Per-student recommendation lists kept in memory.
+
+A cached list is reused while the student's profile and the catalogue stay
+the same. Each student has one entry, tagged with:
+
+- profile version: a digest of the profile fields the recommenders read
+  (skills, interests, location), so an edit made through any worker
+  changes it
+- catalogue version: the store's, bumped by every internship write (admin
+  adds and scraper imports alike)
+
+An entry whose tags no longer match is a miss and gets replaced. Profile
+updates and catalogue changes also drop entries right away, so stale lists
+do not hold memory. Entries are evicted least recently used beyond
+SAMARTH_RECOMMENDATION_CACHE_SIZE students and expire after
+SAMARTH_RECOMMENDATION_CACHE_TTL seconds; a size of 0 disables the cache.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.schemas.internship_schema import RecommendationResponse
+
+CACHE_SIZE_ENV = "SAMARTH_RECOMMENDATION_CACHE_SIZE"
+CACHE_TTL_ENV = "SAMARTH_RECOMMENDATION_CACHE_TTL"
+MAX_ENTRIES = int(os.getenv(CACHE_SIZE_ENV, "10000"))
+TTL_SECONDS = float(os.getenv(CACHE_TTL_ENV, "900"))
+
+# Student fields the recommenders score on
+PROFILE_FIELDS = ("skills", "interests", "location")
+
+
+def profile_version(student: Dict[str, Any]) -> str:
+    """Digest of the student's scoring fields."""
+    fields = {field: student.get(field) for field in PROFILE_FIELDS}
+    encoded = json.dumps(fields, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("key", "limit", "recommendations", "expires_at")
+
+    def __init__(self, key: Tuple[str, int], limit: int,
+                 recommendations: List[RecommendationResponse], expires_at: float):
+        self.key = key
+        self.limit = limit
+        self.recommendations = recommendations
+        self.expires_at = expires_at
+
+
+class RecommendationCache:
+    """LRU + TTL cache of recommendation lists, one entry per student."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl_seconds: float = TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        student: Dict[str, Any],
+        catalogue_version: int,
+        limit: int
+    ) -> Optional[List[RecommendationResponse]]:
+        """Cached top `limit` recommendations, or None on a miss."""
+        key = (profile_version(student), catalogue_version)
+        with self._lock:
+            entry = self._entries.get(student["id"])
+            # a list cut at a larger limit also answers smaller ones
+            if (
+                entry is None
+                or entry.key != key
+                or entry.limit < limit
+                or entry.expires_at <= time.monotonic()
+            ):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(student["id"])
+            self.hits += 1
+            return entry.recommendations[:limit]
+
+    def put(
+        self,
+        student: Dict[str, Any],
+        catalogue_version: int,
+        limit: int,
+        recommendations: List[RecommendationResponse]
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        entry = _Entry(
+            (profile_version(student), catalogue_version),
+            limit,
+            list(recommendations),
+            time.monotonic() + self.ttl_seconds
+        )
+        with self._lock:
+            self._entries[student["id"]] = entry
+            self._entries.move_to_end(student["id"])
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_student(self, student_id: int) -> None:
+        with self._lock:
+            self._entries.pop(student_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Shared cache for the application
+RECOMMENDATION_CACHE = RecommendationCache()
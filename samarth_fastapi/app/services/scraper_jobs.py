@@ -0,0 +1,230 @@
+"""
+Scraper Jobs Service - Runs the external scraper in the background.
+
+The scraper runs as a subprocess without blocking the event loop. Its
+"[PROGRESS] {...}" output lines are parsed into per-source progress, and
+once it finishes the scraped records are imported into the catalogue.
+Each run writes gzipped NDJSON (one record per line) to its own file, which
+is imported and paged through in chunks so memory stays bounded however
+large the catalogue grows.
+Only one run happens at a time per worker: triggering while a run is in
+progress returns the running job (requests are coalesced).
+Runs still in progress at shutdown are cancelled: the scraper process is
+killed and the job is marked "cancelled".
+
+Job state (and each run's output file) lives in the process that started the
+run, so the scraper routes are single-worker: with several workers, a status
+or results request that lands on another worker gets a 404, and two workers
+can run the scraper at once. Run the scraper routes on one worker.
+The imported internships themselves go to the shared store, and the
+catalogue version is bumped once, after the last chunk.
+"""
+import asyncio
+import gzip
+import json
+import os
+import sys
+import uuid
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.services.catalogue import import_scraped_internships, publish_catalogue_writes
+
+# the repository's Scraper/, wherever the app is started from
+SCRAPER_DIR = os.getenv(
+    "SAMARTH_SCRAPER_DIR",
+    str(Path(__file__).resolve().parents[3] / "Scraper")
+)
+SCRAPER_SCRIPT = "main.py"
+
+# Per-run output files (gzipped NDJSON), kept while the job is kept
+RUNS_DIR = os.path.join(SCRAPER_DIR, "data", "runs")
+
+# Records read and imported per step
+IMPORT_CHUNK_SIZE = 1000
+
+PROGRESS_PREFIX = "[PROGRESS] "
+
+# Finished jobs kept for status/result lookups
+MAX_FINISHED_JOBS = 20
+
+# Lines of scraper output kept per job for troubleshooting
+MAX_LOG_LINES = 200
+
+
+class ScraperJob:
+    """State of one scraper run."""
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = "running"  # "running", "succeeded", "failed" or "cancelled"
+        self.started_at = datetime.now()
+        self.finished_at: Optional[datetime] = None
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        self.record_count: Optional[int] = None
+        self.imported_count: Optional[int] = None
+        self.error: Optional[str] = None
+        self.log: List[str] = []
+        self.output_path = os.path.abspath(os.path.join(RUNS_DIR, f"{self.id}.ndjson.gz"))
+        self.delta_path = os.path.abspath(os.path.join(RUNS_DIR, f"{self.id}.delta.ndjson.gz"))
+
+    @property
+    def duration_seconds(self) -> float:
+        end = self.finished_at or datetime.now()
+        return round((end - self.started_at).total_seconds(), 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_seconds": self.duration_seconds,
+            "sources": self.sources,
+            "record_count": self.record_count,
+            "imported_count": self.imported_count,
+            "error": self.error
+        }
+
+
+def _open_ndjson(path: str) -> IO[str]:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _read_chunk(f: IO[str], size: int) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in islice(f, size) if line.strip()]
+
+
+def read_results_page(path: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+    """Read records [offset, offset + limit) of an NDJSON file without loading the rest."""
+    with _open_ndjson(path) as f:
+        # skipped lines are not decoded
+        for _ in islice(f, offset):
+            pass
+        return _read_chunk(f, limit)
+
+
+class ScraperJobManager:
+    """Starts scraper runs, coalesces concurrent triggers and tracks job state."""
+
+    def __init__(self):
+        self.jobs: Dict[str, ScraperJob] = {}
+        self.current: Optional[ScraperJob] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def start(self) -> Tuple[ScraperJob, bool]:
+        """
+        Start a scraper run, or join the one already running.
+
+        Returns:
+            Tuple of (job, coalesced) where coalesced is True if an existing
+            run was returned instead of starting a new one
+        """
+        if self.current is not None and self.current.status == "running":
+            return self.current, True
+
+        job = ScraperJob()
+        self.jobs[job.id] = job
+        self.current = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job))
+        self._prune()
+        return job, False
+
+    def get(self, job_id: str) -> Optional[ScraperJob]:
+        return self.jobs.get(job_id)
+
+    def _prune(self) -> None:
+        finished = [job for job in self.jobs.values() if job.status != "running"]
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job.id]
+            for path in (job.output_path, job.delta_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _handle_line(self, job: ScraperJob, line: str) -> None:
+        if line.startswith(PROGRESS_PREFIX):
+            try:
+                progress = json.loads(line[len(PROGRESS_PREFIX):])
+            except json.JSONDecodeError:
+                return
+            source = progress.pop("source", "unknown")
+            job.sources.setdefault(source, {}).update(progress)
+            return
+        job.log.append(line)
+        if len(job.log) > MAX_LOG_LINES:
+            del job.log[0]
+
+    async def stop(self) -> None:
+        """Cancel the runs still in progress (application shutdown) and wait for them."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self, job: ScraperJob) -> None:
+        process = None
+        try:
+            os.makedirs(RUNS_DIR, exist_ok=True)
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, SCRAPER_SCRIPT,
+                "--format", "ndjson",
+                "--output", job.output_path,
+                "--delta-output", job.delta_path,
+                cwd=SCRAPER_DIR,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
+            )
+            async for raw_line in process.stdout:
+                self._handle_line(job, raw_line.decode("utf-8", errors="replace").rstrip())
+            return_code = await process.wait()
+            if return_code != 0:
+                raise RuntimeError(f"Scraper exited with code {return_code}")
+
+            if not os.path.exists(job.output_path):
+                raise RuntimeError("Scraper output not found")
+
+            await self._import(job)
+            job.status = "succeeded"
+        except asyncio.CancelledError:
+            # the job must not stay "running" forever, or new triggers would
+            # keep joining it; the scraper process is not left behind either
+            job.status = "cancelled"
+            job.error = "Scraper run was cancelled"
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e) or e.__class__.__name__
+        finally:
+            job.finished_at = datetime.now()
+            self._tasks.pop(job.id, None)
+
+    async def _import(self, job: ScraperJob) -> None:
+        """Import the run's output chunk by chunk, publishing the catalogue once."""
+        job.record_count = 0
+        job.imported_count = 0
+        f = await run_in_threadpool(_open_ndjson, job.output_path)
+        try:
+            while True:
+                chunk = await run_in_threadpool(_read_chunk, f, IMPORT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                job.record_count += len(chunk)
+                job.imported_count += await import_scraped_internships(chunk, publish=False)
+        finally:
+            f.close()
+            # also after a failed chunk, so rows already written become visible
+            if job.imported_count:
+                await publish_catalogue_writes()
+
+
+# Shared manager for the application
+SCRAPER_JOBS = ScraperJobManager()
@@ -0,0 +1,226 @@
+"""
+Search Index Service - In-process inverted index for internship search.
+
+Keeps token, location and skill postings lists so that
+/student/internships/search never has to scan the whole catalogue.
+"""
+import re
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Ranking weights for a keyword token hit
+TITLE_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 1.0
+SKILL_WEIGHT = 2.0
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+class _Postings:
+    """Term -> set of internship IDs, with a sorted vocabulary for prefix lookups."""
+
+    def __init__(self):
+        self.postings: Dict[str, Set[int]] = {}
+        self.terms: List[str] = []
+
+    def add(self, term: str, doc_id: int) -> None:
+        ids = self.postings.get(term)
+        if ids is None:
+            ids = self.postings[term] = set()
+            insort(self.terms, term)
+        ids.add(doc_id)
+
+    def remove(self, term: str, doc_id: int) -> None:
+        ids = self.postings.get(term)
+        if ids is None:
+            return
+        ids.discard(doc_id)
+        if not ids:
+            del self.postings[term]
+            pos = bisect_left(self.terms, term)
+            if pos < len(self.terms) and self.terms[pos] == term:
+                del self.terms[pos]
+
+    def exact(self, term: str) -> Set[int]:
+        return self.postings.get(term, set())
+
+    def prefix(self, prefix: str) -> Set[int]:
+        """Union of postings for every term starting with `prefix`."""
+        result: Set[int] = set()
+        pos = bisect_left(self.terms, prefix)
+        while pos < len(self.terms) and self.terms[pos].startswith(prefix):
+            result |= self.postings[self.terms[pos]]
+            pos += 1
+        return result
+
+    def clear(self) -> None:
+        self.postings.clear()
+        self.terms.clear()
+
+
+class InternshipSearchIndex:
+    """
+    Inverted index over internships.
+
+    Text is split into lowercase alphanumeric words. Every keyword word must
+    be the start of some word of the title or description, and every
+    location word the start of some location word (AND), so "data sci"
+    matches "Data Science" but "ata" does not match "Data" - unlike the
+    substring scan this replaced. Skills match whole skill names, case
+    insensitively, and any of them is enough (OR).
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._title = _Postings()
+        self._description = _Postings()
+        self._location = _Postings()
+        self._skills = _Postings()
+        # Per-document terms, kept so a document can be removed or re-indexed
+        self._doc_terms: Dict[int, Tuple[Set[str], Set[str], Set[str], Set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def add(self, internship: Dict[str, Any]) -> None:
+        """Index (or re-index) a single internship."""
+        doc_id = internship["id"]
+        title_terms = set(tokenize(internship.get("title")))
+        description_terms = set(tokenize(internship.get("description")))
+        location_terms = set(tokenize(internship.get("location")))
+        skill_terms = {
+            skill.strip().lower()
+            for skill in internship.get("skills_required") or []
+            if skill and skill.strip()
+        }
+
+        with self._lock:
+            self._remove_locked(doc_id)
+            for term in title_terms:
+                self._title.add(term, doc_id)
+            for term in description_terms:
+                self._description.add(term, doc_id)
+            for term in location_terms:
+                self._location.add(term, doc_id)
+            for term in skill_terms:
+                self._skills.add(term, doc_id)
+            self._doc_terms[doc_id] = (title_terms, description_terms, location_terms, skill_terms)
+
+    def add_many(self, internships: Iterable[Dict[str, Any]]) -> None:
+        """Index a batch of internships."""
+        for internship in internships:
+            self.add(internship)
+
+    def remove(self, internship_id: int) -> None:
+        """Drop an internship from the index."""
+        with self._lock:
+            self._remove_locked(internship_id)
+
+    def rebuild(self, internships: Iterable[Dict[str, Any]]) -> None:
+        """Discard the current index and rebuild it from scratch."""
+        with self._lock:
+            for postings in (self._title, self._description, self._location, self._skills):
+                postings.clear()
+            self._doc_terms.clear()
+            self.add_many(internships)
+
+    def _remove_locked(self, doc_id: int) -> None:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        title_terms, description_terms, location_terms, skill_terms = terms
+        for term in title_terms:
+            self._title.remove(term, doc_id)
+        for term in description_terms:
+            self._description.remove(term, doc_id)
+        for term in location_terms:
+            self._location.remove(term, doc_id)
+        for term in skill_terms:
+            self._skills.remove(term, doc_id)
+
+    def search(
+        self,
+        keyword: Optional[str] = None,
+        location: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> Tuple[List[int], int]:
+        """
+        Search the index.
+
+        Args:
+            keyword: Free text matched against title and description
+            location: Free text matched against location
+            skills: Skill names, any of which may match
+            offset: Number of ranked results to skip
+            limit: Maximum number of IDs to return (None for all)
+
+        Returns:
+            Tuple of (ranked internship IDs for the requested page, total matches)
+        """
+        keyword_terms = tokenize(keyword)
+        location_terms = tokenize(location)
+        skill_terms = [s.strip().lower() for s in skills or [] if s and s.strip()]
+
+        with self._lock:
+            candidates: Optional[Set[int]] = None
+            scores: Dict[int, float] = {}
+
+            # Postings lists are intersected smallest-first to keep sets small
+            term_hits: List[Tuple[Set[int], Set[int]]] = []
+            for term in keyword_terms:
+                title_hits = self._title.prefix(term)
+                description_hits = self._description.prefix(term)
+                term_hits.append((title_hits, description_hits))
+            term_hits.sort(key=lambda hits: len(hits[0]) + len(hits[1]))
+
+            for title_hits, description_hits in term_hits:
+                matched = title_hits | description_hits
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return [], 0
+
+            for term in location_terms:
+                matched = self._location.prefix(term)
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return [], 0
+
+            skill_hits: Dict[int, int] = {}
+            if skill_terms:
+                for term in skill_terms:
+                    for doc_id in self._skills.exact(term):
+                        skill_hits[doc_id] = skill_hits.get(doc_id, 0) + 1
+                matched = set(skill_hits)
+                candidates = matched if candidates is None else candidates & matched
+
+            if candidates is None:
+                candidates = set(self._doc_terms)
+
+            for doc_id in candidates:
+                score = SKILL_WEIGHT * skill_hits.get(doc_id, 0)
+                for title_hits, description_hits in term_hits:
+                    if doc_id in title_hits:
+                        score += TITLE_WEIGHT
+                    if doc_id in description_hits:
+                        score += DESCRIPTION_WEIGHT
+                scores[doc_id] = score
+
+        # Highest score first, then oldest internship first for stable pages
+        ranked = sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id))
+        total = len(ranked)
+        end = None if limit is None else offset + limit
+        return ranked[offset:end], total
+
+
+# Shared index instance for the application
+SEARCH_INDEX = InternshipSearchIndex()
@@ -0,0 +1,58 @@
+"""
+Summary Stream Service - Server-Sent Events for the admin dashboard.
+
+Writes that change the dashboard counters call notify_summary_changed(),
+which wakes every open stream in this worker. Streams also re-read the
+counters every `poll_interval` seconds so changes made by other workers
+(sharing a database) are still pushed.
+"""
+import asyncio
+import json
+from typing import AsyncIterator, Callable, Awaitable, Optional, Set
+
+from app.storage import get_store
+
+# Seconds between re-reads when nothing changed locally (also the keep-alive period)
+DEFAULT_POLL_INTERVAL = 5.0
+
+_waiters: Set[asyncio.Event] = set()
+
+
+def notify_summary_changed() -> None:
+    """Wake up all summary streams in this worker."""
+    for waiter in _waiters:
+        waiter.set()
+
+
+def format_sse(data: dict, event: Optional[str] = None) -> str:
+    """Format one Server-Sent Event."""
+    message = f"event: {event}\n" if event else ""
+    return message + f"data: {json.dumps(data)}\n\n"
+
+
+async def summary_events(
+    is_disconnected: Callable[[], Awaitable[bool]],
+    poll_interval: float = DEFAULT_POLL_INTERVAL
+) -> AsyncIterator[str]:
+    """
+    Yield a "summary" event with the current counters, then one more every
+    time they change, until the client disconnects.
+    """
+    waiter = asyncio.Event()
+    _waiters.add(waiter)
+    last_summary = None
+    try:
+        while not await is_disconnected():
+            waiter.clear()
+            summary = await get_store().summary()
+            if summary != last_summary:
+                last_summary = summary
+                yield format_sse(summary, event="summary")
+
+            try:
+                await asyncio.wait_for(waiter.wait(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                # SSE comment line keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+    finally:
+        _waiters.discard(waiter)
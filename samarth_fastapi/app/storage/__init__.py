@@ -0,0 +1,72 @@
+"""
+Storage package - pluggable persistence backends.
+
+The backend is chosen by the SAMARTH_DATABASE_URL environment variable:
+- unset or "memory://"                → in-memory dictionaries (single worker only)
+- "sqlite+aiosqlite:///./samarth.db"  → SQLite via SQLAlchemy (shared by all workers)
+- "postgresql+asyncpg://..."          → PostgreSQL via SQLAlchemy
+"""
+import os
+from typing import Optional
+
+from app.storage.base import DuplicateKeyError, Store
+from app.storage.memory import MemoryStore
+
+DATABASE_URL_ENV = "SAMARTH_DATABASE_URL"
+POOL_SIZE_ENV = "SAMARTH_DB_POOL_SIZE"
+
+_store: Optional[Store] = None
+
+
+def create_store(url: Optional[str] = None) -> Store:
+    """Create a store for the given database URL (defaults to the environment)."""
+    url = url if url is not None else os.getenv(DATABASE_URL_ENV, "memory://")
+    if not url or url.startswith("memory"):
+        return MemoryStore()
+
+    # Imported lazily so the in-memory backend works without SQLAlchemy installed
+    from app.storage.sql import SQLAlchemyStore
+
+    pool_size = int(os.getenv(POOL_SIZE_ENV, "5"))
+    return SQLAlchemyStore(url, pool_size=pool_size)
+
+
+def get_store() -> Store:
+    """Return the application's store, creating it on first use."""
+    global _store
+    if _store is None:
+        _store = create_store()
+    return _store
+
+
+def set_store(store: Store) -> None:
+    """Replace the application's store (useful for scripts and benchmarks)."""
+    global _store
+    _store = store
+
+
+async def init_store() -> Store:
+    """Connect the application's store."""
+    store = get_store()
+    await store.connect()
+    return store
+
+
+async def close_store() -> None:
+    """Close the application's store."""
+    global _store
+    if _store is not None:
+        await _store.close()
+        _store = None
+
+
+__all__ = [
+    "DuplicateKeyError",
+    "Store",
+    "MemoryStore",
+    "create_store",
+    "get_store",
+    "set_store",
+    "init_store",
+    "close_store",
+]
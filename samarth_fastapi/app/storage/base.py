@@ -0,0 +1,153 @@
+"""
+Storage interface shared by all backends.
+
+Records are plain dictionaries with the same keys the routes have always
+used (e.g. students have "id", "email", "password", "skills", ...).
+Methods returning a record return a copy; callers persist changes through
+the update methods instead of mutating the returned dictionary.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class DuplicateKeyError(Exception):
+    """Raised when a write would violate a unique key (e.g. email, student+internship)."""
+
+
+class Store(ABC):
+    """Abstract repository for students, admins, internships, applications, allocations and tokens."""
+
+    async def connect(self) -> None:
+        """Prepare the backend (create tables, open pools). Safe to call more than once."""
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+    # Students
+    @abstractmethod
+    async def get_student(self, student_id: int) -> Optional[Dict[str, Any]]:
+        """Get a student by ID."""
+
+    @abstractmethod
+    async def get_student_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Get a student by email."""
+
+    @abstractmethod
+    async def create_student(self, student: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a student and return it with its assigned ID (DuplicateKeyError if the email exists)."""
+
+    @abstractmethod
+    async def update_student(self, student_id: int, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Update the given fields of a student and return the updated record."""
+
+    # Admins
+    @abstractmethod
+    async def get_admin(self, admin_id: int) -> Optional[Dict[str, Any]]:
+        """Get an admin by ID."""
+
+    @abstractmethod
+    async def get_admin_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Get an admin by email."""
+
+    @abstractmethod
+    async def upsert_admin(self, admin: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert or replace an admin (keyed by ID)."""
+
+    # Internships
+    @abstractmethod
+    async def get_internship(self, internship_id: int) -> Optional[Dict[str, Any]]:
+        """Get an internship by ID."""
+
+    @abstractmethod
+    async def list_internships(self) -> List[Dict[str, Any]]:
+        """List all internships in ID order."""
+
+    @abstractmethod
+    async def create_internship(self, internship: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert an internship and return it with its assigned ID."""
+
+    @abstractmethod
+    async def upsert_internships(
+        self,
+        internships: List[Dict[str, Any]],
+        bump_version: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Bulk insert-or-update internships.
+
+        Records with an "external_key" are matched on it, other records on
+        "id". Existing rows keep their ID and created_at. With bump_version
+        False the catalogue version is left alone; the caller bumps it once
+        with bump_catalogue_version() after its last batch.
+
+        Returns:
+            The stored records, in input order
+        """
+
+    @abstractmethod
+    async def catalogue_version(self) -> int:
+        """Counter incremented by every internship write."""
+
+    @abstractmethod
+    async def bump_catalogue_version(self) -> int:
+        """Increment the catalogue version and return the new value."""
+
+    # Applications
+    @abstractmethod
+    async def get_application(self, application_id: int) -> Optional[Dict[str, Any]]:
+        """Get an application by ID."""
+
+    @abstractmethod
+    async def find_application(self, student_id: int, internship_id: int) -> Optional[Dict[str, Any]]:
+        """Get a student's application for an internship, if any."""
+
+    @abstractmethod
+    async def list_applications(self) -> List[Dict[str, Any]]:
+        """List all applications in ID order."""
+
+    @abstractmethod
+    async def create_application(self, application: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Insert an application and return it with its assigned ID
+        (DuplicateKeyError if the student already applied to the internship).
+        """
+
+    # Allocations
+    @abstractmethod
+    async def get_allocation_by_application(self, application_id: int) -> Optional[Dict[str, Any]]:
+        """Get the allocation made for an application, if any."""
+
+    @abstractmethod
+    async def list_allocations(self) -> List[Dict[str, Any]]:
+        """List all allocations in ID order."""
+
+    @abstractmethod
+    async def create_allocation(self, allocation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Insert an allocation and mark its application as "allocated",
+        atomically. Returns the allocation with its assigned ID
+        (DuplicateKeyError if the application is already allocated).
+        """
+
+    # Dashboard
+    @abstractmethod
+    async def summary(self) -> Dict[str, Any]:
+        """
+        Dashboard totals read from counters maintained on every write.
+
+        Keys: total_submissions, total_allocations, total_interns,
+        pending_applications and applications_by_status (status -> count).
+        """
+
+    @abstractmethod
+    async def internship_counts(self, internship_id: int) -> Dict[str, int]:
+        """Counters for one internship, with keys applications and allocations."""
+
+    # Tokens
+    @abstractmethod
+    async def save_token(self, token: str, info: Dict[str, Any]) -> None:
+        """Store token -> user info."""
+
+    @abstractmethod
+    async def get_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """Look up the user info stored for a token."""
@@ -0,0 +1,233 @@
+"""
+In-memory storage backend.
+
+Process-local dictionaries, like the original dummy storage, plus
+monotonically increasing ID counters, secondary indexes and dashboard
+counters so every route-level lookup is O(1) regardless of how many rows
+exist.
+Data is lost on restart and is not shared between workers.
+"""
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.storage.base import DuplicateKeyError, Store
+
+
+class MemoryStore(Store):
+    """Store backed by process-local dictionaries."""
+
+    def __init__(self):
+        self.students: Dict[int, Dict[str, Any]] = {}
+        self.admins: Dict[int, Dict[str, Any]] = {}
+        self.internships: Dict[int, Dict[str, Any]] = {}
+        self.applications: Dict[int, Dict[str, Any]] = {}
+        self.allocations: Dict[int, Dict[str, Any]] = {}
+        self.tokens: Dict[str, Dict[str, Any]] = {}
+        self._catalogue_version = 0
+
+        # Next ID per collection (never reused, like a database sequence)
+        self._next_ids: Dict[str, int] = {
+            "students": 1,
+            "admins": 1,
+            "internships": 1,
+            "applications": 1,
+            "allocations": 1,
+        }
+
+        # Secondary indexes
+        self._student_ids_by_email: Dict[str, int] = {}
+        self._admin_ids_by_email: Dict[str, int] = {}
+        self._internship_ids_by_external_key: Dict[str, int] = {}
+        self._application_ids_by_pair: Dict[Tuple[int, int], int] = {}
+        self._allocation_ids_by_application: Dict[int, int] = {}
+
+        # Dashboard counters, updated together with the rows they count
+        self._applications_by_status: Counter = Counter()
+        self._applications_by_internship: Counter = Counter()
+        self._allocations_by_internship: Counter = Counter()
+        self._allocations_by_student: Counter = Counter()
+
+    @staticmethod
+    def _copy(record: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return dict(record) if record is not None else None
+
+    def _allocate_id(self, collection: str) -> int:
+        new_id = self._next_ids[collection]
+        self._next_ids[collection] = new_id + 1
+        return new_id
+
+    def _reserve_id(self, collection: str, used_id: int) -> None:
+        """Make sure an explicitly supplied ID is never handed out again."""
+        if used_id >= self._next_ids[collection]:
+            self._next_ids[collection] = used_id + 1
+
+    # Students
+    async def get_student(self, student_id: int) -> Optional[Dict[str, Any]]:
+        return self._copy(self.students.get(student_id))
+
+    async def get_student_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        student_id = self._student_ids_by_email.get(email)
+        return self._copy(self.students.get(student_id)) if student_id is not None else None
+
+    async def create_student(self, student: Dict[str, Any]) -> Dict[str, Any]:
+        if student["email"] in self._student_ids_by_email:
+            raise DuplicateKeyError("Email already registered")
+        student_id = self._allocate_id("students")
+        self.students[student_id] = {**student, "id": student_id}
+        self._student_ids_by_email[student["email"]] = student_id
+        return self._copy(self.students[student_id])
+
+    async def update_student(self, student_id: int, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        student = self.students.get(student_id)
+        if student is None:
+            return None
+        new_email = fields.get("email")
+        if new_email is not None and new_email != student["email"]:
+            if new_email in self._student_ids_by_email:
+                raise DuplicateKeyError("Email already registered")
+            del self._student_ids_by_email[student["email"]]
+            self._student_ids_by_email[new_email] = student_id
+        student.update(fields)
+        return self._copy(student)
+
+    # Admins
+    async def get_admin(self, admin_id: int) -> Optional[Dict[str, Any]]:
+        return self._copy(self.admins.get(admin_id))
+
+    async def get_admin_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        admin_id = self._admin_ids_by_email.get(email)
+        return self._copy(self.admins.get(admin_id)) if admin_id is not None else None
+
+    async def upsert_admin(self, admin: Dict[str, Any]) -> Dict[str, Any]:
+        previous = self.admins.get(admin["id"])
+        if previous is not None:
+            self._admin_ids_by_email.pop(previous["email"], None)
+        self.admins[admin["id"]] = dict(admin)
+        self._admin_ids_by_email[admin["email"]] = admin["id"]
+        self._reserve_id("admins", admin["id"])
+        return self._copy(admin)
+
+    # Internships
+    async def get_internship(self, internship_id: int) -> Optional[Dict[str, Any]]:
+        return self._copy(self.internships.get(internship_id))
+
+    async def list_internships(self) -> List[Dict[str, Any]]:
+        return [dict(internship) for internship in self.internships.values()]
+
+    async def create_internship(self, internship: Dict[str, Any]) -> Dict[str, Any]:
+        internship_id = self._allocate_id("internships")
+        self.internships[internship_id] = {**internship, "id": internship_id}
+        if internship.get("external_key"):
+            self._internship_ids_by_external_key[internship["external_key"]] = internship_id
+        self._catalogue_version += 1
+        return self._copy(self.internships[internship_id])
+
+    async def upsert_internships(
+        self,
+        internships: List[Dict[str, Any]],
+        bump_version: bool = True
+    ) -> List[Dict[str, Any]]:
+        stored = []
+        for internship in internships:
+            external_key = internship.get("external_key")
+            if external_key:
+                internship_id = self._internship_ids_by_external_key.get(external_key)
+            else:
+                internship_id = internship.get("id")
+            if internship_id is None:
+                internship_id = self._allocate_id("internships")
+            else:
+                self._reserve_id("internships", internship_id)
+
+            record = {**internship, "id": internship_id}
+            previous = self.internships.get(internship_id)
+            if previous:
+                record["created_at"] = previous["created_at"]
+            self.internships[internship_id] = record
+            if external_key:
+                self._internship_ids_by_external_key[external_key] = internship_id
+            stored.append(dict(record))
+
+        if stored and bump_version:
+            self._catalogue_version += 1
+        return stored
+
+    async def catalogue_version(self) -> int:
+        return self._catalogue_version
+
+    async def bump_catalogue_version(self) -> int:
+        self._catalogue_version += 1
+        return self._catalogue_version
+
+    # Applications
+    async def get_application(self, application_id: int) -> Optional[Dict[str, Any]]:
+        return self._copy(self.applications.get(application_id))
+
+    async def find_application(self, student_id: int, internship_id: int) -> Optional[Dict[str, Any]]:
+        application_id = self._application_ids_by_pair.get((student_id, internship_id))
+        return self._copy(self.applications.get(application_id)) if application_id is not None else None
+
+    async def list_applications(self) -> List[Dict[str, Any]]:
+        return [dict(application) for application in self.applications.values()]
+
+    async def create_application(self, application: Dict[str, Any]) -> Dict[str, Any]:
+        pair = (application["student_id"], application["internship_id"])
+        if pair in self._application_ids_by_pair:
+            raise DuplicateKeyError("Already applied for this internship")
+        application_id = self._allocate_id("applications")
+        self.applications[application_id] = {**application, "id": application_id}
+        self._application_ids_by_pair[pair] = application_id
+        self._applications_by_status[application["status"]] += 1
+        self._applications_by_internship[application["internship_id"]] += 1
+        return self._copy(self.applications[application_id])
+
+    # Allocations
+    async def get_allocation_by_application(self, application_id: int) -> Optional[Dict[str, Any]]:
+        allocation_id = self._allocation_ids_by_application.get(application_id)
+        return self._copy(self.allocations.get(allocation_id)) if allocation_id is not None else None
+
+    async def list_allocations(self) -> List[Dict[str, Any]]:
+        return [dict(allocation) for allocation in self.allocations.values()]
+
+    async def create_allocation(self, allocation: Dict[str, Any]) -> Dict[str, Any]:
+        application_id = allocation["application_id"]
+        if application_id in self._allocation_ids_by_application:
+            raise DuplicateKeyError("Application already allocated")
+        allocation_id = self._allocate_id("allocations")
+        self.allocations[allocation_id] = {**allocation, "id": allocation_id}
+        self._allocation_ids_by_application[application_id] = allocation_id
+        self._allocations_by_internship[allocation["internship_id"]] += 1
+        self._allocations_by_student[allocation["student_id"]] += 1
+        application = self.applications.get(application_id)
+        if application is not None:
+            self._applications_by_status[application["status"]] -= 1
+            self._applications_by_status["allocated"] += 1
+            application["status"] = "allocated"
+        return self._copy(self.allocations[allocation_id])
+
+    # Dashboard
+    async def summary(self) -> Dict[str, Any]:
+        return {
+            "total_submissions": len(self.applications),
+            "total_allocations": len(self.allocations),
+            "total_interns": len(self._allocations_by_student),
+            "pending_applications": self._applications_by_status["pending"],
+            "applications_by_status": {
+                status: count
+                for status, count in self._applications_by_status.items()
+                if count
+            }
+        }
+
+    async def internship_counts(self, internship_id: int) -> Dict[str, int]:
+        return {
+            "applications": self._applications_by_internship[internship_id],
+            "allocations": self._allocations_by_internship[internship_id]
+        }
+
+    # Tokens
+    async def save_token(self, token: str, info: Dict[str, Any]) -> None:
+        self.tokens[token] = dict(info)
+
+    async def get_token(self, token: str) -> Optional[Dict[str, Any]]:
+        return self._copy(self.tokens.get(token))
@@ -0,0 +1,564 @@
+"""
+SQLAlchemy (async) storage backend.
+
+Works with SQLite through aiosqlite (e.g. sqlite+aiosqlite:///./samarth.db)
+and with PostgreSQL through asyncpg. All workers pointing at the same
+database share state, and data survives restarts.
+"""
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    event,
+    func,
+    select,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.storage.base import DuplicateKeyError, Store
+
+# Rows per statement for bulk upserts (keeps SQLite under its variable limit)
+UPSERT_CHUNK_SIZE = 500
+
+CATALOGUE_VERSION_KEY = "catalogue_version"
+COUNTERS_BUILT_KEY = "counters_built"
+
+# Dashboard counter names (per-status/internship/student counters are prefixed)
+SUBMISSIONS_COUNTER = "submissions"
+ALLOCATIONS_COUNTER = "allocations"
+INTERNS_COUNTER = "interns"
+STATUS_COUNTER_PREFIX = "status:"
+INTERNSHIP_APPLICATIONS_PREFIX = "internship_applications:"
+INTERNSHIP_ALLOCATIONS_PREFIX = "internship_allocations:"
+STUDENT_ALLOCATIONS_PREFIX = "student_allocations:"
+
+metadata = MetaData()
+
+students_table = Table(
+    "students",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("email", String(320), nullable=False),
+    Column("password", String(255), nullable=False),
+    Column("full_name", String(255), nullable=False),
+    Column("phone", String(32)),
+    Column("skills", JSON, nullable=False),
+    Column("interests", JSON, nullable=False),
+    Column("location", String(255)),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_students_email", "email", unique=True),
+)
+
+admins_table = Table(
+    "admins",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("email", String(320), nullable=False),
+    Column("password", String(255), nullable=False),
+    Column("full_name", String(255), nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_admins_email", "email", unique=True),
+)
+
+internships_table = Table(
+    "internships",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("title", Text, nullable=False),
+    Column("description", Text, nullable=False),
+    Column("skills_required", JSON, nullable=False),
+    Column("location", String(255), nullable=False),
+    Column("source", String(32), nullable=False),
+    Column("apply_url", Text),
+    Column("admin_can_apply", Boolean, nullable=False),
+    Column("external_key", Text),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_internships_external_key", "external_key", unique=True),
+)
+
+applications_table = Table(
+    "applications",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("student_id", Integer, nullable=False),
+    Column("student_name", String(255), nullable=False),
+    Column("student_email", String(320), nullable=False),
+    Column("internship_id", Integer, nullable=False),
+    Column("internship_title", Text, nullable=False),
+    Column("status", String(32), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+    Index("ix_applications_student_internship", "student_id", "internship_id", unique=True),
+    Index("ix_applications_internship_id", "internship_id"),
+    Index("ix_applications_status", "status"),
+)
+
+allocations_table = Table(
+    "allocations",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("application_id", Integer, nullable=False),
+    Column("student_id", Integer, nullable=False),
+    Column("student_name", String(255), nullable=False),
+    Column("internship_id", Integer, nullable=False),
+    Column("internship_title", Text, nullable=False),
+    Column("status", String(32), nullable=False),
+    Column("allocated_at", DateTime, nullable=False),
+    Index("ix_allocations_application_id", "application_id", unique=True),
+    Index("ix_allocations_student_id", "student_id"),
+    Index("ix_allocations_internship_id", "internship_id"),
+)
+
+tokens_table = Table(
+    "tokens",
+    metadata,
+    Column("token", String(64), primary_key=True),
+    Column("user_id", Integer, nullable=False),
+    Column("user_type", String(16), nullable=False),
+    Column("email", String(320), nullable=False),
+)
+
+meta_table = Table(
+    "meta",
+    metadata,
+    Column("key", String(64), primary_key=True),
+    Column("value", Integer, nullable=False),
+)
+
+
+counters_table = Table(
+    "counters",
+    metadata,
+    Column("name", String(128), primary_key=True),
+    Column("value", Integer, nullable=False),
+)
+
+
+def _row_to_dict(row) -> Optional[Dict[str, Any]]:
+    return dict(row._mapping) if row is not None else None
+
+
+class SQLAlchemyStore(Store):
+    """Store backed by an async SQLAlchemy engine with a connection pool."""
+
+    def __init__(self, url: str, pool_size: int = 5, max_overflow: int = 10, echo: bool = False):
+        self.url = url
+        engine_kwargs: Dict[str, Any] = {"echo": echo, "pool_pre_ping": True}
+        is_sqlite = url.startswith("sqlite")
+        if is_sqlite:
+            engine_kwargs["connect_args"] = {"timeout": 30}
+        if not (is_sqlite and ":memory:" in url):
+            engine_kwargs["pool_size"] = pool_size
+            engine_kwargs["max_overflow"] = max_overflow
+
+        self.engine = create_async_engine(url, **engine_kwargs)
+        self.dialect = self.engine.dialect.name
+
+        if is_sqlite:
+            @event.listens_for(self.engine.sync_engine, "connect")
+            def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                cursor = dbapi_connection.cursor()
+                # WAL lets several workers read while one writes
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.close()
+
+    async def connect(self) -> None:
+        async with self.engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+            # Several workers may connect at once: the meta rows are created
+            # with ON CONFLICT DO NOTHING instead of select-then-insert
+            await conn.execute(
+                self._insert(meta_table)
+                .values(key=CATALOGUE_VERSION_KEY, value=0)
+                .on_conflict_do_nothing(index_elements=["key"])
+            )
+            claimed = await conn.execute(
+                self._insert(meta_table)
+                .values(key=COUNTERS_BUILT_KEY, value=1)
+                .on_conflict_do_nothing(index_elements=["key"])
+                .returning(meta_table.c.key)
+            )
+            if claimed.first() is not None:
+                # Databases created before counters existed: derive them once.
+                # Only the worker whose insert claimed the flag rebuilds; the
+                # others wait on that row until the rebuild has committed.
+                await self._rebuild_counters(conn)
+
+    async def close(self) -> None:
+        await self.engine.dispose()
+
+    def _insert(self, table: Table):
+        """Dialect-specific INSERT supporting ON CONFLICT."""
+        if self.dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        return insert(table)
+
+    async def _fetch_one(self, statement) -> Optional[Dict[str, Any]]:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(statement)
+            return _row_to_dict(result.first())
+
+    async def _fetch_all(self, statement) -> List[Dict[str, Any]]:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(statement)
+            return [dict(row._mapping) for row in result]
+
+    async def _insert_returning(self, table: Table, record: Dict[str, Any]) -> Dict[str, Any]:
+        values = {key: value for key, value in record.items() if key != "id" and key in table.c}
+        try:
+            async with self.engine.begin() as conn:
+                result = await conn.execute(table.insert().values(**values))
+                new_id = result.inserted_primary_key[0]
+                if table is internships_table:
+                    await self._bump_catalogue_version(conn)
+        except IntegrityError as e:
+            raise DuplicateKeyError(f"Duplicate {table.name} record") from e
+        return {**values, "id": new_id}
+
+    async def _increment(self, conn: AsyncConnection, name: str, delta: int = 1) -> int:
+        """Atomically add `delta` to a counter (creating it) and return the new value."""
+        statement = self._insert(counters_table).values(name=name, value=delta)
+        statement = statement.on_conflict_do_update(
+            index_elements=["name"],
+            set_={"value": counters_table.c.value + statement.excluded.value}
+        ).returning(counters_table.c.value)
+        return (await conn.execute(statement)).scalar_one()
+
+    async def _rebuild_counters(self, conn: AsyncConnection) -> None:
+        """Recompute every dashboard counter from the rows."""
+        await conn.execute(counters_table.delete())
+        values: Dict[str, int] = {
+            SUBMISSIONS_COUNTER: await conn.scalar(select(func.count()).select_from(applications_table)),
+            ALLOCATIONS_COUNTER: await conn.scalar(select(func.count()).select_from(allocations_table)),
+            INTERNS_COUNTER: await conn.scalar(
+                select(func.count(func.distinct(allocations_table.c.student_id)))
+            ),
+        }
+        grouped = [
+            (STATUS_COUNTER_PREFIX, applications_table.c.status),
+            (INTERNSHIP_APPLICATIONS_PREFIX, applications_table.c.internship_id),
+            (INTERNSHIP_ALLOCATIONS_PREFIX, allocations_table.c.internship_id),
+            (STUDENT_ALLOCATIONS_PREFIX, allocations_table.c.student_id),
+        ]
+        for prefix, column in grouped:
+            result = await conn.execute(select(column, func.count()).group_by(column))
+            for key, count in result:
+                values[f"{prefix}{key}"] = count
+        if values:
+            # Upsert so a counter created concurrently is overwritten, not a conflict
+            statement = self._insert(counters_table)
+            await conn.execute(
+                statement.on_conflict_do_update(
+                    index_elements=["name"], set_={"value": statement.excluded.value}
+                ),
+                [{"name": name, "value": value or 0} for name, value in values.items()]
+            )
+
+    async def _sync_id_sequence(self, conn: AsyncConnection, table: Table) -> None:
+        """Move a PostgreSQL id sequence past rows inserted with explicit ids.
+
+        Explicit ids do not advance the serial sequence, so the next plain
+        insert would reuse one of them. SQLite picks max(rowid) + 1 itself.
+        """
+        if self.dialect != "postgresql":
+            return
+        await conn.execute(
+            select(
+                func.setval(
+                    func.pg_get_serial_sequence(table.name, "id"),
+                    select(func.max(table.c.id)).scalar_subquery()
+                )
+            )
+        )
+
+    async def _bump_catalogue_version(self, conn: AsyncConnection) -> None:
+        await conn.execute(
+            update(meta_table)
+            .where(meta_table.c.key == CATALOGUE_VERSION_KEY)
+            .values(value=meta_table.c.value + 1)
+        )
+
+    # Students
+    async def get_student(self, student_id: int) -> Optional[Dict[str, Any]]:
+        return await self._fetch_one(select(students_table).where(students_table.c.id == student_id))
+
+    async def get_student_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        return await self._fetch_one(select(students_table).where(students_table.c.email == email))
+
+    async def create_student(self, student: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._insert_returning(students_table, student)
+
+    async def update_student(self, student_id: int, fields: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        values = {key: value for key, value in fields.items() if key in students_table.c and key != "id"}
+        if values:
+            try:
+                async with self.engine.begin() as conn:
+                    await conn.execute(
+                        update(students_table).where(students_table.c.id == student_id).values(**values)
+                    )
+            except IntegrityError as e:
+                raise DuplicateKeyError("Email already registered") from e
+        return await self.get_student(student_id)
+
+    # Admins
+    async def get_admin(self, admin_id: int) -> Optional[Dict[str, Any]]:
+        return await self._fetch_one(select(admins_table).where(admins_table.c.id == admin_id))
+
+    async def get_admin_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        return await self._fetch_one(select(admins_table).where(admins_table.c.email == email))
+
+    async def upsert_admin(self, admin: Dict[str, Any]) -> Dict[str, Any]:
+        values = {key: value for key, value in admin.items() if key in admins_table.c}
+        statement = self._insert(admins_table).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=["id"],
+            set_={key: statement.excluded[key] for key in values if key != "id"}
+        )
+        async with self.engine.begin() as conn:
+            await conn.execute(statement)
+            if values.get("id") is not None:
+                await self._sync_id_sequence(conn, admins_table)
+        return dict(values)
+
+    # Internships
+    async def get_internship(self, internship_id: int) -> Optional[Dict[str, Any]]:
+        return await self._fetch_one(
+            select(internships_table).where(internships_table.c.id == internship_id)
+        )
+
+    async def list_internships(self) -> List[Dict[str, Any]]:
+        return await self._fetch_all(select(internships_table).order_by(internships_table.c.id))
+
+    async def create_internship(self, internship: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._insert_returning(internships_table, internship)
+
+    async def upsert_internships(
+        self,
+        internships: List[Dict[str, Any]],
+        bump_version: bool = True
+    ) -> List[Dict[str, Any]]:
+        if not internships:
+            return []
+
+        columns = [column.name for column in internships_table.c]
+        by_key: List[Dict[str, Any]] = []
+        by_id: List[Dict[str, Any]] = []
+        new_rows: List[Dict[str, Any]] = []
+        for internship in internships:
+            values = {key: internship.get(key) for key in columns}
+            if internship.get("external_key"):
+                values.pop("id")
+                by_key.append(values)
+            elif values["id"] is not None:
+                by_id.append(values)
+            else:
+                values.pop("id")
+                new_rows.append(values)
+
+        async with self.engine.begin() as conn:
+            # Rows with neither key are plain inserts; remember their new IDs
+            for values in new_rows:
+                result = await conn.execute(internships_table.insert().values(**values))
+                values["id"] = result.inserted_primary_key[0]
+                by_id.append(values)
+
+            for rows, conflict_column in ((by_key, "external_key"), (by_id, "id")):
+                for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                    chunk = rows[start:start + UPSERT_CHUNK_SIZE]
+                    statement = self._insert(internships_table).values(chunk)
+                    statement = statement.on_conflict_do_update(
+                        index_elements=[conflict_column],
+                        set_={
+                            key: statement.excluded[key]
+                            for key in chunk[0]
+                            if key not in ("id", "created_at", conflict_column)
+                        }
+                    )
+                    await conn.execute(statement)
+            if len(by_id) > len(new_rows):
+                await self._sync_id_sequence(conn, internships_table)
+            if bump_version:
+                await self._bump_catalogue_version(conn)
+
+            # Read back the stored rows (IDs, preserved created_at) in input order
+            stored_by_key: Dict[str, Dict[str, Any]] = {}
+            stored_by_id: Dict[int, Dict[str, Any]] = {}
+            keys = [row["external_key"] for row in by_key]
+            for start in range(0, len(keys), UPSERT_CHUNK_SIZE):
+                result = await conn.execute(
+                    select(internships_table).where(
+                        internships_table.c.external_key.in_(keys[start:start + UPSERT_CHUNK_SIZE])
+                    )
+                )
+                for row in result:
+                    stored_by_key[row.external_key] = dict(row._mapping)
+            ids = [row["id"] for row in by_id]
+            for start in range(0, len(ids), UPSERT_CHUNK_SIZE):
+                result = await conn.execute(
+                    select(internships_table).where(
+                        internships_table.c.id.in_(ids[start:start + UPSERT_CHUNK_SIZE])
+                    )
+                )
+                for row in result:
+                    stored_by_id[row.id] = dict(row._mapping)
+
+        new_ids = iter(values["id"] for values in new_rows)
+        return [
+            stored_by_key[internship["external_key"]]
+            if internship.get("external_key")
+            else stored_by_id[internship.get("id") or next(new_ids)]
+            for internship in internships
+        ]
+
+    async def catalogue_version(self) -> int:
+        async with self.engine.connect() as conn:
+            version = await conn.scalar(
+                select(meta_table.c.value).where(meta_table.c.key == CATALOGUE_VERSION_KEY)
+            )
+        return version or 0
+
+    async def bump_catalogue_version(self) -> int:
+        async with self.engine.begin() as conn:
+            await self._bump_catalogue_version(conn)
+            version = await conn.scalar(
+                select(meta_table.c.value).where(meta_table.c.key == CATALOGUE_VERSION_KEY)
+            )
+        return version or 0
+
+    # Applications
+    async def get_application(self, application_id: int) -> Optional[Dict[str, Any]]:
+        return await self._fetch_one(
+            select(applications_table).where(applications_table.c.id == application_id)
+        )
+
+    async def find_application(self, student_id: int, internship_id: int) -> Optional[Dict[str, Any]]:
+        return await self._fetch_one(
+            select(applications_table).where(
+                applications_table.c.student_id == student_id,
+                applications_table.c.internship_id == internship_id
+            )
+        )
+
+    async def list_applications(self) -> List[Dict[str, Any]]:
+        return await self._fetch_all(select(applications_table).order_by(applications_table.c.id))
+
+    async def create_application(self, application: Dict[str, Any]) -> Dict[str, Any]:
+        values = {key: value for key, value in application.items() if key != "id" and key in applications_table.c}
+        try:
+            async with self.engine.begin() as conn:
+                result = await conn.execute(applications_table.insert().values(**values))
+                new_id = result.inserted_primary_key[0]
+                await self._increment(conn, SUBMISSIONS_COUNTER)
+                await self._increment(conn, f"{STATUS_COUNTER_PREFIX}{values['status']}")
+                await self._increment(conn, f"{INTERNSHIP_APPLICATIONS_PREFIX}{values['internship_id']}")
+        except IntegrityError as e:
+            raise DuplicateKeyError("Already applied for this internship") from e
+        return {**values, "id": new_id}
+
+    # Allocations
+    async def get_allocation_by_application(self, application_id: int) -> Optional[Dict[str, Any]]:
+        return await self._fetch_one(
+            select(allocations_table).where(allocations_table.c.application_id == application_id)
+        )
+
+    async def list_allocations(self) -> List[Dict[str, Any]]:
+        return await self._fetch_all(select(allocations_table).order_by(allocations_table.c.id))
+
+    async def create_allocation(self, allocation: Dict[str, Any]) -> Dict[str, Any]:
+        values = {key: value for key, value in allocation.items() if key != "id" and key in allocations_table.c}
+        try:
+            async with self.engine.begin() as conn:
+                result = await conn.execute(allocations_table.insert().values(**values))
+                new_id = result.inserted_primary_key[0]
+                previous_status = await conn.scalar(
+                    select(applications_table.c.status)
+                    .where(applications_table.c.id == allocation["application_id"])
+                )
+                await conn.execute(
+                    update(applications_table)
+                    .where(applications_table.c.id == allocation["application_id"])
+                    .values(status="allocated")
+                )
+
+                await self._increment(conn, ALLOCATIONS_COUNTER)
+                await self._increment(conn, f"{INTERNSHIP_ALLOCATIONS_PREFIX}{values['internship_id']}")
+                student_allocations = await self._increment(
+                    conn, f"{STUDENT_ALLOCATIONS_PREFIX}{values['student_id']}"
+                )
+                if student_allocations == 1:
+                    await self._increment(conn, INTERNS_COUNTER)
+                if previous_status is not None and previous_status != "allocated":
+                    await self._increment(conn, f"{STATUS_COUNTER_PREFIX}{previous_status}", -1)
+                    await self._increment(conn, f"{STATUS_COUNTER_PREFIX}allocated")
+        except IntegrityError as e:
+            raise DuplicateKeyError("Application already allocated") from e
+        return {**values, "id": new_id}
+
+    # Dashboard
+    async def summary(self) -> Dict[str, Any]:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(counters_table.c.name, counters_table.c.value).where(
+                    counters_table.c.name.in_(
+                        [SUBMISSIONS_COUNTER, ALLOCATIONS_COUNTER, INTERNS_COUNTER]
+                    ) | counters_table.c.name.startswith(STATUS_COUNTER_PREFIX)
+                )
+            )
+            counters = {name: value for name, value in result}
+
+        applications_by_status = {
+            name[len(STATUS_COUNTER_PREFIX):]: value
+            for name, value in counters.items()
+            if name.startswith(STATUS_COUNTER_PREFIX) and value
+        }
+        return {
+            "total_submissions": counters.get(SUBMISSIONS_COUNTER, 0),
+            "total_allocations": counters.get(ALLOCATIONS_COUNTER, 0),
+            "total_interns": counters.get(INTERNS_COUNTER, 0),
+            "pending_applications": applications_by_status.get("pending", 0),
+            "applications_by_status": applications_by_status
+        }
+
+    async def internship_counts(self, internship_id: int) -> Dict[str, int]:
+        names = {
+            "applications": f"{INTERNSHIP_APPLICATIONS_PREFIX}{internship_id}",
+            "allocations": f"{INTERNSHIP_ALLOCATIONS_PREFIX}{internship_id}",
+        }
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(counters_table.c.name, counters_table.c.value)
+                .where(counters_table.c.name.in_(list(names.values())))
+            )
+            counters = {name: value for name, value in result}
+        return {key: counters.get(name, 0) for key, name in names.items()}
+
+    # Tokens
+    async def save_token(self, token: str, info: Dict[str, Any]) -> None:
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                tokens_table.insert().values(
+                    token=token,
+                    user_id=info["user_id"],
+                    user_type=info["user_type"],
+                    email=info["email"]
+                )
+            )
+
+    async def get_token(self, token: str) -> Optional[Dict[str, Any]]:
+        info = await self._fetch_one(select(tokens_table).where(tokens_table.c.token == token))
+        if info is not None:
+            info.pop("token")
+        return info
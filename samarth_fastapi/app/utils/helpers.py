@@ -5,69 +5,47 @@ from datetime import datetime
 from typing import Dict, Any, List, Optional
 import secrets
 
+from app.storage import Store, get_store
 
-# Dummy data storage (in-memory)
-# TODO: Replace with actual database connections
 
-# Students storage
-STUDENTS_DB: Dict[int, Dict[str, Any]] = {}
-
-# Admins storage
-ADMINS_DB: Dict[int, Dict[str, Any]] = {
-    1: {
-        "id": 1,
-        "email": "admin@samarth.gov",
-        "password": "admin123",  # In production, use hashed passwords
-        "full_name": "Government Admin",
-        "created_at": datetime.now()
-    }
+# Default admin account
+# TODO: Replace with proper admin provisioning
+DEFAULT_ADMIN: Dict[str, Any] = {
+    "id": 1,
+    "email": "admin@samarth.gov",
+    "password": "admin123",  # In production, use hashed passwords
+    "full_name": "Government Admin",
+    "created_at": datetime.now()
 }
 
-# Internships storage
-INTERNSHIPS_DB: Dict[int, Dict[str, Any]] = {}
-
-# Applications storage
-APPLICATIONS_DB: Dict[int, Dict[str, Any]] = {}
-
-# Allocations storage
-ALLOCATIONS_DB: Dict[int, Dict[str, Any]] = {}
-
-# Token storage (for authentication)
-TOKEN_STORAGE: Dict[str, Dict[str, Any]] = {}
-
 
 def generate_token() -> str:
     """Generate a random token for authentication."""
     return secrets.token_urlsafe(32)
 
 
-def get_next_id(collection: Dict[int, Any]) -> int:
-    """Get the next available ID for a collection."""
-    if not collection:
-        return 1
-    return max(collection.keys()) + 1
-
-
-def verify_token(token: str) -> Optional[Dict[str, Any]]:
+async def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """Verify a token and return user info."""
-    return TOKEN_STORAGE.get(token)
+    return await get_store().get_token(token)
 
 
-def create_token(user_id: int, user_type: str, email: str) -> str:
+async def create_token(user_id: int, user_type: str, email: str) -> str:
     """Create and store a token for a user."""
     token = generate_token()
-    TOKEN_STORAGE[token] = {
+    await get_store().save_token(token, {
         "user_id": user_id,
         "user_type": user_type,  # "student" or "admin"
         "email": email
-    }
+    })
     return token
 
 
 # Initialize with some dummy data
-def initialize_dummy_data():
-    """Initialize the database with dummy data for testing."""
-    global INTERNSHIPS_DB, STUDENTS_DB
+async def initialize_dummy_data(store: Store):
+    """Initialize the store with dummy data for testing (only if it is empty)."""
+    await store.upsert_admin(DEFAULT_ADMIN)
+    if await store.list_internships():
+        return
     
     # Add some dummy internships (mix of scraper and admin)
     scraper_internships = [
@@ -131,9 +109,4 @@ def initialize_dummy_data():
         }
     ]
     
-    for internship in scraper_internships + admin_internships:
-        INTERNSHIPS_DB[internship["id"]] = internship
-
-
-# Initialize dummy data on import
-initialize_dummy_data()
+    await store.upsert_internships(scraper_internships + admin_internships)
@@ -0,0 +1,148 @@
+"""
+Benchmark for the store-backed write routes.
+
+Pre-fills a store with N students, applications and allocations, then times
+register, login, apply and allocate by calling the route handlers directly
+(no HTTP overhead). With indexed lookups and counter-based IDs the
+per-request time should stay flat as N grows.
+
+Run with:
+    python bench_store.py
+    python bench_store.py --sizes 1000 10000 100000 1000000
+    python bench_store.py --database-url sqlite+aiosqlite:///./bench.db --sizes 1000 10000
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+from app.routes.admin_routes import allocate_internship
+from app.routes.student_routes import apply_for_internship, login_student, register_student
+from app.schemas.student_schema import StudentLogin, StudentRegister
+from app.storage import create_store, set_store
+from app.utils.helpers import DEFAULT_ADMIN
+
+# Admin internships students apply to; prefilled applications are spread over them
+BENCH_INTERNSHIPS = 100
+
+
+async def prefill(store, rows: int):
+    """Insert `rows` students and applications, and allocate half the applications."""
+    now = datetime.now()
+    await store.upsert_admin(DEFAULT_ADMIN)
+    internships = await store.upsert_internships([
+        {
+            "id": i,
+            "title": f"Bench Internship {i}",
+            "description": "Benchmark internship",
+            "skills_required": ["Python"],
+            "location": "Delhi",
+            "source": "admin",
+            "apply_url": None,
+            "admin_can_apply": True,
+            "created_at": now
+        }
+        for i in range(1, BENCH_INTERNSHIPS + 1)
+    ])
+
+    for i in range(rows):
+        student = await store.create_student({
+            "email": f"student{i}@example.com",
+            "password": "secret",
+            "full_name": f"Student {i}",
+            "phone": None,
+            "skills": ["Python"],
+            "interests": [],
+            "location": "Delhi",
+            "created_at": now
+        })
+        internship = internships[i % BENCH_INTERNSHIPS]
+        application = await store.create_application({
+            "student_id": student["id"],
+            "student_name": student["full_name"],
+            "student_email": student["email"],
+            "internship_id": internship["id"],
+            "internship_title": internship["title"],
+            "status": "pending",
+            "applied_at": now
+        })
+        if i % 2 == 0:
+            await store.create_allocation({
+                "application_id": application["id"],
+                "student_id": student["id"],
+                "student_name": student["full_name"],
+                "internship_id": internship["id"],
+                "internship_title": internship["title"],
+                "status": "allocated",
+                "allocated_at": now
+            })
+    return internships
+
+
+async def time_routes(store, internships, ops: int):
+    """Time each route over `ops` calls; returns microseconds per call."""
+    timings = {}
+    admin = await store.get_admin(DEFAULT_ADMIN["id"])
+
+    start = time.perf_counter()
+    registered = []
+    for i in range(ops):
+        response = await register_student(StudentRegister(
+            email=f"new{i}@example.com",
+            password="secret",
+            full_name=f"New Student {i}"
+        ))
+        registered.append(response.student_id)
+    timings["register"] = (time.perf_counter() - start) / ops * 1e6
+
+    start = time.perf_counter()
+    for i in range(ops):
+        await login_student(StudentLogin(email=f"new{i}@example.com", password="secret"))
+    timings["login"] = (time.perf_counter() - start) / ops * 1e6
+
+    students = [await store.get_student(student_id) for student_id in registered]
+    start = time.perf_counter()
+    applications = []
+    for i, student in enumerate(students):
+        internship = internships[i % BENCH_INTERNSHIPS]
+        response = await apply_for_internship(internship["id"], current_student=student)
+        applications.append(response.id)
+    timings["apply"] = (time.perf_counter() - start) / ops * 1e6
+
+    start = time.perf_counter()
+    for application_id in applications:
+        await allocate_internship(application_id, None, current_admin=admin)
+    timings["allocate"] = (time.perf_counter() - start) / ops * 1e6
+
+    return timings
+
+
+async def run(sizes, ops: int, database_url: str):
+    print(f"{'rows':>10} | {'register':>10} | {'login':>10} | {'apply':>10} | {'allocate':>10}  (µs/request)")
+    print("-" * 68)
+    for rows in sizes:
+        store = create_store(database_url)
+        await store.connect()
+        set_store(store)
+        internships = await prefill(store, rows)
+        timings = await time_routes(store, internships, ops)
+        await store.close()
+        print(
+            f"{rows:>10} | {timings['register']:>10.1f} | {timings['login']:>10.1f} | "
+            f"{timings['apply']:>10.1f} | {timings['allocate']:>10.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark store-backed routes as row counts grow.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Number of pre-filled students/applications per run")
+    parser.add_argument("--ops", type=int, default=1000, help="Requests timed per route")
+    parser.add_argument("--database-url", default="memory://",
+                        help="Store to benchmark (use a fresh database file per run)")
+    args = parser.parse_args()
+    asyncio.run(run(args.sizes, args.ops, args.database_url))
+
+
+if __name__ == "__main__":
+    main()
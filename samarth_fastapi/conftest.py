@@ -0,0 +1 @@
+# Makes the app package importable when pytest runs from here.
@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+
+from app.storage import create_store
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store_url(request, tmp_path):
+    if request.param == "memory":
+        return "memory://"
+    return f"sqlite+aiosqlite:///{tmp_path / 'samarth.db'}"
+
+
+@pytest.fixture
+def with_store(store_url):
+    """Run `scenario(store)` against a freshly connected store of each backend."""
+    def run(scenario):
+        async def main():
+            store = create_store(store_url)
+            await store.connect()
+            try:
+                return await scenario(store)
+            finally:
+                await store.close()
+        return asyncio.run(main())
+    return run
@@ -0,0 +1,68 @@
+"""Record builders shared by the tests; keyword arguments override any field."""
+from datetime import datetime
+
+
+def student(email="asha@example.com", **fields):
+    return {
+        "email": email,
+        "password": "secret",
+        "full_name": "Asha",
+        "phone": None,
+        "skills": ["Python"],
+        "interests": ["data"],
+        "location": "Pune",
+        "created_at": datetime(2025, 1, 1),
+        **fields,
+    }
+
+
+def admin(admin_id, email, **fields):
+    return {
+        "id": admin_id,
+        "email": email,
+        "password": "secret",
+        "full_name": "Admin",
+        "created_at": datetime(2025, 1, 1),
+        **fields,
+    }
+
+
+def internship(title="Intern", external_key=None, **fields):
+    return {
+        "title": title,
+        "description": "",
+        "skills_required": [],
+        "location": "",
+        "source": "scraper" if external_key else "admin",
+        "apply_url": None,
+        "admin_can_apply": not external_key,
+        "external_key": external_key,
+        "created_at": datetime(2025, 1, 1),
+        **fields,
+    }
+
+
+def application(student_id, internship_id, status="pending", **fields):
+    return {
+        "student_id": student_id,
+        "student_name": "Student",
+        "student_email": "student@example.com",
+        "internship_id": internship_id,
+        "internship_title": "Intern",
+        "status": status,
+        "applied_at": datetime(2025, 1, 1),
+        **fields,
+    }
+
+
+def allocation(application, **fields):
+    return {
+        "application_id": application["id"],
+        "student_id": application["student_id"],
+        "student_name": application["student_name"],
+        "internship_id": application["internship_id"],
+        "internship_title": application["internship_title"],
+        "status": "allocated",
+        "allocated_at": datetime(2025, 1, 2),
+        **fields,
+    }
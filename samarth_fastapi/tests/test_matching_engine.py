@@ -0,0 +1,32 @@
+from app.services import matching_engine
+from app.services.matching_engine import InternshipFeatureMatrix, calculate_match_score
+from factories import internship
+
+
+INTERNSHIPS = [
+    internship("Data Science Intern", id=1, description="Pandas and SQL",
+               skills_required=["Python", "SQL"], location="Pune"),
+    internship("Web Developer", id=2, description="React frontend",
+               skills_required=["JavaScript"], location="New Delhi"),
+    internship("Marketing Intern", id=3),
+    internship("ML Engineer", id=4, description="Machine learning with python",
+               skills_required=["python"], location="Delhi"),
+]
+
+
+def test_batch_scores_match_the_row_by_row_score():
+    matrix = InternshipFeatureMatrix(INTERNSHIPS)
+    student = {"skills": ["python", "SQL"], "interests": ["data", "python", "ata sci"], "location": "Delhi"}
+    expected = [calculate_match_score(i, student) for i in INTERNSHIPS]
+    assert matrix.score(student).tolist() == expected
+
+
+def test_interest_postings_evict_least_recently_used(monkeypatch):
+    monkeypatch.setattr(matching_engine, "MAX_INTEREST_POSTINGS", 2)
+    matrix = InternshipFeatureMatrix(INTERNSHIPS)
+    matrix.interest_postings("data")
+    matrix.interest_postings("web")
+    matrix.interest_postings("data")  # now the most recently used
+    matrix.interest_postings("intern")
+    assert list(matrix._interest_postings) == ["data", "intern"]
+    assert matrix.interest_postings("intern").tolist() == [True, False, True, False]
@@ -0,0 +1,195 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services import model_server
+from app.services.model_server import RECOMMENDER_ENV, ModelServer
+
+INTERNSHIPS = [
+    {
+        "id": doc_id,
+        "title": f"Intern {doc_id}",
+        "description": "",
+        "skills_required": [],
+        "location": "Pune",
+        "source": "admin",
+        "admin_can_apply": True,
+        "created_at": datetime(2025, 1, 1),
+    }
+    for doc_id in range(1, 6)
+]
+
+
+class StubBooster:
+    """Scores each row by its single feature; counts prediction calls."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.batch_sizes = []
+
+    def inplace_predict(self, X):
+        if self.error is not None:
+            raise self.error
+        self.batch_sizes.append(len(X) // len(INTERNSHIPS))
+        return X[:, 0]
+
+
+class StubVectorizer:
+    def transform(self, texts):
+        return np.zeros((len(texts), 1))
+
+
+class StubMatrix:
+    def __init__(self, size):
+        self.size = size
+
+    def features(self, profile, student_vec):
+        # later internships score higher, so the ranking is known
+        return (np.arange(self.size, dtype=np.float64) / self.size).reshape(-1, 1)
+
+
+class StubFeatures:
+    builds = []
+
+    def __init__(self, internships, version, vectorizer, modules):
+        self.internships = internships
+        self.version = version
+        self.matrix = StubMatrix(len(internships))
+        StubFeatures.builds.append(version)
+
+
+@pytest.fixture
+def catalogue(monkeypatch):
+    state = {"version": 1}
+    monkeypatch.setattr(model_server, "get_catalogue_version", lambda: state["version"])
+    monkeypatch.setattr(model_server, "get_cached_internships", lambda: {i["id"]: i for i in INTERNSHIPS})
+    monkeypatch.setattr(model_server, "_CatalogueFeatures", StubFeatures)
+    monkeypatch.delenv(RECOMMENDER_ENV, raising=False)
+    StubFeatures.builds = []
+    return state
+
+
+def stub_server(monkeypatch, booster, **kwargs):
+    server = ModelServer(**kwargs)
+
+    def load():
+        server._modules = (None, None, SimpleNamespace(student_profile=lambda row: {"text": row["skills"]}), None)
+        server._booster = booster
+        server._vectorizer = StubVectorizer()
+
+    monkeypatch.setattr(server, "_load", load)
+    return server
+
+
+STUDENT = {"id": 1, "skills": ["Python"], "interests": [], "location": "Pune"}
+
+
+def test_concurrent_requests_share_one_prediction(catalogue, monkeypatch):
+    booster = StubBooster()
+    server = stub_server(monkeypatch, booster, max_batch_size=64, max_wait_ms=50)
+
+    async def main():
+        await server.start()
+        try:
+            results = await asyncio.gather(*(server.recommend(STUDENT, limit=3) for _ in range(10)))
+            return results, server.stats()
+        finally:
+            await server.stop()
+
+    results, stats = asyncio.run(main())
+    assert booster.batch_sizes == [10]
+    for recommendations in results:
+        assert [r.internship.id for r in recommendations] == [5, 4, 3]
+        assert [r.score for r in recommendations] == [80.0, 60.0, 40.0]
+    assert (stats["mode"], stats["requests"], stats["batches"], stats["avg_batch_size"]) == ("model", 10, 1, 10.0)
+
+
+def test_batches_are_capped_at_max_batch_size(catalogue, monkeypatch):
+    booster = StubBooster()
+    server = stub_server(monkeypatch, booster, max_batch_size=4, max_wait_ms=50)
+
+    async def main():
+        await server.start()
+        try:
+            await asyncio.gather(*(server.recommend(STUDENT) for _ in range(10)))
+        finally:
+            await server.stop()
+
+    asyncio.run(main())
+    assert booster.batch_sizes == [4, 4, 2]
+
+
+def test_failed_batch_returns_none_and_the_server_keeps_going(catalogue, monkeypatch):
+    booster = StubBooster(error=RuntimeError("booster broke"))
+    server = stub_server(monkeypatch, booster)
+
+    async def main():
+        await server.start()
+        try:
+            failed = await asyncio.gather(*(server.recommend(STUDENT) for _ in range(3)))
+            booster.error = None
+            recovered = await server.recommend(STUDENT, limit=1)
+            return failed, recovered
+        finally:
+            await server.stop()
+
+    failed, recovered = asyncio.run(main())
+    assert failed == [None, None, None]
+    assert [r.internship.id for r in recovered] == [5]
+    assert server.stats()["fallbacks"] == 3
+
+
+def test_missing_model_disables_the_server(catalogue, monkeypatch):
+    server = ModelServer()
+
+    def load():
+        raise FileNotFoundError("xgb_match_model.json")
+
+    monkeypatch.setattr(server, "_load", load)
+
+    async def main():
+        await server.start()
+        return await server.recommend(STUDENT)
+
+    assert asyncio.run(main()) is None
+    assert server.stats()["mode"] == "rules"
+    assert server.error == "FileNotFoundError: xgb_match_model.json"
+    assert server.fallbacks == 1
+
+
+def test_rules_mode_never_loads_the_model(catalogue, monkeypatch):
+    monkeypatch.setenv(RECOMMENDER_ENV, "rules")
+    server = stub_server(monkeypatch, StubBooster())
+    asyncio.run(server.start())
+    assert not server.ready
+    assert not hasattr(server, "_booster")
+
+
+def test_features_are_rebuilt_when_the_catalogue_version_moves(catalogue, monkeypatch):
+    server = stub_server(monkeypatch, StubBooster())
+
+    async def main():
+        await server.start()
+        try:
+            await server.recommend(STUDENT)
+            await server.recommend(STUDENT)
+            catalogue["version"] = 2
+            await server.recommend(STUDENT)
+        finally:
+            await server.stop()
+
+    asyncio.run(main())
+    assert StubFeatures.builds == [1, 2]
+
+
+def test_latency_percentiles():
+    server = ModelServer()
+    assert server.stats()["latency_p50_ms"] is None
+    server._latencies.extend(ms / 1000 for ms in range(1, 101))
+    stats = server.stats()
+    assert stats["latency_p50_ms"] == 50.5
+    assert stats["latency_p99_ms"] == 99.01
+    assert stats["latency_window"] == 100
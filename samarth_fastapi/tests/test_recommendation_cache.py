@@ -0,0 +1,129 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import recommendation_cache
+from app.services.model_server import RECOMMENDER_ENV
+from app.services.recommendation_cache import RECOMMENDATION_CACHE, RecommendationCache
+
+STUDENT = {"id": 1, "skills": ["Python"], "interests": ["data"], "location": "Pune"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(recommendation_cache.time, "monotonic", clock)
+    return clock
+
+
+def test_hit_needs_same_profile_catalogue_and_enough_rows():
+    cache = RecommendationCache(max_entries=10, ttl_seconds=60)
+    cache.put(STUDENT, 3, 5, ["a", "b", "c", "d", "e"])
+
+    assert cache.get(STUDENT, 3, 2) == ["a", "b"]
+    assert cache.get(STUDENT, 3, 10) is None  # cut at 5 rows
+    assert cache.get(STUDENT, 4, 2) is None  # catalogue changed
+    assert cache.get({**STUDENT, "skills": ["SQL"]}, 3, 2) is None  # profile changed
+    # fields the recommenders do not read leave the entry valid
+    assert cache.get({**STUDENT, "phone": "123"}, 3, 2) == ["a", "b"]
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = RecommendationCache(max_entries=10, ttl_seconds=60)
+    cache.put(STUDENT, 1, 5, ["a"])
+    clock.now += 59
+    assert cache.get(STUDENT, 1, 5) == ["a"]
+    clock.now += 1
+    assert cache.get(STUDENT, 1, 5) is None
+
+
+def test_least_recently_used_student_is_evicted():
+    cache = RecommendationCache(max_entries=2, ttl_seconds=60)
+    students = [{**STUDENT, "id": student_id} for student_id in (1, 2, 3)]
+    cache.put(students[0], 1, 5, ["a"])
+    cache.put(students[1], 1, 5, ["b"])
+    assert cache.get(students[0], 1, 5) == ["a"]  # 2 is now the oldest
+    cache.put(students[2], 1, 5, ["c"])
+
+    assert cache.get(students[1], 1, 5) is None
+    assert cache.get(students[0], 1, 5) == ["a"]
+    assert cache.get(students[2], 1, 5) == ["c"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_size_zero_disables_the_cache():
+    cache = RecommendationCache(max_entries=0, ttl_seconds=60)
+    cache.put(STUDENT, 1, 5, ["a"])
+    assert cache.get(STUDENT, 1, 5) is None
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv(RECOMMENDER_ENV, "rules")
+    RECOMMENDATION_CACHE.clear()
+    with TestClient(app) as client:
+        yield client
+    RECOMMENDATION_CACHE.clear()
+
+
+def register(client):
+    response = client.post("/student/register", json={
+        "email": "cache-test@example.com",
+        "password": "secret",
+        "full_name": "Cache Test",
+        "skills": ["Python"],
+        "interests": ["data"],
+        "location": "Pune",
+    })
+    assert response.status_code == 201
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+def recommend(client, headers):
+    response = client.post("/student/recommend", json={"limit": 5}, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_profile_update_invalidates_the_student(client):
+    headers = register(client)
+    recommend(client, headers)
+    hits = RECOMMENDATION_CACHE.hits
+    recommend(client, headers)
+    assert RECOMMENDATION_CACHE.hits == hits + 1
+
+    response = client.put("/student/profile/update", json={"skills": ["SQL"]}, headers=headers)
+    assert response.status_code == 200
+    assert RECOMMENDATION_CACHE.stats()["entries"] == 0
+    recommend(client, headers)
+    assert RECOMMENDATION_CACHE.hits == hits + 1
+
+
+def test_catalogue_write_clears_the_cache(client):
+    headers = register(client)
+    recommend(client, headers)
+    assert RECOMMENDATION_CACHE.stats()["entries"] == 1
+
+    admin = client.post("/admin/login", json={"email": "admin@samarth.gov", "password": "admin123"})
+    admin_headers = {"Authorization": f"Bearer {admin.json()['token']}"}
+    response = client.post("/admin/internships/add", headers=admin_headers, json={
+        "title": "Python Data Intern",
+        "description": "Data pipelines",
+        "skills_required": ["Python"],
+        "location": "Pune",
+    })
+    assert response.status_code == 201
+    assert RECOMMENDATION_CACHE.stats()["entries"] == 0
+
+    ids = [rec["internship"]["id"] for rec in recommend(client, headers)]
+    assert response.json()["id"] in ids
@@ -0,0 +1,121 @@
+import asyncio
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from app.services import catalogue, scraper_jobs
+from app.services.search_index import SEARCH_INDEX
+from app.storage import create_store, set_store
+
+
+@pytest.fixture(params=["memory://", "sqlite"])
+def store(request, tmp_path, monkeypatch):
+    # start from an unloaded mirror so every test reloads from its own store
+    monkeypatch.setattr(catalogue, "_catalogue_version", None)
+    url = request.param
+    if url == "sqlite":
+        url = f"sqlite+aiosqlite:///{tmp_path / 'samarth.db'}"
+    store = create_store(url)
+    asyncio.run(store.connect())
+    set_store(store)
+    yield store
+    asyncio.run(store.close())
+
+
+def write_run(path, count):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for i in range(count):
+            record = {
+                "job_title": f"Intern {i}",
+                "company_name": "Acme",
+                "location": "Pune",
+                "job_link": f"https://example.com/{i}",
+                "domain": "Python",
+                "source": "test",
+            }
+            f.write(json.dumps(record) + "\n")
+
+
+def test_import_bumps_the_catalogue_version_once(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper_jobs, "IMPORT_CHUNK_SIZE", 100)
+    job = scraper_jobs.ScraperJob()
+    job.output_path = str(tmp_path / "run.ndjson.gz")
+    write_run(job.output_path, 250)
+
+    async def run():
+        before = await catalogue.refresh_catalogue()
+        await scraper_jobs.ScraperJobManager()._import(job)
+        return before, await store.catalogue_version()
+
+    before, after = asyncio.run(run())
+    assert after == before + 1
+    assert catalogue.get_catalogue_version() == after
+    assert job.record_count == job.imported_count == 250
+    assert SEARCH_INDEX.search(keyword="intern")[1] == 250
+    assert len(catalogue.get_cached_internships()) == 250
+
+
+def test_failed_import_still_publishes_written_chunks(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper_jobs, "IMPORT_CHUNK_SIZE", 100)
+    job = scraper_jobs.ScraperJob()
+    job.output_path = str(tmp_path / "run.ndjson.gz")
+    write_run(job.output_path, 150)
+    with gzip.open(job.output_path, "at", encoding="utf-8") as f:
+        f.write("not json\n")
+
+    async def run():
+        before = await catalogue.refresh_catalogue()
+        with pytest.raises(json.JSONDecodeError):
+            await scraper_jobs.ScraperJobManager()._import(job)
+        return before, await store.catalogue_version(), await store.list_internships()
+
+    before, after, stored = asyncio.run(run())
+    assert after == before + 1
+    assert job.imported_count == len(stored) == 100
+
+
+def test_scraper_dir_is_the_repository_scraper():
+    assert os.path.isfile(os.path.join(scraper_jobs.SCRAPER_DIR, scraper_jobs.SCRAPER_SCRIPT))
+    assert os.path.isabs(scraper_jobs.RUNS_DIR)
+
+
+def test_cancelled_run_is_marked_and_its_scraper_killed(tmp_path, monkeypatch):
+    # a scraper that reports its pid and then hangs
+    (tmp_path / "main.py").write_text(
+        "import os, sys, time\n"
+        "print(os.getpid(), flush=True)\n"
+        "time.sleep(60)\n"
+    )
+    monkeypatch.setattr(scraper_jobs, "SCRAPER_DIR", str(tmp_path))
+    monkeypatch.setattr(scraper_jobs, "RUNS_DIR", str(tmp_path / "runs"))
+
+    async def run():
+        manager = scraper_jobs.ScraperJobManager()
+        job, _ = manager.start()
+        while not job.log:
+            await asyncio.sleep(0.01)
+        await manager.stop()
+        restarted, coalesced = manager.start()
+        await manager.stop()
+        return job, restarted, coalesced
+
+    job, restarted, coalesced = asyncio.run(run())
+    assert job.status == "cancelled"
+    assert job.finished_at is not None
+    assert job.error == "Scraper run was cancelled"
+    # a later trigger starts a new run instead of joining the cancelled one
+    assert restarted is not job and not coalesced
+
+    pid = int(job.log[0])
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("the scraper process was left running")
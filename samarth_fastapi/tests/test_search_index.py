@@ -0,0 +1,87 @@
+from app.services.search_index import InternshipSearchIndex
+from factories import internship
+
+
+def build(*internships):
+    index = InternshipSearchIndex()
+    index.add_many(internships)
+    return index
+
+
+def test_keyword_words_are_anded_and_prefix_matched():
+    index = build(
+        internship(id=1, title="Data Science Intern"),
+        internship(id=2, title="Data Entry"),
+        internship(id=3, title="Web Developer", description="Science outreach"),
+    )
+    assert index.search(keyword="data sci") == ([1], 1)
+    assert index.search(keyword="dat")[1] == 2
+    # matching starts at word boundaries, unlike a substring scan
+    assert index.search(keyword="ata") == ([], 0)
+
+
+def test_location_words_are_anded_and_prefix_matched():
+    index = build(
+        internship(id=1, location="New Delhi"),
+        internship(id=2, location="New York"),
+        internship(id=3, location="Delhi NCR"),
+    )
+    assert index.search(location="new del") == ([1], 1)
+    assert index.search(location="delhi")[0] == [1, 3]
+    assert index.search(location="ew Del") == ([], 0)
+
+
+def test_skills_are_ored_by_whole_name():
+    index = build(
+        internship(id=1, skills_required=["Python"]),
+        internship(id=2, skills_required=["SQL"]),
+        internship(id=3, skills_required=["Java"]),
+        internship(id=4, skills_required=["Pythonic Design"]),
+    )
+    ids, total = index.search(skills=["python", " SQL "])
+    assert sorted(ids) == [1, 2]
+    assert total == 2
+
+
+def test_filters_are_combined():
+    index = build(
+        internship(id=1, title="Python Intern", location="Pune", skills_required=["Python"]),
+        internship(id=2, title="Python Intern", location="Mumbai", skills_required=["Python"]),
+        internship(id=3, title="Python Intern", location="Pune", skills_required=["Go"]),
+    )
+    assert index.search(keyword="python", location="pune", skills=["python"]) == ([1], 1)
+
+
+def test_ranking_weights_title_then_skills_then_description():
+    index = build(
+        internship(id=1, title="Python Developer", skills_required=["Java"]),
+        internship(id=2, description="python", skills_required=["Python", "Java"]),
+        internship(id=3, description="python", skills_required=["Java"]),
+        internship(id=4, title="Python", description="python", skills_required=["Java"]),
+    )
+    ids, total = index.search(keyword="python", skills=["python", "java"])
+    # 4: title + description + skill, 1: title + skill, 2: description + two
+    # skills (tied with 1, so by id), 3: description + skill
+    assert (ids, total) == ([4, 1, 2, 3], 4)
+
+
+def test_equal_scores_are_ordered_by_id():
+    index = build(*(internship(id=doc_id, title="Intern") for doc_id in (5, 2, 9, 1)))
+    assert index.search(keyword="intern")[0] == [1, 2, 5, 9]
+
+
+def test_pagination_returns_the_total():
+    index = build(*(internship(id=doc_id, title="Intern") for doc_id in range(1, 11)))
+    assert index.search(keyword="intern", offset=0, limit=4) == ([1, 2, 3, 4], 10)
+    assert index.search(keyword="intern", offset=8, limit=4) == ([9, 10], 10)
+    assert index.search(keyword="intern", offset=20, limit=4) == ([], 10)
+    assert index.search(offset=3, limit=None) == (list(range(4, 11)), 10)
+
+
+def test_reindexing_replaces_old_terms():
+    index = build(internship(id=1, title="Data Analyst"))
+    index.add(internship(id=1, title="Web Developer"))
+    assert index.search(keyword="data") == ([], 0)
+    index.remove(1)
+    assert index.search(keyword="web") == ([], 0)
+    assert len(index) == 0
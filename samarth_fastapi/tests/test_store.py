@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime
+
+from app.storage import create_store
+from factories import admin, internship, student
+
+
+def test_students_round_trip(with_store):
+    async def scenario(store):
+        created = await store.create_student(student())
+        fetched = await store.get_student(created["id"])
+        by_email = await store.get_student_by_email("asha@example.com")
+        updated = await store.update_student(created["id"], {"skills": ["SQL"], "location": "Delhi"})
+        missing = await store.update_student(created["id"] + 1, {"skills": []})
+        return created, fetched, by_email, updated, missing, await store.get_student(created["id"])
+
+    created, fetched, by_email, updated, missing, after = with_store(scenario)
+    assert fetched == by_email == created
+    assert fetched["skills"] == ["Python"]
+    assert updated["skills"] == ["SQL"] and updated["location"] == "Delhi"
+    assert after == updated
+    assert missing is None
+
+
+def test_returned_records_are_copies(with_store):
+    async def scenario(store):
+        created = await store.create_student(student())
+        created["full_name"] = "Changed"
+        fetched = await store.get_student(created["id"])
+        fetched["full_name"] = "Changed again"
+        return await store.get_student(created["id"])
+
+    assert with_store(scenario)["full_name"] == "Asha"
+
+
+def test_upsert_matches_on_external_key(with_store):
+    async def scenario(store):
+        first = await store.upsert_internships([internship("Old title", "link-1"), internship("Other", "link-2")])
+        second = await store.upsert_internships([
+            internship("New title", "link-1", created_at=datetime(2025, 6, 1)),
+            internship("Third", "link-3"),
+        ])
+        return first, second, await store.list_internships()
+
+    first, second, listed = with_store(scenario)
+    assert second[0]["id"] == first[0]["id"]
+    assert second[0]["title"] == "New title"
+    # existing rows keep their created_at
+    assert second[0]["created_at"] == datetime(2025, 1, 1)
+    assert [i["title"] for i in listed] == ["New title", "Other", "Third"]
+
+
+def test_tokens(with_store):
+    async def scenario(store):
+        await store.save_token("abc", {"user_id": 1, "user_type": "student", "email": "a@example.com"})
+        return await store.get_token("abc"), await store.get_token("missing")
+
+    token, missing = with_store(scenario)
+    assert token["user_id"] == 1 and token["user_type"] == "student"
+    assert missing is None
+
+
+def test_sql_store_persists_across_connections(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'samarth.db'}"
+
+    async def main():
+        store = create_store(url)
+        await store.connect()
+        created = await store.create_student(student())
+        await store.create_internship(internship())
+        await store.close()
+
+        store = create_store(url)
+        await store.connect()
+        try:
+            return created, await store.get_student(created["id"]), await store.list_internships()
+        finally:
+            await store.close()
+
+    created, fetched, internships = asyncio.run(main())
+    assert fetched == created
+    assert [i["title"] for i in internships] == ["Intern"]
+
+
+def test_explicit_ids_do_not_collide_with_new_rows(with_store):
+    async def scenario(store):
+        await store.upsert_internships([internship("Seeded", id=50)])
+        await store.upsert_admin(admin(7, "admin@example.com"))
+        created = await store.create_internship(internship("Added later"))
+        upserted = await store.upsert_internships([internship("Upserted later")])
+        return created, upserted, await store.list_internships()
+
+    created, upserted, listed = with_store(scenario)
+    assert created["id"] > 50
+    assert upserted[0]["id"] > created["id"]
+    assert [i["title"] for i in listed] == ["Seeded", "Added later", "Upserted later"]
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+
+def test_postgres_sequence_is_moved_past_explicit_ids(tmp_path):
+    from sqlalchemy.dialects import postgresql
+
+    from app.storage.sql import internships_table
+
+    store = create_store(f"sqlite+aiosqlite:///{tmp_path / 'samarth.db'}")
+    conn = RecordingConnection()
+    asyncio.run(store._sync_id_sequence(conn, internships_table))
+    # SQLite reuses max(rowid) + 1 on its own
+    assert conn.statements == []
+
+    store.dialect = "postgresql"
+    asyncio.run(store._sync_id_sequence(conn, internships_table))
+    (statement,) = conn.statements
+    compiled = statement.compile(dialect=postgresql.dialect())
+    assert "setval(pg_get_serial_sequence(" in str(compiled)
+    assert "SELECT max(internships.id) AS max_1" in str(compiled)
+    assert sorted(compiled.params.values()) == ["id", "internships"]
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+from sqlalchemy import delete
+
+from app.storage import DuplicateKeyError, create_store
+from app.storage.sql import COUNTERS_BUILT_KEY, counters_table, meta_table
+from factories import allocation, application
+
+
+async def fill(store):
+    """Four applications, three of them allocated (two to student 1)."""
+    applied = [
+        await store.create_application(application(1, 5)),
+        await store.create_application(application(1, 6)),
+        await store.create_application(application(2, 5)),
+        await store.create_application(application(3, 6, status="reviewed")),
+    ]
+    for app in applied[:3]:
+        await store.create_allocation(allocation(app))
+
+
+EXPECTED_SUMMARY = {
+    "total_submissions": 4,
+    "total_allocations": 3,
+    "total_interns": 2,
+    "pending_applications": 0,
+    "applications_by_status": {"allocated": 3, "reviewed": 1},
+}
+
+
+def test_empty_summary(with_store):
+    async def scenario(store):
+        return await store.summary(), await store.internship_counts(5)
+
+    summary, counts = with_store(scenario)
+    assert summary == {
+        "total_submissions": 0,
+        "total_allocations": 0,
+        "total_interns": 0,
+        "pending_applications": 0,
+        "applications_by_status": {},
+    }
+    assert counts == {"applications": 0, "allocations": 0}
+
+
+def test_counters_follow_writes(with_store):
+    async def scenario(store):
+        await fill(store)
+        return await store.summary(), await store.internship_counts(5), await store.internship_counts(6)
+
+    summary, counts_5, counts_6 = with_store(scenario)
+    assert summary == EXPECTED_SUMMARY
+    assert counts_5 == {"applications": 2, "allocations": 2}
+    assert counts_6 == {"applications": 2, "allocations": 1}
+
+
+def test_rejected_writes_leave_counters_alone(with_store):
+    async def scenario(store):
+        applied = await store.create_application(application(1, 5))
+        await store.create_allocation(allocation(applied))
+        with pytest.raises(DuplicateKeyError):
+            await store.create_application(application(1, 5))
+        with pytest.raises(DuplicateKeyError):
+            await store.create_allocation(allocation(applied))
+        return await store.summary(), await store.internship_counts(5)
+
+    summary, counts = with_store(scenario)
+    assert summary["total_submissions"] == 1
+    assert summary["total_allocations"] == 1
+    assert summary["applications_by_status"] == {"allocated": 1}
+    assert counts == {"applications": 1, "allocations": 1}
+
+
+def test_sql_counters_are_rebuilt_for_older_databases(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'samarth.db'}"
+
+    async def main():
+        store = create_store(url)
+        await store.connect()
+        await fill(store)
+        # a database written before the counters existed
+        async with store.engine.begin() as conn:
+            await conn.execute(delete(counters_table))
+            await conn.execute(delete(meta_table).where(meta_table.c.key == COUNTERS_BUILT_KEY))
+        await store.close()
+
+        store = create_store(url)
+        await store.connect()
+        try:
+            return await store.summary(), await store.internship_counts(6)
+        finally:
+            await store.close()
+
+    summary, counts = asyncio.run(main())
+    assert summary == EXPECTED_SUMMARY
+    assert counts == {"applications": 2, "allocations": 1}
+
+
+def test_sql_workers_connecting_at_once_rebuild_counters_once(tmp_path):
+    url = f"sqlite+aiosqlite:///{tmp_path / 'samarth.db'}"
+
+    async def main():
+        store = create_store(url)
+        await store.connect()
+        await fill(store)
+        async with store.engine.begin() as conn:
+            await conn.execute(delete(counters_table))
+            await conn.execute(delete(meta_table).where(meta_table.c.key == COUNTERS_BUILT_KEY))
+        await store.close()
+
+        # several workers starting against the same older database
+        workers = [create_store(url) for _ in range(4)]
+        rebuilds = []
+        for worker in workers:
+            rebuild = worker._rebuild_counters
+
+            async def counted(conn, rebuild=rebuild):
+                rebuilds.append(conn)
+                await rebuild(conn)
+            worker._rebuild_counters = counted
+
+        await asyncio.gather(*(worker.connect() for worker in workers))
+        try:
+            async with workers[0].engine.connect() as conn:
+                meta = (await conn.execute(meta_table.select())).all()
+            return len(rebuilds), sorted(meta), await workers[1].summary()
+        finally:
+            for worker in workers:
+                await worker.close()
+
+    rebuilds, meta, summary = asyncio.run(main())
+    assert rebuilds == 1
+    assert meta == [("catalogue_version", 0), ("counters_built", 1)]
+    assert summary == EXPECTED_SUMMARY
@@ -0,0 +1,83 @@
+import pytest
+
+from app.storage import DuplicateKeyError
+from factories import admin, allocation, application, internship, student
+
+
+def test_ids_increase_and_skip_explicit_ones(with_store):
+    async def scenario(store):
+        first = await store.create_internship(internship())
+        await store.upsert_internships([internship(id=10)])
+        after_explicit = await store.create_internship(internship())
+        return first["id"], after_explicit["id"]
+
+    assert with_store(scenario) == (1, 11)
+
+
+def test_student_email_index_follows_updates(with_store):
+    async def scenario(store):
+        asha = await store.create_student(student("asha@example.com"))
+        await store.create_student(student("ravi@example.com"))
+        with pytest.raises(DuplicateKeyError):
+            await store.create_student(student("asha@example.com"))
+        with pytest.raises(DuplicateKeyError):
+            await store.update_student(asha["id"], {"email": "ravi@example.com"})
+        await store.update_student(asha["id"], {"email": "asha@new.example.com"})
+        return (
+            await store.get_student_by_email("asha@example.com"),
+            await store.get_student_by_email("asha@new.example.com"),
+            asha["id"],
+        )
+
+    old, new, asha_id = with_store(scenario)
+    assert old is None
+    assert new["id"] == asha_id
+
+
+def test_admin_email_index_follows_upserts(with_store):
+    async def scenario(store):
+        await store.upsert_admin(admin(1, "admin@example.com"))
+        await store.upsert_admin(admin(1, "root@example.com"))
+        return await store.get_admin_by_email("admin@example.com"), await store.get_admin_by_email("root@example.com")
+
+    old, new = with_store(scenario)
+    assert old is None
+    assert new["id"] == 1
+
+
+def test_one_application_per_student_and_internship(with_store):
+    async def scenario(store):
+        created = await store.create_application(application(1, 5))
+        await store.create_application(application(2, 5))
+        with pytest.raises(DuplicateKeyError):
+            await store.create_application(application(1, 5))
+        return (
+            created,
+            await store.find_application(1, 5),
+            await store.find_application(1, 6),
+            len(await store.list_applications()),
+        )
+
+    created, found, missing, count = with_store(scenario)
+    assert found == created
+    assert missing is None
+    assert count == 2
+
+
+def test_one_allocation_per_application(with_store):
+    async def scenario(store):
+        applied = await store.create_application(application(1, 5))
+        allocated = await store.create_allocation(allocation(applied))
+        with pytest.raises(DuplicateKeyError):
+            await store.create_allocation(allocation(applied))
+        return (
+            allocated,
+            await store.get_allocation_by_application(applied["id"]),
+            await store.get_application(applied["id"]),
+            len(await store.list_allocations()),
+        )
+
+    allocated, found, applied, count = with_store(scenario)
+    assert found == allocated
+    assert applied["status"] == "allocated"
+    assert count == 1
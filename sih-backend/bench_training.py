@@ -0,0 +1,198 @@
+"""
+Scaling benchmark for the training pipeline.
+
+Generates synthetic job catalogues and student sets at multiples of the
+current data (data/jobs.json and data/students_demo.json), runs
+train_xgb_model.py on each in a fresh process and collects the stage
+timing / peak RSS profile it writes next to the model. Everything goes
+under data/bench/<scale>x/; the combined results go to data/bench/results.json.
+
+Run with:
+    python bench_training.py                      # 1x, 10x, 100x
+    python bench_training.py --scales 1 10 --compare data/bench/baseline.json
+
+With --compare, stages more than --tolerance slower than in the given
+results file are reported and the exit code is 1.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from train_xgb_model import DATA_DIR, JOBS_PATH, STUDENTS_PATH, profile_path_for
+from job_catalogue import load_jobs
+
+BENCH_DIR = os.path.join(DATA_DIR, "bench")
+RESULTS_PATH = os.path.join(BENCH_DIR, "results.json")
+STAGES = ["load", "tfidf", "pairs", "split", "smote", "tune", "fit", "evaluate", "save"]
+
+
+# -----------------------------
+# Synthetic data
+# -----------------------------
+def synthetic_jobs(base_jobs, n: int, rng) -> list:
+    # titles/descriptions of real jobs, with location/mode/duration reshuffled
+    locations = sorted({str(j.get("location", "")) for j in base_jobs})
+    modes = sorted({str(j.get("wfh", "")) for j in base_jobs})
+    durations = sorted({str(j.get("duration", "")) for j in base_jobs})
+    picks = rng.integers(0, len(base_jobs), n)
+    jobs = []
+    for job_id, i in enumerate(picks, start=1):
+        job = dict(base_jobs[i])
+        job["job_id"] = job_id
+        job["location"] = locations[rng.integers(len(locations))]
+        job["wfh"] = modes[rng.integers(len(modes))]
+        job["duration"] = durations[rng.integers(len(durations))]
+        jobs.append(job)
+    return jobs
+
+
+def synthetic_students(base_students, base_jobs, n: int, rng) -> list:
+    # skills drawn partly from job title words so some pairs get positive labels
+    title_words = sorted({
+        w for j in base_jobs for w in str(j.get("job_title", "")).lower().split() if w.isalpha()
+    })
+    skills = sorted({
+        s.strip() for st in base_students for s in str(st.get("skills", "")).split(",") if s.strip()
+    })
+    domains = sorted({
+        d.strip() for st in base_students for d in str(st.get("preferred_domains", "")).split(",") if d.strip()
+    })
+    locations = sorted({
+        l.strip() for st in base_students for l in str(st.get("preferred_locations", "")).split(",") if l.strip()
+    })
+
+    def choose(pool, low, high):
+        k = min(len(pool), int(rng.integers(low, high + 1)))
+        return [pool[i] for i in rng.choice(len(pool), k, replace=False)]
+
+    students = []
+    for student_id in range(1, n + 1):
+        template = base_students[rng.integers(len(base_students))]
+        student = dict(template)
+        student["student_id"] = student_id
+        student["name"] = f"Student {student_id}"
+        student["cgpa"] = round(float(rng.uniform(6.0, 10.0)), 2)
+        student["skills"] = ",".join(choose(skills, 2, 4) + choose(title_words, 1, 3))
+        student["preferred_domains"] = ",".join(choose(domains, 1, 3))
+        student["preferred_locations"] = ",".join(choose(locations, 1, 3))
+        student["min_duration_months"] = int(rng.integers(0, 7))
+        students.append(student)
+    return students
+
+
+def write_dataset(scale: int, seed: int) -> str:
+    out_dir = os.path.join(BENCH_DIR, f"{scale}x")
+    os.makedirs(out_dir, exist_ok=True)
+    base_jobs = load_jobs(JOBS_PATH).to_dict("records")
+    with open(STUDENTS_PATH, "r", encoding="utf-8") as f:
+        base_students = json.load(f)
+
+    rng = np.random.default_rng(seed + scale)
+    jobs = synthetic_jobs(base_jobs, len(base_jobs) * scale, rng)
+    students = synthetic_students(base_students, base_jobs, len(base_students) * scale, rng)
+    for name, records in (("jobs.json", jobs), ("students.json", students)):
+        with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False)
+    return out_dir
+
+
+# -----------------------------
+# Runs
+# -----------------------------
+def run_scale(scale: int, seed: int, workers) -> dict:
+    out_dir = write_dataset(scale, seed)
+    model_path = os.path.join(out_dir, "model.json")
+    cmd = [
+        sys.executable, "train_xgb_model.py",
+        "--jobs", os.path.join(out_dir, "jobs.json"),
+        "--students", os.path.join(out_dir, "students.json"),
+        "--model-output", model_path,
+        "--pairs-output", os.path.join(out_dir, "training_pairs.csv"),
+    ]
+    if workers:
+        cmd += ["--workers", str(workers)]
+
+    # a fresh process per scale, so peak RSS is not carried over between runs
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["no output"]
+        return {"scale": scale, "error": tail[0]}
+    with open(profile_path_for(model_path), "r", encoding="utf-8") as f:
+        profile = json.load(f)
+    return {"scale": scale, **profile}
+
+
+def print_table(results):
+    header = f"{'scale':>6} {'jobs':>8} {'students':>9} {'pairs':>9} " + \
+        " ".join(f"{s:>8}" for s in STAGES) + f" {'total':>8} {'peakMB':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        if "error" in r:
+            print(f"{str(r['scale']) + 'x':>6} failed: {r['error']}")
+            continue
+        seconds = {s["stage"]: s["seconds"] for s in r["stages"]}
+        peak = max(filter(None, [r.get("peak_rss_mb"), r.get("children_peak_rss_mb")]), default=0)
+        print(
+            f"{str(r['scale']) + 'x':>6} {r['n_jobs']:>8} {r['n_students']:>9} {r['n_pairs']:>9} "
+            + " ".join(f"{seconds.get(s, 0):>8.2f}" for s in STAGES)
+            + f" {r['total_seconds']:>8.2f} {peak:>8.1f}"
+        )
+
+
+def compare(results, baseline_path: str, tolerance: float) -> bool:
+    # stages that take (1 + tolerance) times as long as in the baseline;
+    # sub-50ms stages are too noisy to judge
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {r["scale"]: r for r in json.load(f) if "error" not in r}
+
+    regressions = []
+    for r in results:
+        base = baseline.get(r["scale"])
+        if base is None or "error" in r:
+            continue
+        base_seconds = {s["stage"]: s["seconds"] for s in base["stages"]}
+        for s in r["stages"]:
+            before = base_seconds.get(s["stage"])
+            if before and max(before, s["seconds"]) >= 0.05 and s["seconds"] > before * (1 + tolerance):
+                regressions.append(f"{r['scale']}x {s['stage']}: {before:.3f}s -> {s['seconds']:.3f}s")
+    for line in regressions:
+        print("[REGRESSION]", line)
+    if not regressions:
+        print(f"No stage slower than {baseline_path} by more than {tolerance:.0%}")
+    return not regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the training pipeline at growing data sizes.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100],
+                        help="multiples of the current jobs/students counts")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", type=int, default=None, help="passed to train_xgb_model.py")
+    parser.add_argument("--output", default=RESULTS_PATH)
+    parser.add_argument("--compare", help="earlier results.json to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown per stage for --compare (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = []
+    for scale in args.scales:
+        print(f"Running {scale}x ...")
+        results.append(run_scale(scale, args.seed, args.workers))
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print_table(results)
+    print("Saved benchmark results to:", args.output)
+
+    if args.compare and not compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Makes the sih-backend modules importable when pytest runs from here.
@@ -0,0 +1,169 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pandas as pd
+
+# -----------------------------
+# Interest log
+# -----------------------------
+# "I'm Interested" clicks are appended to an SQLite table in WAL mode: an
+# insert is O(1), concurrent writers queue on the database lock instead of
+# overwriting each other, and readers never block writers. `seq` grows
+# with every insert, so a reader can fetch only the rows it has not seen.
+# A withdrawal is appended too (withdrawn = 1) and cancels the student's
+# earlier interests in that job.
+INTEREST_COLS = ["student_id", "student_name", "job_id", "match_score", "applied_at"]
+BUSY_TIMEOUT_S = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interests (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id   INTEGER NOT NULL,
+    student_name TEXT,
+    job_id       INTEGER NOT NULL,
+    match_score  REAL,
+    applied_at   TEXT NOT NULL,
+    withdrawn    INTEGER NOT NULL DEFAULT 0
+)
+"""
+_INDEX = "CREATE INDEX IF NOT EXISTS interests_job ON interests (job_id, seq)"
+
+
+# Databases whose schema this process has already set up; the per-append
+# connection then only has to set its own sync mode
+_initialised = set()
+
+
+def _initialise(conn):
+    # WAL (persistent in the file) lets readers run while one writer appends
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(_SCHEMA)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(interests)")}
+    if "withdrawn" not in columns:  # logs written before withdrawals existed
+        conn.execute("ALTER TABLE interests ADD COLUMN withdrawn INTEGER NOT NULL DEFAULT 0")
+    conn.execute(_INDEX)
+
+
+@contextmanager
+def _connect(db_path: str):
+    # one short-lived connection per call, so threads and processes can
+    # share the log without sharing connections
+    key = os.path.abspath(db_path)
+    fresh = key not in _initialised or not os.path.exists(db_path)
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_S)
+    try:
+        # NORMAL only syncs at WAL checkpoints, which is what batches the fsyncs
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if fresh:
+            _initialise(conn)
+            _initialised.add(key)
+        yield conn
+    finally:
+        conn.close()
+
+
+def _row(interest: dict) -> tuple:
+    applied_at = interest.get("applied_at")
+    if applied_at is None or pd.isna(applied_at) or applied_at == "":
+        applied_at = datetime.now(timezone.utc).isoformat()
+    return (
+        int(interest["student_id"]),
+        interest.get("student_name"),
+        int(interest["job_id"]),
+        None if pd.isna(interest.get("match_score")) else float(interest["match_score"]),
+        str(applied_at),
+        int(bool(interest.get("withdrawn", 0))),
+    )
+
+
+def append_interests(db_path: str, interests) -> int:
+    """
+    Append interest records (dicts with INTEREST_COLS; applied_at defaults
+    to now, withdrawn to 0) in one transaction. Returns the seq of the last
+    row written.
+    """
+    rows = [_row(i) for i in interests]
+    with _connect(db_path) as conn:
+        with conn:
+            conn.executemany(
+                "INSERT INTO interests "
+                "(student_id, student_name, job_id, match_score, applied_at, withdrawn) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM interests").fetchone()[0]
+
+
+def append_interest(db_path: str, student_id: int, student_name: str, job_id: int, match_score: float) -> dict:
+    interest = {
+        "student_id": student_id,
+        "student_name": student_name,
+        "job_id": job_id,
+        "match_score": match_score,
+        "applied_at": datetime.now(timezone.utc).isoformat(),
+    }
+    append_interests(db_path, [interest])
+    return interest
+
+
+def withdraw_interest(db_path: str, student_id: int, job_id: int) -> int:
+    return append_interests(
+        db_path, [{"student_id": student_id, "job_id": job_id, "match_score": None, "withdrawn": 1}]
+    )
+
+
+def last_seq(db_path: str) -> int:
+    if not os.path.exists(db_path):
+        return 0
+    with _connect(db_path) as conn:
+        return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM interests").fetchone()[0]
+
+
+def read_events(db_path: str, after_seq: int = 0, job_ids=None) -> pd.DataFrame:
+    """
+    Log rows (interests and withdrawals) with seq > after_seq, oldest first,
+    optionally only those of the given jobs. Columns: seq, INTEREST_COLS,
+    withdrawn.
+    """
+    columns = ["seq"] + INTEREST_COLS + ["withdrawn"]
+    if not os.path.exists(db_path):
+        return pd.DataFrame(columns=columns)
+    query = "SELECT " + ", ".join(columns) + " FROM interests WHERE seq > ?"
+    params = [after_seq]
+    with _connect(db_path) as conn:
+        if job_ids is None:
+            return pd.read_sql_query(query + " ORDER BY seq", conn, params=params)
+        # the job list goes through a temp table; it can exceed SQLite's
+        # bound-parameter limit
+        conn.execute("CREATE TEMP TABLE wanted_jobs (job_id INTEGER PRIMARY KEY)")
+        conn.executemany("INSERT OR IGNORE INTO wanted_jobs VALUES (?)", [(int(j),) for j in job_ids])
+        return pd.read_sql_query(
+            query + " AND job_id IN (SELECT job_id FROM wanted_jobs) ORDER BY seq", conn, params=params
+        )
+
+
+def active_interests(events: pd.DataFrame) -> pd.DataFrame:
+    """Interest rows not cancelled by a later withdrawal (seq + INTEREST_COLS)."""
+    withdrawn = events["withdrawn"].astype(bool)
+    last_withdrawal = (
+        events[withdrawn].groupby(["student_id", "job_id"])["seq"].max().rename("withdrawn_seq")
+    )
+    interests = events[~withdrawn].join(last_withdrawal, on=["student_id", "job_id"])
+    keep = interests["withdrawn_seq"].isna() | (interests["seq"] > interests["withdrawn_seq"])
+    return interests.loc[keep, ["seq"] + INTEREST_COLS].reset_index(drop=True)
+
+
+def read_interests(db_path: str, job_ids=None) -> pd.DataFrame:
+    """Current interests, oldest first, optionally only those of the given jobs."""
+    return active_interests(read_events(db_path, job_ids=job_ids))
+
+
+def import_csv(csv_path: str, db_path: str, chunk_rows: int = 50_000) -> int:
+    """Bulk-load an interests CSV (e.g. the old interests.csv) into the log."""
+    imported = 0
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_rows):
+        append_interests(db_path, chunk.to_dict("records"))
+        imported += len(chunk)
+    return imported
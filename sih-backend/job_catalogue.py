@@ -0,0 +1,182 @@
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: without it the derived columns are computed on load
+    pa = None
+
+# -----------------------------
+# Job catalogue loading (shared)
+# -----------------------------
+# The scraper writes either one jobs.json array or NDJSON (one record per
+# line, optionally gzipped). NDJSON is read in chunks, so the raw text and
+# the per-record dicts never have to be in memory all at once.
+NDJSON_SUFFIXES = (".ndjson", ".ndjson.gz", ".jsonl", ".jsonl.gz")
+CHUNK_SIZE = 5000
+
+
+def resolve_jobs_path(path: str) -> str:
+    # data/jobs.json falls back to data/jobs.ndjson[.gz] when only that exists
+    if os.path.exists(path):
+        return path
+    stem = path[:-len(".json")] if path.endswith(".json") else path
+    for suffix in NDJSON_SUFFIXES:
+        if os.path.exists(stem + suffix):
+            return stem + suffix
+    return path
+
+
+def iter_job_chunks(path: str, chunksize: int = CHUNK_SIZE):
+    # every scraper field is a string except job_id, so no dtype inference is
+    # needed; that also keeps column types identical from chunk to chunk
+    compression = "gzip" if path.endswith(".gz") else None
+    with pd.read_json(
+        path,
+        lines=True,
+        chunksize=chunksize,
+        compression=compression,
+        dtype=False,
+        convert_dates=False,
+    ) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+def load_jobs(path: str, chunksize: int = CHUNK_SIZE) -> pd.DataFrame:
+    path = resolve_jobs_path(path)
+    if not path.endswith(NDJSON_SUFFIXES):
+        return pd.read_json(path)
+
+    chunks = list(iter_job_chunks(path, chunksize))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True)
+
+
+# -----------------------------
+# Derived job columns
+# -----------------------------
+# The scraper precomputes these into its columnar catalogue
+# (Scraper/internship_scraper/catalogue.py); keep both in sync and bump
+# CATALOGUE_VERSION there and here when the rules change.
+# tests/test_job_catalogue.py compares the two on the same records.
+CATALOGUE_VERSION = "1"
+CATALOGUE_SUFFIXES = (".arrow", ".parquet")
+
+
+def parse_duration_to_months(duration_str: str) -> float:
+    if not isinstance(duration_str, str):
+        return 0.0
+    s = duration_str.lower().strip()
+    if "month" in s:
+        num = "".join(ch for ch in s if ch.isdigit())
+        return float(num) if num else 0.0
+    if "week" in s:
+        num = "".join(ch for ch in s if ch.isdigit())
+        weeks = float(num) if num else 0.0
+        return weeks / 4.0
+    if "year" in s:
+        num = "".join(ch for ch in s if ch.isdigit())
+        years = float(num) if num else 0.0
+        return years * 12.0
+    return 0.0
+
+
+def simple_location_tokens(loc_str: str):
+    if not isinstance(loc_str, str):
+        return set()
+    loc_str = loc_str.lower().replace(",", " ")
+    return set(loc_str.split())
+
+
+def build_domain_from_title(title: str):
+    if not isinstance(title, str):
+        return "other"
+    t = title.lower()
+    if "data science" in t or "data analyst" in t:
+        return "data science"
+    if "machine learning" in t or "aiml" in t or " ai" in t:
+        return "machine learning"
+    if "python" in t:
+        return "python"
+    if "web" in t or "full stack" in t or "frontend" in t:
+        return "web development"
+    if "android" in t or "app" in t or "mobile" in t:
+        return "app development"
+    if "cyber" in t or "security" in t:
+        return "cyber security"
+    if "devops" in t or "cloud" in t:
+        return "cloud devops"
+    if "digital marketing" in t or "marketing" in t:
+        return "digital marketing"
+    if "vlsi" in t or "embedded" in t:
+        return "vlsi/embedded"
+    return "other"
+
+
+def add_derived_columns(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    jobs_df["duration_months"] = jobs_df["duration"].apply(parse_duration_to_months)
+    jobs_df["job_title_clean"] = jobs_df["job_title"].fillna("").str.lower()
+    jobs_df["location_tokens"] = jobs_df["location"].apply(simple_location_tokens)
+    jobs_df["domain_auto"] = jobs_df["job_title"].apply(build_domain_from_title)
+    return jobs_df
+
+
+def find_catalogue(jobs_path: str):
+    # data/jobs.json -> data/jobs.arrow or data/jobs.parquet, if present and
+    # at least as new as the job file it was scraped alongside
+    if pa is None:
+        return None
+    jobs_path = resolve_jobs_path(jobs_path)
+    stem = jobs_path
+    for suffix in (".json",) + NDJSON_SUFFIXES:
+        if stem.endswith(suffix):
+            stem = stem[:-len(suffix)]
+            break
+    for suffix in CATALOGUE_SUFFIXES:
+        path = stem + suffix
+        if not os.path.exists(path):
+            continue
+        if os.path.exists(jobs_path) and os.path.getmtime(path) < os.path.getmtime(jobs_path):
+            print(f"Ignoring {path}: older than {jobs_path}")
+            continue
+        return path
+    return None
+
+
+def read_catalogue(path: str):
+    # Arrow IPC files are memory-mapped, so the raw columns are never copied
+    # into Python memory; only the pandas conversion allocates
+    if path.endswith(".parquet"):
+        table = pq.read_table(path, memory_map=True)
+    else:
+        with pa.memory_map(path, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+
+    version = (table.schema.metadata or {}).get(b"catalogue_version", b"").decode()
+    if version != CATALOGUE_VERSION:
+        return None
+
+    jobs_df = table.to_pandas()
+    # stored as sorted lists; the scripts work with sets
+    jobs_df["location_tokens"] = jobs_df["location_tokens"].apply(set)
+    return jobs_df
+
+
+def load_catalogue(jobs_path: str) -> pd.DataFrame:
+    """
+    Jobs with the derived columns (duration_months, job_title_clean,
+    location_tokens, domain_auto), read from the scraper's columnar catalogue
+    when there is a current one and computed from the job file otherwise.
+    """
+    path = find_catalogue(jobs_path)
+    if path is not None:
+        jobs_df = read_catalogue(path)
+        if jobs_df is not None:
+            print("Using columnar catalogue:", path)
+            return jobs_df
+        print(f"Ignoring {path}: catalogue version does not match")
+    return add_derived_columns(load_jobs(jobs_path))
@@ -0,0 +1,194 @@
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+# -----------------------------
+# Student x internship match features (shared)
+# -----------------------------
+# Column order the XGBoost model was trained on
+FEATURE_COLS = [
+    "skills_sim",
+    "domain_match",
+    "loc_sim",
+    "wfh_match",
+    "duration_fit",
+    "student_cgpa",
+    "job_duration_months",
+    "text_sim",
+    "has_exp_flag",
+    "exp_level_num",
+    "rel_exp_flag",
+]
+
+
+def build_domain_from_student(preferred_domains: str):
+    if not isinstance(preferred_domains, str):
+        return []
+    return [d.strip().lower() for d in preferred_domains.split(",") if d.strip()]
+
+
+def student_profile(srow) -> dict:
+    """Everything the features need from one student row, parsed once."""
+    s_skills = str(srow.get("skills", "")).lower()
+    s_domains = build_domain_from_student(srow.get("preferred_domains", ""))
+    s_loc_pref = [
+        l.strip().lower()
+        for l in str(srow.get("preferred_locations", "")).split(",")
+        if l.strip()
+    ]
+
+    # Experience flags (simple, from radio/dropdown)
+    has_exp_str = str(srow.get("has_internship_experience", "No")).strip().lower()
+    experience_level_str = (
+        str(srow.get("experience_level", "Fresher")).strip().lower()
+    )
+    rel_exp_str = str(srow.get("has_relevant_experience", "No")).strip().lower()
+
+    if "2+" in experience_level_str:
+        exp_level_num = 2
+    elif "1" in experience_level_str:
+        exp_level_num = 1
+    else:
+        exp_level_num = 0  # Fresher
+
+    # Student text for TF-IDF based similarity
+    text = " ".join(
+        [
+            s_skills,
+            " ".join(s_domains),
+            " ".join(s_loc_pref),
+            str(srow.get("degree", "")),
+        ]
+    ).strip()
+
+    return {
+        "skill_tokens": set(s_skills.replace(",", " ").split()),
+        "domains": s_domains,
+        "loc_pref": set(s_loc_pref),
+        "wfh_pref": str(srow.get("wfh_preference", "Any")),
+        "min_duration": float(srow.get("min_duration_months", 0)),
+        "cgpa": float(srow.get("cgpa", 0)),
+        "has_exp_flag": 1 if has_exp_str == "yes" else 0,
+        "exp_level_num": exp_level_num,
+        "rel_exp_flag": 1 if rel_exp_str == "yes" else 0,
+        "text": text,
+    }
+
+
+def _indicator_matrix(token_sets):
+    # job x token 0/1 matrix over the tokens the jobs use
+    vocab = {}
+    rows, cols = [], []
+    for row, tokens in enumerate(token_sets):
+        for token in tokens:
+            rows.append(row)
+            cols.append(vocab.setdefault(token, len(vocab)))
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+        shape=(len(token_sets), len(vocab)),
+    )
+    return matrix, vocab
+
+
+def _jaccard_column(matrix, sizes, vocab, tokens):
+    # |A & B| / |A | B| for every job's set A against one student's set B;
+    # 0 when either set is empty
+    if not tokens:
+        return np.zeros(matrix.shape[0])
+    student = np.zeros(matrix.shape[1])
+    student[[vocab[t] for t in tokens if t in vocab]] = 1.0
+    inter = matrix @ student
+    union = sizes + len(tokens) - inter
+    return np.divide(inter, union, out=np.zeros_like(inter), where=sizes > 0)
+
+
+class JobFeatureMatrix:
+    """
+    Job-side inputs of the match features, precomputed once per catalogue.
+
+    Rows follow jobs_df (and job_tfidf) row order. Title keywords and
+    location tokens are sparse job x token indicator matrices, so a
+    student's Jaccard similarities are one sparse product each; WFH modes
+    are integer codes into the table of distinct values.
+    """
+
+    def __init__(self, jobs_df, job_tfidf):
+        self.size = len(jobs_df)
+
+        self.title_words, self.title_vocab = _indicator_matrix(
+            [set(t.split()) for t in jobs_df["job_title_clean"]]
+        )
+        self.title_sizes = np.asarray(self.title_words.sum(axis=1)).ravel()
+
+        self.loc_tokens, self.loc_vocab = _indicator_matrix(
+            list(jobs_df["location_tokens"])
+        )
+        self.loc_sizes = np.asarray(self.loc_tokens.sum(axis=1)).ravel()
+
+        self.domains = jobs_df["domain_auto"].to_numpy(dtype=object)
+        self.durations = jobs_df["duration_months"].to_numpy(dtype=np.float64)
+
+        wfh = [str(w).lower() for w in jobs_df["wfh"]]
+        self.wfh_values, self.wfh_codes = np.unique(
+            np.array(wfh, dtype=object), return_inverse=True
+        )
+
+        # rows scaled to unit length once; cosine similarity is then a dot product
+        self.text = normalize(job_tfidf).tocsr()
+
+    def features(self, profile: dict, student_vec, rows=None) -> np.ndarray:
+        """
+        Feature matrix (jobs x FEATURE_COLS) of one student against every job,
+        or only against the job positions in rows.
+        """
+        title_words, title_sizes = self.title_words, self.title_sizes
+        loc_tokens, loc_sizes = self.loc_tokens, self.loc_sizes
+        domains, durations, wfh_codes, text = (
+            self.domains, self.durations, self.wfh_codes, self.text
+        )
+        if rows is not None:
+            title_words, title_sizes = title_words[rows], title_sizes[rows]
+            loc_tokens, loc_sizes = loc_tokens[rows], loc_sizes[rows]
+            domains, durations, wfh_codes, text = (
+                domains[rows], durations[rows], wfh_codes[rows], text[rows]
+            )
+        size = len(durations)
+
+        skills_sim = _jaccard_column(
+            title_words, title_sizes, self.title_vocab, profile["skill_tokens"]
+        )
+        domain_match = np.isin(domains, profile["domains"]).astype(np.float64)
+        loc_sim = _jaccard_column(
+            loc_tokens, loc_sizes, self.loc_vocab, profile["loc_pref"]
+        )
+
+        wfh_pref = profile["wfh_pref"]
+        if wfh_pref == "Any":
+            wfh_match = np.ones(size)
+        else:
+            # "Virtual" -> "virtual" is covered by the substring test
+            pref = wfh_pref.lower()
+            table = np.array([pref in value for value in self.wfh_values], dtype=np.float64)
+            wfh_match = table[wfh_codes]
+
+        duration_fit = (durations >= profile["min_duration"]).astype(np.float64)
+        text_sim = (text @ normalize(student_vec).T).toarray().ravel()
+
+        def const(value):
+            return np.full(size, value, dtype=np.float64)
+
+        return np.column_stack(
+            [
+                skills_sim,
+                domain_match,
+                loc_sim,
+                wfh_match,
+                duration_fit,
+                const(profile["cgpa"]),
+                durations,
+                text_sim,
+                const(profile["has_exp_flag"]),
+                const(profile["exp_level_num"]),
+                const(profile["rel_exp_flag"]),
+            ]
+        )
@@ -0,0 +1,94 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # not available on Windows; memory figures are then null
+    resource = None
+
+# -----------------------------
+# Stage timing + memory profile
+# -----------------------------
+
+
+def _maxrss_mb(who):
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def current_rss_mb():
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss_mb():
+    return _maxrss_mb(resource.RUSAGE_SELF) if resource else None
+
+
+def children_peak_rss_mb():
+    # largest finished child process (e.g. a pair-generation worker)
+    return _maxrss_mb(resource.RUSAGE_CHILDREN) if resource else None
+
+
+class StageProfiler:
+    """
+    Wall/CPU time and memory of each named stage of a run.
+
+        profiler = StageProfiler()
+        with profiler.stage("load"):
+            ...
+        profiler.save("models/xgb_match_model.profile.json", n_pairs=...)
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.stages = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.stages.append(
+                {
+                    "stage": name,
+                    "seconds": round(time.perf_counter() - wall, 4),
+                    "cpu_seconds": round(time.process_time() - cpu, 4),
+                    "rss_mb": current_rss_mb(),
+                    "peak_rss_mb": peak_rss_mb(),
+                }
+            )
+
+    def report(self, **extra) -> dict:
+        return {
+            "started_at": self.started_at,
+            "total_seconds": round(time.perf_counter() - self._start, 4),
+            "peak_rss_mb": peak_rss_mb(),
+            "children_peak_rss_mb": children_peak_rss_mb(),
+            "stages": self.stages,
+            **extra,
+        }
+
+    def save(self, path: str, **extra) -> dict:
+        report = self.report(**extra)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return report
+
+    def print_summary(self):
+        print("Stage timings:")
+        for s in self.stages:
+            print(f"  {s['stage']:<10} {s['seconds']:>9.3f}s  peak RSS {s['peak_rss_mb']} MB")
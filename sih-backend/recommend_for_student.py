@@ -1,23 +1,40 @@
+import argparse
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from xgboost import XGBClassifier
 
+from job_catalogue import load_catalogue
+from match_features import JobFeatureMatrix, student_profile
+from tfidf_artifacts import load_or_build_tfidf
 from train_xgb_model import (
     DATA_DIR,
     JOBS_PATH,
     STUDENTS_PATH,
     MODEL_PATH,
-    parse_duration_to_months,
-    simple_location_tokens,
-    build_domain_from_title,
-    build_domain_from_student,
+    TFIDF_DIR,
 )
 
+RECOMMENDATIONS_PATH = os.path.join(DATA_DIR, "recommendations.csv")
+
+# Student-job pairs per batch prediction (about 44 MB of float32 features)
+BATCH_CHUNK_ROWS = 1_000_000
+
+# Job columns shown with each recommendation
+RESULT_COLS = [
+    "job_id",
+    "job_title",
+    "company_name",
+    "location",
+    "wfh",
+    "duration",
+    "job_link",
+]
+
 
 def load_xgb_model(path: str) -> XGBClassifier:
     model = XGBClassifier()
@@ -38,137 +55,24 @@ def split_location_mode(location_str: str):
 
 
 def get_recommendations_for_student_row(
-    srow, jobs_df, model, job_tfidf, vectorizer, top_n: int = 10
+    srow, jobs_df, model, job_tfidf, vectorizer, top_n: int = 10, job_features=None
 ):
-    s_skills = str(srow.get("skills", "")).lower()
-    s_domains = build_domain_from_student(srow.get("preferred_domains", ""))
-    s_loc_pref = [
-        l.strip().lower()
-        for l in str(srow.get("preferred_locations", "")).split(",")
-        if l.strip()
-    ]
-    s_loc_pref_set = set(s_loc_pref)
-    s_wfh_pref = str(srow.get("wfh_preference", "Any"))
-    s_min_dur = float(srow.get("min_duration_months", 0))
-    s_cgpa = float(srow.get("cgpa", 0))
-
-    # Experience flags (same logic as training)
-    has_exp_str = str(srow.get("has_internship_experience", "No")).strip().lower()
-    experience_level_str = (
-        str(srow.get("experience_level", "Fresher")).strip().lower()
-    )
-    rel_exp_str = str(srow.get("has_relevant_experience", "No")).strip().lower()
+    # Pass job_features (JobFeatureMatrix) when scoring many students against
+    # the same catalogue, so the job side is only prepared once
+    if job_features is None:
+        job_features = JobFeatureMatrix(jobs_df, job_tfidf)
 
-    has_exp_flag = 1 if has_exp_str == "yes" else 0
-    if "2+" in experience_level_str:
-        exp_level_num = 2
-    elif "1" in experience_level_str:
-        exp_level_num = 1
-    else:
-        exp_level_num = 0
-    rel_exp_flag = 1 if rel_exp_str == "yes" else 0
-
-    # Skill tokens
-    s_skill_tokens = set(s_skills.replace(",", " ").split())
-
-    # Student text for TF-IDF
-    student_text = " ".join(
-        [
-            s_skills,
-            " ".join(s_domains),
-            " ".join(s_loc_pref),
-            str(srow.get("degree", "")),
-        ]
-    ).strip()
-    student_vec = vectorizer.transform([student_text])
-
-    feature_rows = []
-    meta_rows = []
-
-    for _, jrow in jobs_df.iterrows():
-        jid = jrow["job_id"]
-        job_title_clean = jrow["job_title_clean"]
-        job_loc_tokens = jrow["location_tokens"]
-        job_wfh = str(jrow.get("wfh", ""))
-        job_duration = float(jrow.get("duration_months", 0))
-        job_domain = jrow.get("domain_auto", "other")
-
-        job_idx = jrow.name
-        job_vec = job_tfidf[job_idx]
-
-        job_keywords = set(job_title_clean.split())
-        skills_sim = 0.0 if not job_keywords else (
-            sum(1 for w in s_skill_tokens if w in job_keywords)
-            / len(s_skill_tokens | job_keywords)
-            if s_skill_tokens | job_keywords
-            else 0.0
-        )
+    profile = student_profile(srow)
+    student_vec = vectorizer.transform([profile["text"]])
 
-        # Domain match
-        domain_match = 1 if job_domain in s_domains else 0
-
-        # Location similarity
-        loc_sim = 0.0
-        if job_loc_tokens and s_loc_pref_set:
-            inter = len(job_loc_tokens & s_loc_pref_set)
-            union = len(job_loc_tokens | s_loc_pref_set)
-            loc_sim = inter / union if union > 0 else 0.0
-
-        # WFH match
-        if s_wfh_pref == "Any":
-            wfh_match = 1
-        elif s_wfh_pref.lower() in job_wfh.lower():
-            wfh_match = 1
-        elif s_wfh_pref == "Virtual" and "virtual" in job_wfh.lower():
-            wfh_match = 1
-        else:
-            wfh_match = 0
-
-        # Duration fit
-        duration_fit = 1 if job_duration >= s_min_dur else 0
-
-        # Text similarity
-        if student_vec.nnz == 0 or job_vec.nnz == 0:
-            text_sim = 0.0
-        else:
-            text_sim = float(cosine_similarity(student_vec, job_vec)[0, 0])
-
-        feature_rows.append(
-            [
-                skills_sim,
-                domain_match,
-                loc_sim,
-                wfh_match,
-                duration_fit,
-                s_cgpa,
-                job_duration,
-                text_sim,
-                has_exp_flag,
-                exp_level_num,
-                rel_exp_flag,
-            ]
-        )
-
-        meta_rows.append(
-            {
-                "job_id": jid,
-                "job_title": jrow["job_title"],
-                "company_name": jrow.get("company_name", ""),
-                "location": jrow.get("location", ""),
-                "wfh": jrow.get("wfh", ""),
-                "duration": jrow.get("duration", ""),
-                "job_link": jrow.get("job_link", ""),
-            }
-        )
-
-    X_features = np.array(feature_rows)
+    X_features = job_features.features(profile, student_vec)
     scores = model.predict_proba(X_features)[:, 1]
 
-    results_df = pd.DataFrame(meta_rows)
+    results_df = jobs_df.reindex(columns=RESULT_COLS).reset_index(drop=True)
     results_df["match_score"] = scores
 
-    # Sort by score desc
-    results_df = results_df.sort_values(by="match_score", ascending=False)
+    # Sort by score desc (stable: equal scores keep catalogue order)
+    results_df = results_df.sort_values(by="match_score", ascending=False, kind="stable")
 
     # Remove near-duplicate internships (title + company + mode + duration)
     results_df = results_df.drop_duplicates(
@@ -181,9 +85,9 @@ def get_recommendations_for_student_row(
     return results_df
 
 
-def main():
+def load_inputs():
     print("Loading internships from:", JOBS_PATH)
-    jobs_df = pd.read_json(JOBS_PATH)
+    jobs_df = load_catalogue(JOBS_PATH)
 
     print("Loading students from:", STUDENTS_PATH)
     with open(STUDENTS_PATH, "r", encoding="utf-8") as f:
@@ -191,21 +95,123 @@ def main():
     students_df = pd.DataFrame(students)
 
     # Prepare job features similar to training
-    jobs_df["duration_months"] = jobs_df["duration"].apply(parse_duration_to_months)
-    jobs_df["job_title_clean"] = jobs_df["job_title"].fillna("").str.lower()
-    jobs_df["location_tokens"] = jobs_df["location"].apply(simple_location_tokens)
-    jobs_df["domain_auto"] = jobs_df["job_title"].apply(build_domain_from_title)
+    # duration_months, job_title_clean, location_tokens and domain_auto come with the catalogue
 
-    text_corpus = (
-        jobs_df["job_title"].fillna("") + " " + jobs_df["description"].fillna("")
-    ).tolist()
-    vectorizer = TfidfVectorizer(max_features=5000)
-    job_tfidf = vectorizer.fit_transform(text_corpus)
+    # same vocabulary/IDF the model was trained with, refitted only when jobs change
+    vectorizer, job_tfidf = load_or_build_tfidf(jobs_df, JOBS_PATH, TFIDF_DIR)
 
     # Load trained model
     print("Loading XGBoost model from:", MODEL_PATH)
     model = load_xgb_model(MODEL_PATH)
 
+    return jobs_df, students_df, vectorizer, job_tfidf, model
+
+
+# -----------------------------
+# Batch mode: every student x every job
+# -----------------------------
+def top_unique_jobs(scores, dup_groups, top_n: int):
+    """
+    Row positions of the top_n scores, keeping only the best job of each
+    near-duplicate group (same as sort + drop_duplicates in the per-student
+    function, with ties broken by catalogue order).
+    """
+    order = np.argsort(-scores, kind="stable")
+    _, first = np.unique(dup_groups[order], return_index=True)
+    first.sort()
+    return order[first[:top_n]]
+
+
+def recommend_all(
+    students_df,
+    jobs_df,
+    model,
+    job_tfidf,
+    vectorizer,
+    top_n: int = 10,
+    chunk_rows: int = BATCH_CHUNK_ROWS,
+    workers: int = None,
+    job_features=None,
+) -> pd.DataFrame:
+    """
+    Top-N recommendations of every student as one long table
+    (student_id, rank, job_id, match_score).
+
+    Students are scored in chunks of about chunk_rows student-job pairs:
+    their feature rows are built in parallel threads, stacked and scored with
+    a single XGBoost prediction (itself multi-threaded). Student texts go
+    through the vectorizer in one call.
+    """
+    if job_features is None:
+        job_features = JobFeatureMatrix(jobs_df, job_tfidf)
+    n_jobs = len(jobs_df)
+    if n_jobs == 0 or students_df.empty:
+        return pd.DataFrame(columns=["student_id", "rank", "job_id", "match_score"])
+
+    job_ids = jobs_df["job_id"].to_numpy()
+    dup_groups = jobs_df.groupby(
+        ["job_title", "company_name", "wfh", "duration"], dropna=False, sort=False
+    ).ngroup().to_numpy()
+
+    profiles = [student_profile(srow) for _, srow in students_df.iterrows()]
+    student_vecs = vectorizer.transform([p["text"] for p in profiles])
+    student_ids = students_df["student_id"].to_numpy()
+
+    booster = model.get_booster()
+    per_chunk = max(1, chunk_rows // n_jobs)
+    parts = []
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for start in range(0, len(profiles), per_chunk):
+            stop = min(start + per_chunk, len(profiles))
+            blocks = pool.map(
+                lambda i: job_features.features(profiles[i], student_vecs[i]),
+                range(start, stop),
+            )
+            # XGBoost predicts in float32 anyway; stacking in it halves the chunk
+            X_chunk = np.vstack(list(blocks)).astype(np.float32, copy=False)
+            scores = booster.inplace_predict(X_chunk).reshape(stop - start, n_jobs)
+
+            for offset, student_scores in enumerate(scores):
+                top = top_unique_jobs(student_scores, dup_groups, top_n)
+                parts.append(
+                    pd.DataFrame(
+                        {
+                            "student_id": student_ids[start + offset],
+                            "rank": np.arange(1, len(top) + 1),
+                            "job_id": job_ids[top],
+                            "match_score": student_scores[top],
+                        }
+                    )
+                )
+            print(f"Scored {stop}/{len(profiles)} students")
+
+    return pd.concat(parts, ignore_index=True)
+
+
+def save_recommendations(rec_df: pd.DataFrame, path: str):
+    # .parquet needs pyarrow; anything else is written as CSV
+    if path.endswith(".parquet"):
+        rec_df.to_parquet(path, index=False)
+    else:
+        rec_df.to_csv(path, index=False)
+
+
+def run_batch(output_path: str, top_n: int, chunk_rows: int, workers: int):
+    jobs_df, students_df, vectorizer, job_tfidf, model = load_inputs()
+    rec_df = recommend_all(
+        students_df, jobs_df, model, job_tfidf, vectorizer,
+        top_n=top_n, chunk_rows=chunk_rows, workers=workers,
+    )
+    save_recommendations(rec_df, output_path)
+    print(f"Saved {len(rec_df)} recommendations for "
+          f"{rec_df['student_id'].nunique()} students to: {output_path}")
+
+
+def print_recommendations(top_n: int):
+    jobs_df, students_df, vectorizer, job_tfidf, model = load_inputs()
+    job_features = JobFeatureMatrix(jobs_df, job_tfidf)
+
     # For each student -> print recommendations
     for _, srow in students_df.iterrows():
         sid = srow["student_id"]
@@ -217,7 +223,8 @@ def main():
         print()
 
         rec_df = get_recommendations_for_student_row(
-            srow, jobs_df, model, job_tfidf, vectorizer, top_n=10
+            srow, jobs_df, model, job_tfidf, vectorizer, top_n=top_n,
+            job_features=job_features,
         )
 
         if rec_df.empty:
@@ -240,5 +247,25 @@ def main():
             print()
 
 
+def main():
+    parser = argparse.ArgumentParser(description="XGBoost internship recommendations.")
+    parser.add_argument("--batch", action="store_true",
+                        help="score every student against every job and save the top-N table "
+                             "instead of printing")
+    parser.add_argument("--output", default=RECOMMENDATIONS_PATH,
+                        help="batch output (.csv, or .parquet with pyarrow)")
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--chunk-rows", type=int, default=BATCH_CHUNK_ROWS,
+                        help="student-job pairs scored per prediction call")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="threads building feature rows (default: all cores)")
+    args = parser.parse_args()
+
+    if args.batch:
+        run_batch(args.output, args.top_n, args.chunk_rows, args.workers)
+    else:
+        print_recommendations(args.top_n)
+
+
 if __name__ == "__main__":
     main()
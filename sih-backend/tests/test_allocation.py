@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from interest_and_allocation import allocate, global_allocate, prepare_interests
+
+EXP_MAP = {"fresher": 0, "1 internship": 1, "2+ internships": 2}
+
+
+def random_inputs(seed, n_students=40, n_jobs=8, n_interests=200):
+    rng = np.random.default_rng(seed)
+    students_df = pd.DataFrame({
+        "student_id": np.arange(n_students),
+        "cgpa": rng.choice([7.0, 8.0, 9.0], n_students),
+        "year_of_study": rng.integers(1, 5, n_students),
+        "has_internship_experience": rng.choice(["Yes", "No", None], n_students),
+        "experience_level": rng.choice(["Fresher", "1 internship", " 2+ Internships", None], n_students),
+        "has_relevant_experience": rng.choice(["yes", "No", None], n_students),
+    })
+    jobs_df = pd.DataFrame({
+        "job_id": np.arange(100, 100 + n_jobs),
+        "job_title": [f"Job {j}" for j in range(n_jobs)],
+        "company_name": "Acme",
+        "location": "Pune",
+        "wfh": "No",
+        "duration": "3 months",
+        "capacity": rng.choice([1, 2, 3, 0, np.nan], n_jobs),
+    })
+    student_rows = rng.integers(0, n_students, n_interests)
+    interests_df = pd.DataFrame({
+        "student_id": student_rows,
+        "student_name": [f"S{s}" for s in student_rows],
+        "job_id": rng.integers(100, 100 + n_jobs, n_interests),
+        # coarse scores so the tie-breakers decide, unique times so nothing ties completely
+        "match_score": rng.choice([0.25, 0.5, 0.75], n_interests),
+        "applied_at": pd.Timestamp("2025-11-01", tz="UTC")
+        + pd.to_timedelta(rng.permutation(n_interests), unit="min"),
+    })
+    return interests_df, students_df, jobs_df
+
+
+def reference_allocation(interests_df, students_df, jobs_df, default_capacity):
+    # the per-job loop the vectorized engine replaced
+    jobs_df = jobs_df.copy()
+    jobs_df["capacity"] = jobs_df["capacity"].fillna(default_capacity)
+    jobs_df.loc[jobs_df["capacity"] <= 0, "capacity"] = default_capacity
+    merged = interests_df.merge(students_df, on="student_id", how="left").merge(jobs_df, on="job_id", how="left")
+    rows = []
+    for job_id, group in merged.groupby("job_id"):
+        group = group.copy()
+        group["exp_level_num"] = (
+            group["experience_level"].fillna("Fresher").str.strip().str.lower().map(EXP_MAP).fillna(0)
+        )
+        group["rel_exp_flag"] = group["has_relevant_experience"].fillna("No").str.strip().str.lower().eq("yes")
+        group = group.sort_values(
+            by=["match_score", "rel_exp_flag", "exp_level_num", "cgpa", "year_of_study", "applied_at"],
+            ascending=[False, False, False, False, False, True],
+        )
+        for student_id in group.head(int(group["capacity"].iloc[0]))["student_id"]:
+            rows.append((job_id, student_id))
+    return rows
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("default_capacity", [1, 2])
+def test_vectorized_allocation_matches_the_per_job_loop(seed, default_capacity):
+    interests_df, students_df, jobs_df = random_inputs(seed)
+    merged = prepare_interests(interests_df, students_df, jobs_df, default_capacity)
+    allocation = allocate(merged)
+
+    assert list(zip(allocation["job_id"], allocation["student_id"])) == reference_allocation(
+        interests_df, students_df, jobs_df, default_capacity
+    )
+
+
+def test_unknown_jobs_get_the_default_capacity():
+    interests_df, students_df, jobs_df = random_inputs(0)
+    interests_df.loc[:4, "job_id"] = 999
+    interests_df.loc[:4, "match_score"] = [0.1, 0.9, 0.2, 0.8, 0.3]
+    merged = prepare_interests(interests_df, students_df, jobs_df, default_capacity=2)
+    allocation = allocate(merged)
+
+    unknown = allocation[allocation["job_id"] == 999]
+    assert unknown["match_score"].tolist() == [0.9, 0.8]
+    assert (unknown["capacity"] == 2).all()
+
+
+def global_inputs():
+    # student 1 is everyone's favourite; job 10 is the only one student 2 wants
+    rows = [(1, 10, 0.9), (1, 11, 0.8), (2, 10, 0.7), (3, 11, 0.5)]
+    df = pd.DataFrame(rows, columns=["student_id", "job_id", "match_score"])
+    df["student_name"] = "S" + df["student_id"].astype(str)
+    df["capacity"] = 1
+    df["cgpa"] = 8.0
+    df["rel_exp_flag"] = 0
+    df["exp_level_num"] = 0
+    df["year_of_study"] = 3
+    df["applied_at"] = pd.Timestamp("2025-11-01", tz="UTC")
+    return df
+
+
+def test_greedy_lets_one_student_take_several_seats():
+    allocation = allocate(global_inputs())
+    assert list(zip(allocation["job_id"], allocation["student_id"])) == [(10, 1), (11, 1)]
+
+
+def test_global_spreads_seats_and_maximizes_the_total():
+    allocation = global_allocate(global_inputs(), max_per_student=1)
+    # 1 -> 11 and 2 -> 10 (0.8 + 0.7) beats giving student 1 their best job
+    # (0.9 + 0.5 with student 3 in job 11)
+    assert sorted(zip(allocation["job_id"], allocation["student_id"])) == [(10, 2), (11, 1)]
+    assert allocation["match_score"].sum() == pytest.approx(1.5)
+
+
+def test_global_with_room_per_student_matches_greedy():
+    df = global_inputs()
+    greedy = allocate(df)
+    allocation = global_allocate(df, max_per_student=2)
+    assert sorted(zip(allocation["job_id"], allocation["student_id"])) == sorted(
+        zip(greedy["job_id"], greedy["student_id"])
+    )
@@ -0,0 +1,106 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import interest_and_allocation as ia
+from interest_and_allocation import global_allocate
+
+
+def interests(rows):
+    """rows: (student_id, job_id, match_score, capacity[, cgpa])"""
+    df = pd.DataFrame(
+        [(s, j, score, cap, extra[0] if extra else 8.0) for s, j, score, cap, *extra in rows],
+        columns=["student_id", "job_id", "match_score", "capacity", "cgpa"],
+    )
+    df["student_name"] = "S" + df["student_id"].astype(str)
+    df["rel_exp_flag"] = 0
+    df["exp_level_num"] = 0
+    df["year_of_study"] = 3
+    df["applied_at"] = pd.Timestamp("2025-11-01", tz="UTC")
+    return df
+
+
+def brute_force_best(df, max_per_student):
+    # highest total match_score over every feasible subset of interests
+    rows = list(df.itertuples(index=False))
+    best = 0.0
+    for k in range(1, len(rows) + 1):
+        for subset in itertools.combinations(rows, k):
+            per_student = pd.Series([r.student_id for r in subset]).value_counts()
+            per_job = pd.Series([r.job_id for r in subset]).value_counts()
+            if per_student.max() > max_per_student:
+                continue
+            if any(per_job[j] > next(r.capacity for r in subset if r.job_id == j) for j in per_job.index):
+                continue
+            best = max(best, sum(r.match_score for r in subset))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_global_allocation_is_score_optimal(seed):
+    rng = np.random.default_rng(seed)
+    # near-equal scores, so any tie-break bonus leaking into the score
+    # objective would pick a worse assignment
+    levels = [0.3, 0.5, 0.5 + 1e-9, 0.5 + 2e-9, 0.8, 0.8 - 1e-10]
+    n_students, n_jobs = int(rng.integers(2, 5)), int(rng.integers(2, 4))
+    capacity = rng.integers(1, 3, n_jobs)
+    pairs = {(int(rng.integers(n_students)), int(rng.integers(n_jobs))) for _ in range(10)}
+    df = interests([(s, j, levels[rng.integers(len(levels))], capacity[j]) for s, j in sorted(pairs)])
+    max_per_student = int(rng.integers(1, 3))
+
+    allocation = global_allocate(df, max_per_student)
+
+    assert allocation.groupby("student_id").size().max() <= max_per_student
+    assert (allocation.groupby("job_id").size() <= allocation.groupby("job_id")["capacity"].first()).all()
+    assert allocation["match_score"].sum() == pytest.approx(brute_force_best(df, max_per_student), abs=1e-12)
+
+
+def test_tie_break_decides_between_equal_scores():
+    # one seat, equal scores: the higher CGPA wins
+    df = interests([(1, 7, 0.5, 1, 7.0), (2, 7, 0.5, 1, 9.0)])
+    assert global_allocate(df)["student_id"].tolist() == [2]
+
+
+def test_tie_break_never_costs_score():
+    # A alone in job 1 beats A in job 2 + B in job 1 by 1e-9; the second
+    # option fills two early-ranked seats, so a tie-break bonus added to
+    # the score would prefer it
+    rows = [(1, 1, 1.0 + 2e-9, 1), (1, 2, 0.5, 1), (2, 1, 0.5 + 1e-9, 1)]
+    rows += [(100 + k, 100 + k, 0.1, 1) for k in range(10)]
+    allocation = global_allocate(interests(rows))
+    core = allocation[allocation["job_id"] < 100]
+    assert list(zip(core["student_id"], core["job_id"])) == [(1, 1)]
+
+
+def test_student_gets_at_most_max_per_student():
+    # greedy per job would give student 1 both seats
+    df = interests([(1, 10, 0.9, 1), (1, 11, 0.8, 1), (2, 10, 0.7, 1), (2, 11, 0.6, 1)])
+    allocation = global_allocate(df, max_per_student=1)
+    assert sorted(zip(allocation["student_id"], allocation["job_id"])) == [(1, 11), (2, 10)]
+
+
+def test_empty_interests():
+    assert global_allocate(interests([])).empty
+
+
+def test_failed_tie_break_pass_warns_and_keeps_the_score_optimum(monkeypatch):
+    calls = []
+
+    def solve_lp(objective, A, b, bounds, tight=None):
+        calls.append(len(objective))
+        if len(calls) == 2:
+            raise RuntimeError("Global allocation failed: numerical trouble")
+        return solve(objective, A, b, bounds, tight)
+
+    solve = ia._solve_lp
+    monkeypatch.setattr(ia, "_solve_lp", solve_lp)
+    df = interests([(1, 10, 0.9, 1), (1, 11, 0.8, 1), (2, 10, 0.7, 1), (2, 11, 0.6, 1)])
+
+    with pytest.warns(RuntimeWarning, match="tie-break pass failed .*numerical trouble"):
+        allocation = global_allocate(df, max_per_student=1)
+
+    assert len(calls) == 2
+    assert sorted(zip(allocation["student_id"], allocation["job_id"])) == [(1, 11), (2, 10)]
+    assert allocation["match_score"].sum() == pytest.approx(brute_force_best(df, 1))
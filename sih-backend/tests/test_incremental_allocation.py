@@ -0,0 +1,144 @@
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import interest_and_allocation as ia
+from interest_log import append_interests, read_interests, withdraw_interest
+
+JOB_IDS = list(range(100, 112))
+STUDENT_IDS = list(range(1, 41))
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Allocation inputs and outputs in tmp_path; records the job_ids each run reads."""
+    rng = np.random.default_rng(0)
+    jobs = [
+        {"job_id": j, "job_title": f"Intern {j}", "company_name": "Acme", "location": "Pune",
+         "wfh": "No", "duration": "3 months", "capacity": int(rng.integers(1, 4))}
+        for j in JOB_IDS
+    ]
+    students = [
+        {"student_id": s, "name": f"S{s}", "cgpa": float(rng.choice([7.0, 8.0, 9.0])),
+         "year_of_study": int(rng.integers(1, 5)), "has_internship_experience": "No",
+         "experience_level": "Fresher", "has_relevant_experience": "No"}
+        for s in STUDENT_IDS
+    ]
+    (tmp_path / "jobs.json").write_text(json.dumps(jobs))
+    (tmp_path / "students.json").write_text(json.dumps(students))
+    monkeypatch.setattr(ia, "JOBS_PATH", str(tmp_path / "jobs.json"))
+    monkeypatch.setattr(ia, "STUDENTS_PATH", str(tmp_path / "students.json"))
+    for name in ("INTERESTS_DB", "INTERESTS_CSV", "ALLOCATION_CSV", "ALLOCATION_STATE", "ALLOCATION_CHANGES_CSV"):
+        monkeypatch.setattr(ia, name, str(tmp_path / os.path.basename(getattr(ia, name))))
+    monkeypatch.setattr(ia, "print_allocation_pretty", lambda df: None)
+
+    reads = []
+
+    def recording_read_interests(db_path, job_ids=None):
+        reads.append(None if job_ids is None else sorted(int(j) for j in job_ids))
+        return read_interests(db_path, job_ids=job_ids)
+
+    monkeypatch.setattr(ia, "read_interests", recording_read_interests)
+    return reads
+
+
+def add_interests(rng, n):
+    append_interests(ia.INTERESTS_DB, [
+        {"student_id": int(s), "student_name": f"S{s}", "job_id": int(j),
+         "match_score": float(np.round(rng.uniform(), 2))}
+        for s, j in zip(rng.choice(STUDENT_IDS, n), rng.choice(JOB_IDS, n))
+    ])
+
+
+def full_allocation_csv(default_capacity=1):
+    students_df, jobs_df = ia.load_people_and_jobs()
+    merged = ia.prepare_interests(read_interests(ia.INTERESTS_DB), students_df, jobs_df, default_capacity)
+    buf = io.StringIO()
+    ia.allocate(merged).to_csv(buf, index=False)
+    return buf.getvalue()
+
+
+def test_incremental_matches_a_full_run(workspace):
+    rng = np.random.default_rng(1)
+    add_interests(rng, 150)
+    ia.run_incremental_allocation()
+    assert workspace == [None]
+
+    for round_ in range(6):
+        add_interests(rng, int(rng.integers(1, 15)))
+        for _, row in read_interests(ia.INTERESTS_DB).sample(3, random_state=round_).iterrows():
+            withdraw_interest(ia.INTERESTS_DB, int(row.student_id), int(row.job_id))
+        previous = pd.read_csv(ia.ALLOCATION_CSV)
+
+        changes = ia.run_incremental_allocation()
+
+        with open(ia.ALLOCATION_CSV) as f:
+            incremental = f.read()
+        assert incremental == full_allocation_csv()
+        expected = ia.allocation_diff(previous, pd.read_csv(io.StringIO(incremental)))
+        assert changes[expected.columns].to_dict("records") == expected.to_dict("records")
+        assert workspace[-1] is not None  # only the touched jobs were read
+
+
+def test_only_jobs_with_new_or_withdrawn_interests_are_read(workspace):
+    append_interests(ia.INTERESTS_DB, [
+        {"student_id": 1, "student_name": "S1", "job_id": 100, "match_score": 0.5},
+        {"student_id": 2, "student_name": "S2", "job_id": 101, "match_score": 0.5},
+    ])
+    ia.run_incremental_allocation()
+    append_interests(ia.INTERESTS_DB, [{"student_id": 3, "student_name": "S3", "job_id": 102, "match_score": 0.9}])
+    withdraw_interest(ia.INTERESTS_DB, 1, 100)
+
+    changes = ia.run_incremental_allocation()
+
+    assert workspace == [None, [100, 102]]
+    assert sorted(zip(changes["change"], changes["job_id"], changes["student_id"])) == [
+        ("added", 102, 3), ("removed", 100, 1),
+    ]
+    logged = pd.read_csv(ia.ALLOCATION_CHANGES_CSV)
+    assert list(logged.columns) == ia.CHANGE_COLS
+    assert len(logged) == 4  # two seats from the first run, two changes from the second
+
+
+def test_nothing_new_means_nothing_to_do(workspace):
+    add_interests(np.random.default_rng(2), 20)
+    ia.run_incremental_allocation()
+    changes = ia.run_incremental_allocation()
+    assert changes.empty
+    assert workspace == [None]
+
+
+def test_changed_inputs_force_a_full_run(workspace):
+    add_interests(np.random.default_rng(3), 20)
+    ia.run_incremental_allocation()
+    add_interests(np.random.default_rng(4), 1)
+
+    ia.run_incremental_allocation(default_capacity=2)
+    assert workspace[-1] is None
+
+    with open(ia.STUDENTS_PATH) as f:
+        students = json.load(f)
+    students[0]["cgpa"] = 10.0
+    with open(ia.STUDENTS_PATH, "w") as f:
+        json.dump(students, f)
+    add_interests(np.random.default_rng(5), 1)
+    ia.run_incremental_allocation(default_capacity=2)
+    assert workspace[-1] is None
+    with open(ia.ALLOCATION_CSV) as f:
+        assert f.read() == full_allocation_csv(default_capacity=2)
+
+
+def test_a_global_run_is_not_patched_incrementally(workspace):
+    add_interests(np.random.default_rng(6), 30)
+    ia.run_allocation(mode="global")
+    add_interests(np.random.default_rng(7), 1)
+
+    ia.run_incremental_allocation()
+
+    assert workspace == [None, None]
+    with open(ia.ALLOCATION_CSV) as f:
+        assert f.read() == full_allocation_csv()
@@ -0,0 +1,155 @@
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import interest_and_allocation
+import interest_log
+from interest_log import (
+    append_interest,
+    append_interests,
+    import_csv,
+    last_seq,
+    read_events,
+    read_interests,
+    withdraw_interest,
+)
+
+
+def interest(student_id, job_id, score=0.5, **fields):
+    return {"student_id": student_id, "student_name": f"S{student_id}", "job_id": job_id,
+            "match_score": score, **fields}
+
+
+def test_appends_are_read_back_in_order(tmp_path):
+    db = str(tmp_path / "interests.db")
+    assert last_seq(db) == 0
+    assert read_interests(db).empty
+
+    seq = append_interests(db, [interest(1, 10), interest(2, 10), interest(1, 11)])
+    append_interest(db, 3, "S3", 12, 0.9)
+
+    log = read_interests(db)
+    assert seq == 3 and last_seq(db) == 4
+    assert list(zip(log["student_id"], log["job_id"])) == [(1, 10), (2, 10), (1, 11), (3, 12)]
+    assert log["seq"].tolist() == [1, 2, 3, 4]
+    assert read_events(db, after_seq=2)["seq"].tolist() == [3, 4]
+
+
+def test_job_filter_beyond_the_parameter_limit(tmp_path):
+    db = str(tmp_path / "interests.db")
+    append_interests(db, [interest(s, s % 7) for s in range(50)])
+    # more job ids than SQLite accepts as bound parameters
+    wanted = [3] + list(range(1000, 60000))
+    log = read_interests(db, job_ids=wanted)
+    assert sorted(log["student_id"]) == [s for s in range(50) if s % 7 == 3]
+
+
+def test_withdrawal_cancels_earlier_interests_only(tmp_path):
+    db = str(tmp_path / "interests.db")
+    append_interests(db, [interest(1, 10), interest(1, 11), interest(2, 10)])
+    withdraw_interest(db, 1, 10)
+    assert list(zip(*[read_interests(db)[c] for c in ("student_id", "job_id")])) == [(1, 11), (2, 10)]
+
+    # interested again after withdrawing
+    append_interest(db, 1, "S1", 10, 0.7)
+    log = read_interests(db)
+    assert list(zip(log["student_id"], log["job_id"])) == [(1, 11), (2, 10), (1, 10)]
+    assert read_events(db)["withdrawn"].tolist() == [0, 0, 0, 1, 0]
+
+
+def test_missing_values_are_stored_as_null_and_now(tmp_path):
+    db = str(tmp_path / "interests.db")
+    append_interests(db, [
+        interest(1, 10, score=np.nan, applied_at=np.nan),
+        interest(2, 10, score=None, applied_at=""),
+        interest(3, 10, applied_at="2025-11-01T00:00:00+00:00"),
+    ])
+    log = read_interests(db)
+    assert log["match_score"].isna().tolist() == [True, True, False]
+    assert "nan" not in log["applied_at"].tolist()
+    assert pd.to_datetime(log["applied_at"], utc=True, format="ISO8601").notna().all()
+    assert log["applied_at"].iloc[2] == "2025-11-01T00:00:00+00:00"
+
+
+def test_mixed_timestamp_precision_survives_preparation(tmp_path):
+    db = str(tmp_path / "interests.db")
+    append_interests(db, [
+        interest(1, 10, applied_at="2025-11-01T00:00:00+00:00"),
+        interest(2, 10, applied_at="2025-11-01T00:00:00.250000+00:00"),
+        interest(3, 10, applied_at="2025-11-01 00:00:01"),
+    ])
+    students_df = pd.DataFrame({"student_id": [1, 2, 3], "cgpa": 8.0, "year_of_study": 3,
+                                "has_internship_experience": "No", "experience_level": "Fresher",
+                                "has_relevant_experience": "No"})
+    jobs_df = pd.DataFrame({"job_id": [10], "job_title": "Intern", "company_name": "Acme",
+                            "location": "Pune", "wfh": "No", "duration": "3 months", "capacity": 1})
+    merged = interest_and_allocation.prepare_interests(read_interests(db), students_df, jobs_df)
+    assert merged["applied_at"].notna().all()
+    # equal scores: the earliest click gets the seat
+    assert interest_and_allocation.allocate(merged)["student_id"].tolist() == [1]
+
+
+def _click(args):
+    db, student_id = args
+    append_interest(db, student_id, f"S{student_id}", 116, 0.5)
+
+
+def test_concurrent_writers_lose_nothing(tmp_path):
+    db = str(tmp_path / "interests.db")
+    append_interest(db, 0, "S0", 116, 0.5)
+    with ProcessPoolExecutor(4) as pool:
+        list(pool.map(_click, [(db, s) for s in range(1, 101)]))
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(_click, [(db, s) for s in range(101, 201)]))
+
+    log = read_interests(db)
+    assert sorted(log["student_id"]) == list(range(201))
+    assert log["seq"].is_unique
+
+
+def test_recreated_database_gets_its_schema_again(tmp_path):
+    db = tmp_path / "interests.db"
+    append_interest(str(db), 1, "S1", 10, 0.5)
+    for path in tmp_path.iterdir():
+        path.unlink()
+    append_interest(str(db), 2, "S2", 10, 0.5)
+    assert read_interests(str(db))["student_id"].tolist() == [2]
+
+
+def test_logs_without_withdrawals_are_migrated(tmp_path):
+    db = str(tmp_path / "interests.db")
+    conn = sqlite3.connect(db)
+    conn.execute(
+        "CREATE TABLE interests (seq INTEGER PRIMARY KEY AUTOINCREMENT, student_id INTEGER NOT NULL, "
+        "student_name TEXT, job_id INTEGER NOT NULL, match_score REAL, applied_at TEXT NOT NULL)"
+    )
+    conn.execute("INSERT INTO interests (student_id, student_name, job_id, match_score, applied_at) "
+                 "VALUES (1, 'S1', 10, 0.5, '2025-11-01')")
+    conn.commit()
+    conn.close()
+    interest_log._initialised.discard(str(tmp_path / "interests.db"))
+
+    withdraw_interest(db, 1, 10)
+    assert read_interests(db).empty
+
+
+def test_legacy_csv_is_imported_once(tmp_path, monkeypatch):
+    csv_path = tmp_path / "interests.csv"
+    db = tmp_path / "interests.db"
+    pd.DataFrame([
+        interest(1, 10, applied_at="2025-11-01T00:00:00+00:00"),
+        interest(2, 11, applied_at="2025-11-02T00:00:00+00:00"),
+    ]).to_csv(csv_path, index=False)
+    monkeypatch.setattr(interest_and_allocation, "INTERESTS_CSV", str(csv_path))
+    monkeypatch.setattr(interest_and_allocation, "INTERESTS_DB", str(db))
+
+    interest_and_allocation.save_student_interest(3, "S3", 12, 0.9)
+    interest_and_allocation.ensure_interest_log()
+
+    log = read_interests(str(db))
+    assert log["student_id"].tolist() == [1, 2, 3]
+    assert log["applied_at"].iloc[0] == "2025-11-01T00:00:00+00:00"
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+    assert import_csv(str(csv_path), str(tmp_path / "other.db"), chunk_rows=1) == 2
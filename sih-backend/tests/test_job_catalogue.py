@@ -0,0 +1,73 @@
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from job_catalogue import add_derived_columns, load_jobs, read_catalogue
+
+# the scraper precomputes the same derived columns into its catalogue
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "Scraper"))
+from internship_scraper.catalogue import write_catalogue  # noqa: E402
+from internship_scraper.models import base_record  # noqa: E402
+
+DERIVED = ["duration_months", "job_title_clean", "location_tokens", "domain_auto"]
+
+TITLES = [
+    "Data Science Intern", "Data Analyst", "Machine Learning Engineer", "AIML Trainee",
+    "Intern - AI research", "Python Developer", "Web Developer", "Full Stack Intern",
+    "Frontend Intern", "Android App Developer", "Mobile Developer", "Cyber Security Analyst",
+    "DevOps Intern", "Cloud Engineer", "Digital Marketing", "Marketing Executive",
+    "VLSI Design", "Embedded Systems", "Accountant", "", None,
+]
+DURATIONS = ["3 Months", "6 months", "8 Weeks", "2 weeks", "1 Year", "12 months ", "Flexible", "", None]
+LOCATIONS = ["Delhi", "New Delhi, Noida", "Bangalore,Mumbai", "  Pune  ", "Work From Home", "", None]
+
+
+def scraped_records():
+    records = []
+    for i, title in enumerate(TITLES):
+        record = base_record()
+        record.update(
+            job_id=i + 1,
+            job_title=title or "",
+            duration=DURATIONS[i % len(DURATIONS)] or "",
+            location=LOCATIONS[i % len(LOCATIONS)] or "",
+        )
+        records.append(record)
+    return records
+
+
+@pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+def test_scraper_catalogue_matches_derived_columns(tmp_path, suffix):
+    records = scraped_records()
+    jobs_path = tmp_path / "jobs.json"
+    jobs_path.write_text(json.dumps(records), encoding="utf-8")
+    catalogue_path = tmp_path / ("jobs" + suffix)
+    write_catalogue(records, str(catalogue_path))
+
+    from_scraper = read_catalogue(str(catalogue_path))
+    computed = add_derived_columns(load_jobs(str(jobs_path)))
+
+    assert from_scraper is not None, "catalogue version differs between scraper and sih-backend"
+    pd.testing.assert_frame_equal(
+        from_scraper[["job_id"] + DERIVED].reset_index(drop=True),
+        computed[["job_id"] + DERIVED].reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_missing_inputs_match():
+    # records without the fields at all, as older scraper runs may have written
+    records = [{"job_id": 1}, {"job_id": 2, "job_title": None, "duration": None, "location": None}]
+    from internship_scraper.catalogue import domain_from_title, location_tokens, parse_duration_to_months
+    from job_catalogue import build_domain_from_title, simple_location_tokens
+    from job_catalogue import parse_duration_to_months as backend_duration
+
+    for record in records:
+        assert parse_duration_to_months(record.get("duration")) == backend_duration(record.get("duration"))
+        assert set(location_tokens(record.get("location"))) == simple_location_tokens(record.get("location"))
+        assert domain_from_title(record.get("job_title")) == build_domain_from_title(record.get("job_title"))
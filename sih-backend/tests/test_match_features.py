@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from job_catalogue import add_derived_columns
+from match_features import FEATURE_COLS, JobFeatureMatrix, student_profile
+from recommend_for_student import get_recommendations_for_student_row
+from tfidf_artifacts import job_text_corpus
+
+JOBS = [
+    # job_title, location, wfh, duration, description
+    ("Data Science Intern", "New Delhi, Noida", "Yes", "3 Months", "pandas python statistics"),
+    ("Python Developer", "Pune", "No", "6 months", "django python apis"),
+    ("Web Developer", "Work From Home", "Virtual Internship", "8 Weeks", "react javascript"),
+    ("Data Analyst", "Bangalore,Mumbai", "", "Flexible", ""),
+    ("", "", "No", "", ""),
+    ("Machine Learning Engineer", "Delhi", "Virtual", "1 Year", "python deep learning"),
+    ("Data Science Intern", "Pune", "No", "3 Months", "python pandas"),
+]
+
+STUDENTS = [
+    {
+        "skills": "Python, Pandas, Data", "preferred_domains": "data science, python",
+        "preferred_locations": "Pune, Delhi", "wfh_preference": "No",
+        "min_duration_months": 3, "cgpa": 8.1, "degree": "B.Tech",
+        "has_internship_experience": "Yes", "experience_level": "1 internship",
+        "has_relevant_experience": "Yes",
+    },
+    {
+        "skills": "React, JavaScript", "preferred_domains": "web development",
+        "preferred_locations": "", "wfh_preference": "Virtual",
+        "min_duration_months": 0, "cgpa": 7.0, "degree": "BCA",
+        "has_internship_experience": "No", "experience_level": "Fresher",
+        "has_relevant_experience": "No",
+    },
+    # nothing the catalogue knows about: every similarity is 0
+    {
+        "skills": "", "preferred_domains": "", "preferred_locations": "Chennai",
+        "wfh_preference": "Any", "min_duration_months": 12, "cgpa": 6.5, "degree": "",
+        "has_internship_experience": "Yes", "experience_level": "2+ internships",
+        "has_relevant_experience": "No",
+    },
+]
+
+
+@pytest.fixture(scope="module")
+def catalogue():
+    jobs_df = pd.DataFrame(
+        [
+            {
+                "job_id": 100 + i, "job_title": title, "company_name": f"Company {i}",
+                "location": location, "wfh": wfh, "duration": duration,
+                "description": description, "job_link": "",
+            }
+            for i, (title, location, wfh, duration, description) in enumerate(JOBS)
+        ]
+    )
+    jobs_df = add_derived_columns(jobs_df)
+    vectorizer = TfidfVectorizer()
+    job_tfidf = vectorizer.fit_transform(job_text_corpus(jobs_df))
+    return jobs_df, vectorizer, job_tfidf
+
+
+def calculate_match_score(profile, jrow, student_vec, job_vec):
+    """One student x job feature row, as the old per-job loop computed it."""
+    job_keywords = set(jrow["job_title_clean"].split())
+    s_skill_tokens = profile["skill_tokens"]
+    skills_sim = 0.0 if not job_keywords else (
+        sum(1 for w in s_skill_tokens if w in job_keywords)
+        / len(s_skill_tokens | job_keywords)
+    )
+
+    domain_match = 1 if jrow["domain_auto"] in profile["domains"] else 0
+
+    loc_sim = 0.0
+    job_loc_tokens, s_loc_pref_set = jrow["location_tokens"], profile["loc_pref"]
+    if job_loc_tokens and s_loc_pref_set:
+        loc_sim = len(job_loc_tokens & s_loc_pref_set) / len(job_loc_tokens | s_loc_pref_set)
+
+    s_wfh_pref, job_wfh = profile["wfh_pref"], str(jrow["wfh"])
+    if s_wfh_pref == "Any" or s_wfh_pref.lower() in job_wfh.lower():
+        wfh_match = 1
+    elif s_wfh_pref == "Virtual" and "virtual" in job_wfh.lower():
+        wfh_match = 1
+    else:
+        wfh_match = 0
+
+    job_duration = float(jrow["duration_months"])
+    duration_fit = 1 if job_duration >= profile["min_duration"] else 0
+
+    if student_vec.nnz == 0 or job_vec.nnz == 0:
+        text_sim = 0.0
+    else:
+        text_sim = float(cosine_similarity(student_vec, job_vec)[0, 0])
+
+    return [
+        skills_sim, domain_match, loc_sim, wfh_match, duration_fit,
+        profile["cgpa"], job_duration, text_sim,
+        profile["has_exp_flag"], profile["exp_level_num"], profile["rel_exp_flag"],
+    ]
+
+
+def reference_features(profile, jobs_df, job_tfidf, student_vec):
+    return np.array(
+        [
+            calculate_match_score(profile, jrow, student_vec, job_tfidf[i])
+            for i, (_, jrow) in enumerate(jobs_df.iterrows())
+        ]
+    )
+
+
+@pytest.mark.parametrize("srow", STUDENTS)
+def test_features_match_the_per_job_loop(catalogue, srow):
+    jobs_df, vectorizer, job_tfidf = catalogue
+    profile = student_profile(srow)
+    student_vec = vectorizer.transform([profile["text"]])
+
+    features = JobFeatureMatrix(jobs_df, job_tfidf).features(profile, student_vec)
+    expected = reference_features(profile, jobs_df, job_tfidf, student_vec)
+
+    assert features.shape == (len(JOBS), len(FEATURE_COLS))
+    np.testing.assert_allclose(features, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_features_of_selected_rows(catalogue):
+    jobs_df, vectorizer, job_tfidf = catalogue
+    profile = student_profile(STUDENTS[0])
+    student_vec = vectorizer.transform([profile["text"]])
+    matrix = JobFeatureMatrix(jobs_df, job_tfidf)
+
+    rows = np.array([5, 1, 1, 3])
+    np.testing.assert_allclose(
+        matrix.features(profile, student_vec, rows=rows),
+        matrix.features(profile, student_vec)[rows],
+    )
+
+
+class FeatureModel:
+    """Scores a job from two 0/1 features, so many jobs tie."""
+
+    def predict_proba(self, X):
+        domain_match, duration_fit = X[:, 1], X[:, 4]
+        p = 0.5 * duration_fit + 0.25 * domain_match
+        return np.column_stack([1 - p, p])
+
+
+@pytest.mark.parametrize("srow", STUDENTS)
+def test_ties_keep_catalogue_order(catalogue, srow):
+    jobs_df, vectorizer, job_tfidf = catalogue
+    profile = student_profile(srow)
+    student_vec = vectorizer.transform([profile["text"]])
+    scores = FeatureModel().predict_proba(
+        reference_features(profile, jobs_df, job_tfidf, student_vec)
+    )[:, 1]
+
+    results = get_recommendations_for_student_row(
+        srow, jobs_df, FeatureModel(), job_tfidf, vectorizer, top_n=len(JOBS)
+    )
+
+    # best score first; equal scores keep catalogue (jobs_df row) order
+    order = sorted(range(len(JOBS)), key=lambda i: -scores[i])
+    assert list(results["job_id"]) == [100 + i for i in order]
+    np.testing.assert_allclose(results["match_score"], scores[order])
@@ -0,0 +1,103 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import tfidf_artifacts as ta
+
+JOBS = [
+    {"job_id": 1, "job_title": "Data Science Intern", "description": "pandas python statistics"},
+    {"job_id": 2, "job_title": "Web Developer", "description": "react javascript css"},
+    {"job_id": 3, "job_title": "Python Developer", "description": None},
+    {"job_id": 4, "job_title": "Cloud Engineer", "description": "aws devops python"},
+]
+
+TEXTS = ["python pandas data", "react", "nothing known here", "", "Cloud AWS python python"]
+
+
+def memory_mapped(array):
+    # scipy wraps the loaded arrays in plain ndarray views of the memmap
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def write_jobs(path, jobs):
+    path.write_text(json.dumps(jobs), encoding="utf-8")
+    return pd.DataFrame(jobs)
+
+
+@pytest.fixture
+def fits(monkeypatch):
+    """Counts the TF-IDF refits (each one saves fresh artifacts)."""
+    calls = []
+    save_tfidf = ta.save_tfidf
+
+    def counting_save(*args):
+        calls.append(args[-1])
+        save_tfidf(*args)
+
+    monkeypatch.setattr(ta, "save_tfidf", counting_save)
+    return calls
+
+
+def test_reloaded_artifacts_transform_like_the_fitted_vectorizer(tmp_path, fits):
+    jobs_path, artifact_dir = tmp_path / "jobs.json", str(tmp_path / "tfidf")
+    jobs_df = write_jobs(jobs_path, JOBS)
+
+    fitted, fitted_tfidf = ta.load_or_build_tfidf(jobs_df, str(jobs_path), artifact_dir)
+    loaded, loaded_tfidf = ta.load_or_build_tfidf(jobs_df, str(jobs_path), artifact_dir)
+
+    assert len(fits) == 1
+    # the reload is memory-mapped, not a refit
+    assert memory_mapped(loaded.idf_)
+    assert all(memory_mapped(getattr(loaded_tfidf, part)) for part in ta.MATRIX_PARTS)
+    assert not memory_mapped(fitted_tfidf.data)
+    assert loaded.vocabulary_ == fitted.vocabulary_
+    np.testing.assert_array_equal(loaded_tfidf.toarray(), fitted_tfidf.toarray())
+    np.testing.assert_array_equal(
+        loaded.transform(TEXTS).toarray(), fitted.transform(TEXTS).toarray()
+    )
+
+
+def test_changed_jobs_file_triggers_a_rebuild(tmp_path, fits):
+    jobs_path, artifact_dir = tmp_path / "jobs.json", str(tmp_path / "tfidf")
+    jobs_df = write_jobs(jobs_path, JOBS)
+    ta.load_or_build_tfidf(jobs_df, str(jobs_path), artifact_dir)
+    before = ta.jobs_fingerprint(str(jobs_path))
+
+    # same number of jobs, one description edited
+    edited = [dict(job) for job in JOBS]
+    edited[1]["description"] = "angular typescript"
+    jobs_df = write_jobs(jobs_path, edited)
+    after = ta.jobs_fingerprint(str(jobs_path))
+    vectorizer, _ = ta.load_or_build_tfidf(jobs_df, str(jobs_path), artifact_dir)
+
+    assert after != before
+    assert fits == [before, after]
+    assert "angular" in vectorizer.vocabulary_ and "react" not in vectorizer.vocabulary_
+    with open(os.path.join(artifact_dir, "manifest.json"), encoding="utf-8") as f:
+        assert json.load(f)["jobs_fingerprint"] == after
+
+    ta.load_or_build_tfidf(jobs_df, str(jobs_path), artifact_dir)
+    assert len(fits) == 2
+
+
+def test_stale_or_broken_manifest_triggers_a_rebuild(tmp_path, fits, monkeypatch):
+    jobs_path, artifact_dir = tmp_path / "jobs.json", str(tmp_path / "tfidf")
+    jobs_df = write_jobs(jobs_path, JOBS)
+    ta.load_or_build_tfidf(jobs_df, str(jobs_path), artifact_dir)
+
+    monkeypatch.setattr(ta, "ARTIFACT_VERSION", "0")
+    ta.load_or_build_tfidf(jobs_df, str(jobs_path), artifact_dir)
+    assert len(fits) == 2
+
+    with open(os.path.join(artifact_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        f.write("{not json")
+    ta.load_or_build_tfidf(jobs_df, str(jobs_path), artifact_dir)
+    assert len(fits) == 3
+    assert sorted(os.listdir(tmp_path)) == ["jobs.json", "tfidf"]
@@ -0,0 +1,151 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+import training_pairs as tp
+from job_catalogue import add_derived_columns
+from match_features import FEATURE_COLS
+from tfidf_artifacts import job_text_corpus
+
+TITLES = ["Data Science Intern", "Python Developer", "Web Developer", "Data Analyst",
+          "Machine Learning Engineer", "Cloud Engineer", "Digital Marketing"]
+LOCATIONS = ["Pune", "New Delhi, Noida", "Bangalore,Mumbai", "Work From Home", "Delhi"]
+DURATIONS = ["3 Months", "6 months", "8 Weeks", "1 Year"]
+SKILLS = ["python", "pandas", "data", "web", "react", "cloud", "marketing", "ml"]
+DOMAINS = ["data science", "python", "web development", "cloud devops", "digital marketing"]
+
+
+@pytest.fixture(scope="module")
+def inputs():
+    rng = np.random.default_rng(3)
+    jobs_df = add_derived_columns(pd.DataFrame([
+        {
+            "job_id": 1000 + i,
+            "job_title": TITLES[i % len(TITLES)],
+            "location": LOCATIONS[i % len(LOCATIONS)],
+            "wfh": ["Yes", "No", "Virtual Internship"][i % 3],
+            "duration": DURATIONS[i % len(DURATIONS)],
+            "description": " ".join(rng.choice(SKILLS, 3)),
+        }
+        for i in range(40)
+    ]))
+    students_df = pd.DataFrame([
+        {
+            "student_id": 7 + 3 * i,
+            "skills": ", ".join(rng.choice(SKILLS, 3, replace=False)),
+            "preferred_domains": ", ".join(rng.choice(DOMAINS, 2, replace=False)),
+            "preferred_locations": str(rng.choice(LOCATIONS)),
+            "wfh_preference": str(rng.choice(["Any", "Yes", "No", "Virtual"])),
+            "min_duration_months": int(rng.integers(0, 7)),
+            "cgpa": round(float(rng.uniform(6, 10)), 2),
+            "degree": "B.Tech",
+            "has_internship_experience": str(rng.choice(["Yes", "No"])),
+            "experience_level": str(rng.choice(["Fresher", "1 internship", "2+ internships"])),
+            "has_relevant_experience": str(rng.choice(["Yes", "No"])),
+        }
+        for i in range(25)
+    ])
+    vectorizer = TfidfVectorizer()
+    job_tfidf = vectorizer.fit_transform(job_text_corpus(jobs_df))
+    return students_df, jobs_df, job_tfidf, vectorizer
+
+
+def generate(inputs, out_path, **kwargs):
+    students_df, jobs_df, job_tfidf, vectorizer = inputs
+    kwargs = {"sample_size": 10, "chunk_students": 4, "workers": 1, **kwargs}
+    rows = tp.generate_training_pairs(students_df, jobs_df, job_tfidf, vectorizer, str(out_path), **kwargs)
+    return rows, tp.read_training_pairs(str(out_path))
+
+
+@pytest.mark.parametrize("sample_size", [10, 40, 100])
+def test_sampling_matches_per_student_jobs_df_sample(inputs, tmp_path, sample_size):
+    students_df, jobs_df, _, _ = inputs
+    _, pairs = generate(inputs, tmp_path / "pairs.csv", sample_size=sample_size)
+
+    # the old loop: for each student, jobs_df.sample(..., random_state=student_id)
+    expected = [
+        (sid, job_id)
+        for sid in students_df["student_id"]
+        for job_id in jobs_df.sample(min(sample_size, len(jobs_df)), random_state=sid)["job_id"]
+    ]
+    assert list(zip(pairs["student_id"], pairs["job_id"])) == expected
+
+
+def test_all_sampling_pairs_every_student_with_every_job(inputs, tmp_path):
+    students_df, jobs_df, _, _ = inputs
+    rows, pairs = generate(inputs, tmp_path / "pairs.csv", sampling="all")
+
+    assert rows == len(pairs) == len(students_df) * len(jobs_df)
+    assert list(pairs["job_id"][:len(jobs_df)]) == list(jobs_df["job_id"])
+
+
+def test_labels_follow_the_weak_label_rule(inputs, tmp_path):
+    _, pairs = generate(inputs, tmp_path / "pairs.csv")
+
+    expected = [
+        1 if row.skills_sim > 0.15 and (row.domain_match == 1 or row.loc_sim > 0 or row.skills_sim > 0.3) else 0
+        for row in pairs.itertuples()
+    ]
+    assert list(pairs["label"]) == expected
+    assert 0 < pairs["label"].sum() < len(pairs)
+
+
+def test_worker_processes_give_identical_output(inputs, tmp_path):
+    rows_1, serial = generate(inputs, tmp_path / "serial.csv", workers=1)
+    rows_2, parallel = generate(inputs, tmp_path / "parallel.csv", workers=2)
+
+    assert rows_1 == rows_2 == 250
+    pd.testing.assert_frame_equal(serial, parallel)
+    with open(tmp_path / "serial.csv", "rb") as a, open(tmp_path / "parallel.csv", "rb") as b:
+        assert a.read() == b.read()
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_writer_round_trip(inputs, tmp_path, suffix):
+    if suffix == ".parquet" and not tp.parquet_available():
+        pytest.skip("pyarrow not installed")
+    out_path = tmp_path / ("pairs" + suffix)
+    rows, pairs = generate(inputs, out_path)
+
+    assert rows == len(pairs) == 250
+    assert list(pairs.columns) == tp.PAIR_COLS
+    assert all(pairs[col].dtype == np.int64 for col in tp.INT_COLS + ["student_id", "job_id"])
+    assert all(pairs[col].dtype == np.float64 for col in FEATURE_COLS if col not in tp.INT_COLS)
+    assert os.listdir(tmp_path) == [out_path.name]
+
+
+def test_csv_and_parquet_hold_the_same_pairs(inputs, tmp_path):
+    pytest.importorskip("pyarrow")
+    _, from_csv = generate(inputs, tmp_path / "pairs.csv")
+    _, from_parquet = generate(inputs, tmp_path / "pairs.parquet")
+
+    pd.testing.assert_frame_equal(from_csv, from_parquet, check_exact=False, rtol=1e-15)
+
+
+def test_failed_run_leaves_no_file(inputs, tmp_path, monkeypatch):
+    calls = []
+
+    def failing(students):
+        calls.append(len(students))
+        if len(calls) == 3:
+            raise RuntimeError("worker died")
+        return pairs_for_students(students)
+
+    pairs_for_students = tp.pairs_for_students
+    monkeypatch.setattr(tp, "pairs_for_students", failing)
+
+    with pytest.raises(RuntimeError, match="worker died"):
+        generate(inputs, tmp_path / "pairs.csv")
+    assert calls == [4, 4, 4]
+    assert os.listdir(tmp_path) == []
+
+
+def test_parquet_needs_pyarrow(monkeypatch, tmp_path):
+    monkeypatch.setattr(tp, "pa", None)
+
+    assert not tp.parquet_available()
+    with pytest.raises(RuntimeError, match="pyarrow"):
+        tp.PairWriter(str(tmp_path / "pairs.parquet"))
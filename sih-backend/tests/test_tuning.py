@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from sklearn.metrics import roc_auc_score
+from xgboost import XGBClassifier
+
+import tuning
+
+
+@pytest.fixture(scope="module")
+def data():
+    # two informative features plus label noise, so early stopping kicks in
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(600, 5))
+    y = ((X[:, 0] + 0.5 * X[:, 1] + rng.normal(scale=1.0, size=600)) > 0).astype(int)
+    return X[:400], y[:400], X[400:], y[400:]
+
+
+def by_rung(results):
+    rungs = {}
+    for r in results:
+        rungs.setdefault(r["rung"], []).append(r)
+    return [rungs[rung] for rung in sorted(rungs)]
+
+
+def test_halving_keeps_the_best_third_of_each_rung(data):
+    best, results = tuning.run_search(
+        *data, search="halving", n_trials=9, max_rounds=270, parallel=3
+    )
+
+    rungs = by_rung(results)
+    # 9 trials at 270 // 3**2 = 30 rounds, the best 3 at 90, the best one at 270
+    assert [len(rung) for rung in rungs] == [9, 3, 1]
+    assert [{r["rounds"] for r in rung} for rung in rungs] == [{30}, {90}, {270}]
+    for rung, survivors in zip(rungs, rungs[1:]):
+        ranked = sorted(rung, key=tuning._rank, reverse=True)
+        assert [r["trial"] for r in survivors] == [r["trial"] for r in ranked[:len(survivors)]]
+    assert best == rungs[-1][0]
+
+
+def test_halving_stops_at_max_rounds(data):
+    best, results = tuning.run_search(
+        *data, search="halving", n_trials=10, max_rounds=90, parallel=2
+    )
+
+    # 10 trials at the 30-round minimum, then 10 // 3 go on to max_rounds
+    assert [len(rung) for rung in by_rung(results)] == [10, 3]
+    assert best["rung"] == 1 and best["rounds"] == 90
+    assert best == max(by_rung(results)[-1], key=tuning._rank)
+
+
+def test_random_search_trains_every_trial_fully(data):
+    best, results = tuning.run_search(*data, search="random", n_trials=4, max_rounds=60)
+
+    assert [r["trial"] for r in results] == [0, 1, 2, 3]
+    assert {(r["rung"], r["rounds"]) for r in results} == {(0, 60)}
+    assert best == max(results, key=tuning._rank)
+
+
+def test_unknown_search_is_rejected(data):
+    with pytest.raises(ValueError, match="unknown search"):
+        tuning.run_search(*data, search="grid")
+
+
+def test_classifier_params_use_the_best_iteration(data):
+    X_train, y_train, X_valid, y_valid = data
+    best, _ = tuning.run_search(*data, search="random", n_trials=3, max_rounds=300)
+    params = tuning.classifier_params(best)
+
+    # early stopping picked fewer trees than the round budget
+    assert best["best_iteration"] + 1 < best["rounds"]
+    assert params["n_estimators"] == best["best_iteration"] + 1
+    assert {k: params[k] for k in best["params"]} == best["params"]
+
+    # the classifier rebuilt from them reproduces the trial's validation AUC
+    model = XGBClassifier(**params).fit(X_train, y_train)
+    assert model.get_booster().num_boosted_rounds() == params["n_estimators"]
+    auc = roc_auc_score(y_valid, model.predict_proba(X_valid)[:, 1])
+    assert auc == pytest.approx(best["valid_auc"], abs=1e-6)
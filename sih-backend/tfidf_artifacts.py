@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from job_catalogue import resolve_jobs_path
+
+# -----------------------------
+# Persisted TF-IDF artifacts (shared)
+# -----------------------------
+# The fitted vocabulary/IDF and the job TF-IDF matrix are saved next to the
+# model, tagged with a fingerprint of the job file they were built from.
+# Training and inference load the same artifacts, so their vocabularies
+# cannot drift apart, and the fit only reruns when the catalogue changes.
+#
+#   <dir>/manifest.json   version, jobs fingerprint, shapes (written last)
+#   <dir>/vocabulary.json term -> column
+#   <dir>/idf.npy, job_tfidf_{data,indices,indptr}.npy (memory-mapped on load)
+ARTIFACT_VERSION = "1"
+MAX_FEATURES = 5000
+MATRIX_PARTS = ("data", "indices", "indptr")
+
+
+def job_text_corpus(jobs_df):
+    # TF-IDF vectors for job text (title + description)
+    return (
+        jobs_df["job_title"].fillna("") + " " + jobs_df["description"].fillna("")
+    ).tolist()
+
+
+def jobs_fingerprint(jobs_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(resolve_jobs_path(jobs_path), "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _read_manifest(artifact_dir: str):
+    try:
+        with open(os.path.join(artifact_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_tfidf(artifact_dir: str, vectorizer, job_tfidf, fingerprint: str):
+    # written into a sibling directory and swapped in, so a crash never
+    # leaves a manifest pointing at half-written arrays
+    tmp_dir = artifact_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    job_tfidf = job_tfidf.tocsr()
+    vocabulary = {term: int(col) for term, col in vectorizer.vocabulary_.items()}
+    with open(os.path.join(tmp_dir, "vocabulary.json"), "w", encoding="utf-8") as f:
+        json.dump(vocabulary, f, ensure_ascii=False)
+    np.save(os.path.join(tmp_dir, "idf.npy"), vectorizer.idf_)
+    for part in MATRIX_PARTS:
+        np.save(os.path.join(tmp_dir, f"job_tfidf_{part}.npy"), getattr(job_tfidf, part))
+
+    manifest = {
+        "version": ARTIFACT_VERSION,
+        "jobs_fingerprint": fingerprint,
+        "max_features": MAX_FEATURES,
+        "shape": list(job_tfidf.shape),
+    }
+    with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    shutil.rmtree(artifact_dir, ignore_errors=True)
+    os.rename(tmp_dir, artifact_dir)
+
+
+def load_tfidf(artifact_dir: str):
+    with open(os.path.join(artifact_dir, "vocabulary.json"), "r", encoding="utf-8") as f:
+        vocabulary = json.load(f)
+    manifest = _read_manifest(artifact_dir)
+
+    vectorizer = TfidfVectorizer(max_features=MAX_FEATURES, vocabulary=vocabulary)
+    vectorizer.idf_ = np.load(os.path.join(artifact_dir, "idf.npy"), mmap_mode="r")
+
+    data, indices, indptr = (
+        np.load(os.path.join(artifact_dir, f"job_tfidf_{part}.npy"), mmap_mode="r")
+        for part in MATRIX_PARTS
+    )
+    job_tfidf = sparse.csr_matrix(
+        (data, indices, indptr), shape=tuple(manifest["shape"]), copy=False
+    )
+    return vectorizer, job_tfidf
+
+
+def load_or_build_tfidf(jobs_df, jobs_path: str, artifact_dir: str):
+    """
+    (vectorizer, job_tfidf) for jobs_df, loaded from artifact_dir when it was
+    built from the same job file, refitted and saved there otherwise.
+    """
+    fingerprint = jobs_fingerprint(jobs_path)
+    manifest = _read_manifest(artifact_dir)
+    if (
+        manifest is not None
+        and manifest.get("version") == ARTIFACT_VERSION
+        and manifest.get("jobs_fingerprint") == fingerprint
+        and manifest.get("max_features") == MAX_FEATURES
+        and manifest.get("shape", [None])[0] == len(jobs_df)
+    ):
+        print("Loading TF-IDF artifacts from:", artifact_dir)
+        return load_tfidf(artifact_dir)
+
+    print("Fitting TF-IDF on the job catalogue (artifacts missing or stale)")
+    vectorizer = TfidfVectorizer(max_features=MAX_FEATURES)
+    job_tfidf = vectorizer.fit_transform(job_text_corpus(jobs_df))
+    save_tfidf(artifact_dir, vectorizer, job_tfidf, fingerprint)
+    print("Saved TF-IDF artifacts to:", artifact_dir)
+    return vectorizer, job_tfidf
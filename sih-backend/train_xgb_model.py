@@ -1,3 +1,4 @@
+import argparse
 import json
 import os
 
@@ -5,303 +6,244 @@ import numpy as np
 import pandas as pd
 
 from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics import classification_report, roc_auc_score
-from sklearn.metrics.pairwise import cosine_similarity
 
 from imblearn.over_sampling import SMOTE
 from xgboost import XGBClassifier
 
+from job_catalogue import load_catalogue
+from match_features import FEATURE_COLS
+from profiling import StageProfiler
+from tfidf_artifacts import load_or_build_tfidf
+from tuning import (
+    MAX_ROUNDS,
+    N_TRIALS,
+    SEARCH_STRATEGIES,
+    classifier_params,
+    run_search,
+    save_search,
+)
+from training_pairs import (
+    CHUNK_STUDENTS,
+    SAMPLE_SIZE,
+    SAMPLING_STRATEGIES,
+    generate_training_pairs,
+    parquet_available,
+    read_training_pairs,
+)
+
 # -----------------------------
 # CONSTANT PATHS (shared)
 # -----------------------------
 DATA_DIR = "data"
-JOBS_PATH = os.path.join(DATA_DIR, "jobs.json")
+JOBS_PATH = os.path.join(DATA_DIR, "jobs.json")  # or jobs.ndjson[.gz], see job_catalogue
 STUDENTS_PATH = os.path.join(DATA_DIR, "students_demo.json")
 TRAINING_PAIRS_CSV = os.path.join(DATA_DIR, "training_pairs.csv")
+TRAINING_PAIRS_PARQUET = os.path.join(DATA_DIR, "training_pairs.parquet")
 
 MODEL_DIR = "models"
 os.makedirs(MODEL_DIR, exist_ok=True)
 MODEL_PATH = os.path.join(MODEL_DIR, "xgb_match_model.json")
-
-
-# -----------------------------
-# Helper functions
-# -----------------------------
-def parse_duration_to_months(duration_str: str) -> float:
-    if not isinstance(duration_str, str):
-        return 0.0
-    s = duration_str.lower().strip()
-    if "month" in s:
-        num = "".join(ch for ch in s if ch.isdigit())
-        return float(num) if num else 0.0
-    if "week" in s:
-        num = "".join(ch for ch in s if ch.isdigit())
-        weeks = float(num) if num else 0.0
-        return weeks / 4.0
-    if "year" in s:
-        num = "".join(ch for ch in s if ch.isdigit())
-        years = float(num) if num else 0.0
-        return years * 12.0
-    return 0.0
-
-
-def simple_location_tokens(loc_str: str):
-    if not isinstance(loc_str, str):
-        return set()
-    loc_str = loc_str.lower().replace(",", " ")
-    return set(loc_str.split())
-
-
-def jaccard(set1, set2):
-    if not set1 or not set2:
-        return 0.0
-    inter = len(set1 & set2)
-    union = len(set1 | set2)
-    return inter / union if union > 0 else 0.0
-
-
-def build_domain_from_title(title: str):
-    if not isinstance(title, str):
-        return "other"
-    t = title.lower()
-    if "data science" in t or "data analyst" in t:
-        return "data science"
-    if "machine learning" in t or "aiml" in t or " ai" in t:
-        return "machine learning"
-    if "python" in t:
-        return "python"
-    if "web" in t or "full stack" in t or "frontend" in t:
-        return "web development"
-    if "android" in t or "app" in t or "mobile" in t:
-        return "app development"
-    if "cyber" in t or "security" in t:
-        return "cyber security"
-    if "devops" in t or "cloud" in t:
-        return "cloud devops"
-    if "digital marketing" in t or "marketing" in t:
-        return "digital marketing"
-    if "vlsi" in t or "embedded" in t:
-        return "vlsi/embedded"
-    return "other"
-
-
-def build_domain_from_student(preferred_domains: str):
-    if not isinstance(preferred_domains, str):
-        return []
-    return [d.strip().lower() for d in preferred_domains.split(",") if d.strip()]
+TFIDF_DIR = os.path.join(MODEL_DIR, "tfidf")
 
 
 # -----------------------------
 # MAIN TRAINING PIPELINE
 # -----------------------------
-def main():
+def profile_path_for(model_path: str) -> str:
+    # models/xgb_match_model.json -> models/xgb_match_model.profile.json
+    return os.path.splitext(model_path)[0] + ".profile.json"
+
+
+def main(
+    pairs_path: str = TRAINING_PAIRS_CSV,
+    sampling: str = "random",
+    sample_size: int = SAMPLE_SIZE,
+    chunk_students: int = CHUNK_STUDENTS,
+    workers: int = None,
+    jobs_path: str = JOBS_PATH,
+    students_path: str = STUDENTS_PATH,
+    model_path: str = MODEL_PATH,
+    tune: bool = False,
+    search: str = "random",
+    n_trials: int = N_TRIALS,
+    max_rounds: int = MAX_ROUNDS,
+    parallel_trials: int = None,
+):
+    profiler = StageProfiler()
+    tfidf_dir = os.path.join(os.path.dirname(model_path), "tfidf")
+
     # 1) Load data
-    print("Loading internships from:", JOBS_PATH)
-    jobs_df = pd.read_json(JOBS_PATH)
+    with profiler.stage("load"):
+        print("Loading internships from:", jobs_path)
+        jobs_df = load_catalogue(jobs_path)
 
-    print("Loading students from:", STUDENTS_PATH)
-    with open(STUDENTS_PATH, "r", encoding="utf-8") as f:
-        students = json.load(f)
-    students_df = pd.DataFrame(students)
+        print("Loading students from:", students_path)
+        with open(students_path, "r", encoding="utf-8") as f:
+            students = json.load(f)
+        students_df = pd.DataFrame(students)
 
     # 2) Prepare internship features
-    jobs_df["duration_months"] = jobs_df["duration"].apply(parse_duration_to_months)
-    jobs_df["job_title_clean"] = jobs_df["job_title"].fillna("").str.lower()
-    jobs_df["location_tokens"] = jobs_df["location"].apply(simple_location_tokens)
-    jobs_df["domain_auto"] = jobs_df["job_title"].apply(build_domain_from_title)
-
-    # TF-IDF vectors for job text (title + description)
-    text_corpus = (
-        jobs_df["job_title"].fillna("") + " " + jobs_df["description"].fillna("")
-    ).tolist()
-
-    vectorizer = TfidfVectorizer(max_features=5000)
-    job_tfidf = vectorizer.fit_transform(text_corpus)
-
-    # 3) Build student-internship pairs with features + weak labels
-    pairs = []
-
-    for _, srow in students_df.iterrows():
-        sid = srow["student_id"]
-
-        s_skills = str(srow.get("skills", "")).lower()
-        s_domains = build_domain_from_student(srow.get("preferred_domains", ""))
-        s_loc_pref = [
-            l.strip().lower()
-            for l in str(srow.get("preferred_locations", "")).split(",")
-            if l.strip()
-        ]
-        s_loc_pref_set = set(s_loc_pref)
-        s_wfh_pref = str(srow.get("wfh_preference", "Any"))
-        s_min_dur = float(srow.get("min_duration_months", 0))
-        s_cgpa = float(srow.get("cgpa", 0))
-
-        # EXPERIENCE FLAGS (simple, from radio/dropdown)
-        has_exp_str = str(srow.get("has_internship_experience", "No")).strip().lower()
-        experience_level_str = (
-            str(srow.get("experience_level", "Fresher")).strip().lower()
+    # duration_months, job_title_clean, location_tokens and domain_auto come with the catalogue
+
+    # TF-IDF vectors for job text (title + description), shared with inference
+    with profiler.stage("tfidf"):
+        vectorizer, job_tfidf = load_or_build_tfidf(jobs_df, jobs_path, tfidf_dir)
+
+    # 3) Build student-internship pairs with features + weak labels,
+    #    streamed to disk chunk by chunk (see training_pairs)
+    with profiler.stage("pairs"):
+        n_pairs = generate_training_pairs(
+            students_df,
+            jobs_df,
+            job_tfidf,
+            vectorizer,
+            pairs_path,
+            sampling=sampling,
+            sample_size=sample_size,
+            chunk_students=chunk_students,
+            workers=workers,
         )
-        rel_exp_str = str(srow.get("has_relevant_experience", "No")).strip().lower()
-
-        has_exp_flag = 1 if has_exp_str == "yes" else 0
-
-        if "2+" in experience_level_str:
-            exp_level_num = 2
-        elif "1" in experience_level_str:
-            exp_level_num = 1
-        else:
-            exp_level_num = 0  # Fresher
-
-        rel_exp_flag = 1 if rel_exp_str == "yes" else 0
-
-        # skill tokens
-        s_skill_tokens = set(s_skills.replace(",", " ").split())
+        print("Saved training pairs to:", pairs_path)
 
-        # student text for TF-IDF based similarity
-        student_text = " ".join(
-            [
-                s_skills,
-                " ".join(s_domains),
-                " ".join(s_loc_pref),
-                str(srow.get("degree", "")),
-            ]
-        ).strip()
-
-        student_vec = vectorizer.transform([student_text])
-
-        # Sample some internships for training (to keep size manageable)
-        sampled_jobs = jobs_df.sample(min(100, len(jobs_df)), random_state=sid)
-
-        for _, jrow in sampled_jobs.iterrows():
-            jid = jrow["job_id"]
-            job_title = jrow["job_title_clean"]
-            job_loc_tokens = jrow["location_tokens"]
-            job_wfh = str(jrow.get("wfh", ""))
-            job_duration = float(jrow.get("duration_months", 0))
-            job_domain = jrow.get("domain_auto", "other")
-
-            # Index in original jobs_df -> job_tfidf row
-            job_idx = jrow.name
-            job_vec = job_tfidf[job_idx]
-
-            # Skills similarity
-            job_keywords = set(job_title.split())
-            skills_sim = jaccard(s_skill_tokens, job_keywords)
-
-            # Domain match
-            domain_match = 1 if job_domain in s_domains else 0
-
-            # Location similarity
-            loc_sim = jaccard(job_loc_tokens, s_loc_pref_set)
-
-            # WFH match
-            if s_wfh_pref == "Any":
-                wfh_match = 1
-            elif s_wfh_pref.lower() in job_wfh.lower():
-                wfh_match = 1
-            elif s_wfh_pref == "Virtual" and "virtual" in job_wfh.lower():
-                wfh_match = 1
-            else:
-                wfh_match = 0
-
-            # Duration fit
-            duration_fit = 1 if job_duration >= s_min_dur else 0
-
-            # Text similarity (TF-IDF cosine)
-            if student_vec.nnz == 0 or job_vec.nnz == 0:
-                text_sim = 0.0
-            else:
-                text_sim = float(cosine_similarity(student_vec, job_vec)[0, 0])
-
-            # Weak label: high-ish skills OR text sim AND some domain/location alignment
-            if skills_sim > 0.15 and (domain_match == 1 or loc_sim > 0 or skills_sim > 0.3):
-                label = 1
-            else:
-                label = 0
-
-            pairs.append(
-                {
-                    "student_id": sid,
-                    "job_id": jid,
-                    "skills_sim": skills_sim,
-                    "domain_match": domain_match,
-                    "loc_sim": loc_sim,
-                    "wfh_match": wfh_match,
-                    "duration_fit": duration_fit,
-                    "student_cgpa": s_cgpa,
-                    "job_duration_months": job_duration,
-                    "text_sim": text_sim,
-                    "has_exp_flag": has_exp_flag,
-                    "exp_level_num": exp_level_num,
-                    "rel_exp_flag": rel_exp_flag,
-                    "label": label,
-                }
-            )
-
-    pairs_df = pd.DataFrame(pairs)
-    print("Total pairs created:", len(pairs_df))
+        pairs_df = read_training_pairs(pairs_path)
+    print("Total pairs created:", n_pairs)
     print("Label distribution:\n", pairs_df["label"].value_counts())
 
-    pairs_df.to_csv(TRAINING_PAIRS_CSV, index=False)
-    print("Saved training pairs to:", TRAINING_PAIRS_CSV)
-
     # 4) Train-test split
-    feature_cols = [
-        "skills_sim",
-        "domain_match",
-        "loc_sim",
-        "wfh_match",
-        "duration_fit",
-        "student_cgpa",
-        "job_duration_months",
-        "text_sim",
-        "has_exp_flag",
-        "exp_level_num",
-        "rel_exp_flag",
-    ]
+    with profiler.stage("split"):
+        X = pairs_df[FEATURE_COLS].values
+        y = pairs_df["label"].values
 
-    X = pairs_df[feature_cols].values
-    y = pairs_df["label"].values
-
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, stratify=y, random_state=42
-    )
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, stratify=y, random_state=42
+        )
+        if tune:
+            # early stopping needs a held-out set the test set never sees
+            X_train, X_valid, y_train, y_valid = train_test_split(
+                X_train, y_train, test_size=0.2, stratify=y_train, random_state=42
+            )
 
     print("Before SMOTE, train label counts:", np.bincount(y_train))
 
     # 5) SMOTE to handle imbalance
-    smote = SMOTE(random_state=42, k_neighbors=1)
-    X_train_res, y_train_res = smote.fit_resample(X_train, y_train)
+    with profiler.stage("smote"):
+        smote = SMOTE(random_state=42, k_neighbors=1)
+        X_train_res, y_train_res = smote.fit_resample(X_train, y_train)
 
     print("After SMOTE, train label counts:", np.bincount(y_train_res))
 
     # 6) Train XGBoost
-    model = XGBClassifier(
-        n_estimators=300,
-        max_depth=6,
-        learning_rate=0.1,
-        subsample=0.8,
-        colsample_bytree=0.8,
-        objective="binary:logistic",
-        eval_metric="auc",
-        random_state=42,
-    )
+    if tune:
+        print(f"Tuning XGBoost ({search} search, {n_trials} trials)...")
+        with profiler.stage("tune"):
+            best, trials = run_search(
+                X_train_res,
+                y_train_res,
+                X_valid,
+                y_valid,
+                search=search,
+                n_trials=n_trials,
+                max_rounds=max_rounds,
+                parallel=parallel_trials,
+            )
+        print(f"Best trial {best['trial']}: valid AUC {best['valid_auc']:.4f}, "
+              f"{best['best_iteration'] + 1} trees, params {best['params']}")
+        print("Saved trial table to:", save_search(model_path, search, best, trials))
+        model = XGBClassifier(**classifier_params(best))
+    else:
+        model = XGBClassifier(
+            n_estimators=300,
+            max_depth=6,
+            learning_rate=0.1,
+            subsample=0.8,
+            colsample_bytree=0.8,
+            objective="binary:logistic",
+            eval_metric="auc",
+            random_state=42,
+        )
 
     print("Training XGBoost model...")
-    model.fit(X_train_res, y_train_res)
+    with profiler.stage("fit"):
+        model.fit(X_train_res, y_train_res)
 
     # 7) Evaluate
-    y_pred = model.predict(X_test)
-    y_proba = model.predict_proba(X_test)[:, 1]
+    with profiler.stage("evaluate"):
+        y_pred = model.predict(X_test)
+        y_proba = model.predict_proba(X_test)[:, 1]
+        roc_auc = roc_auc_score(y_test, y_proba)
 
     print("Classification report:\n", classification_report(y_test, y_pred))
-    print("ROC AUC:", roc_auc_score(y_test, y_proba))
+    print("ROC AUC:", roc_auc)
 
     # 8) Save model
-    model.save_model(MODEL_PATH)
-    print("Saved XGBoost model to:", MODEL_PATH)
+    with profiler.stage("save"):
+        model.save_model(model_path)
+    print("Saved XGBoost model to:", model_path)
+
+    # 9) Stage timing / memory profile next to the model
+    profile_path = profile_path_for(model_path)
+    report = profiler.save(
+        profile_path,
+        n_jobs=len(jobs_df),
+        n_students=len(students_df),
+        n_pairs=int(n_pairs),
+        n_train_resampled=int(len(y_train_res)),
+        sampling=sampling,
+        sample_size=sample_size,
+        workers=workers or os.cpu_count(),
+        tuned=tune,
+        roc_auc=float(roc_auc),
+    )
+    profiler.print_summary()
+    print("Saved training profile to:", profile_path)
+    return report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train the XGBoost student-internship match model.")
+    parser.add_argument("--jobs", default=JOBS_PATH, help="job catalogue (json/ndjson)")
+    parser.add_argument("--students", default=STUDENTS_PATH, help="students json")
+    parser.add_argument("--model-output", default=MODEL_PATH,
+                        help="model path; the TF-IDF artifacts and <model>.profile.json go next to it")
+    parser.add_argument("--pairs-output", default=None,
+                        help="training pairs file (default: data/training_pairs.parquet "
+                             "with pyarrow installed, data/training_pairs.csv otherwise)")
+    parser.add_argument("--sampling", choices=SAMPLING_STRATEGIES, default="random",
+                        help="random: --sample-size jobs per student (seeded by student_id); "
+                             "all: every job")
+    parser.add_argument("--sample-size", type=int, default=SAMPLE_SIZE)
+    parser.add_argument("--chunk-students", type=int, default=CHUNK_STUDENTS,
+                        help="students per pair-generation task")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="pair-generation processes (default: all cores)")
+    parser.add_argument("--tune", action="store_true",
+                        help="search XGBoost parameters (early-stopped on a validation split) "
+                             "and train the best configuration")
+    parser.add_argument("--search", choices=SEARCH_STRATEGIES, default="random",
+                        help="random search, or successive halving over round budgets")
+    parser.add_argument("--trials", type=int, default=N_TRIALS)
+    parser.add_argument("--max-rounds", type=int, default=MAX_ROUNDS,
+                        help="boosting rounds per trial before early stopping")
+    parser.add_argument("--parallel-trials", type=int, default=None,
+                        help="trials trained at once (default: one per core)")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(
+        pairs_path=args.pairs_output or (TRAINING_PAIRS_PARQUET if parquet_available() else TRAINING_PAIRS_CSV),
+        sampling=args.sampling,
+        sample_size=args.sample_size,
+        chunk_students=args.chunk_students,
+        workers=args.workers,
+        jobs_path=args.jobs,
+        students_path=args.students,
+        model_path=args.model_output,
+        tune=args.tune,
+        search=args.search,
+        n_trials=args.trials,
+        max_rounds=args.max_rounds,
+        parallel_trials=args.parallel_trials,
+    )
@@ -0,0 +1,191 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: pairs are written as CSV without it
+    pa = None
+
+from match_features import FEATURE_COLS, JobFeatureMatrix, student_profile
+
+# -----------------------------
+# Training pair generation
+# -----------------------------
+# Students are cut into chunks; each chunk's pairs are built with array ops
+# (one feature matrix per student over its sampled jobs) in a worker process
+# and appended to the output file as soon as it is done, in student order.
+PAIR_COLS = ["student_id", "job_id"] + FEATURE_COLS + ["label"]
+INT_COLS = [
+    "domain_match",
+    "wfh_match",
+    "duration_fit",
+    "has_exp_flag",
+    "exp_level_num",
+    "rel_exp_flag",
+    "label",
+]
+
+# "random": sample_size jobs per student, seeded by student_id (reproducible)
+# "all":    every job for every student
+SAMPLING_STRATEGIES = ("random", "all")
+SAMPLE_SIZE = 100
+CHUNK_STUDENTS = 200
+
+
+def parquet_available() -> bool:
+    """Whether pairs can be written as Parquet (pyarrow is installed)."""
+    return pa is not None
+
+
+def weak_labels(X: np.ndarray) -> np.ndarray:
+    # Weak label: high-ish skills OR text sim AND some domain/location alignment
+    skills_sim = X[:, FEATURE_COLS.index("skills_sim")]
+    domain_match = X[:, FEATURE_COLS.index("domain_match")]
+    loc_sim = X[:, FEATURE_COLS.index("loc_sim")]
+    return (
+        (skills_sim > 0.15) & ((domain_match == 1) | (loc_sim > 0) | (skills_sim > 0.3))
+    ).astype(np.int64)
+
+
+def sample_job_rows(n_jobs: int, student_id, sampling: str, sample_size: int) -> np.ndarray:
+    if sampling == "all":
+        return np.arange(n_jobs)
+    # same draw as jobs_df.sample(min(sample_size, len(jobs_df)), random_state=student_id)
+    positions = pd.Series(np.arange(n_jobs))
+    return positions.sample(min(sample_size, n_jobs), random_state=student_id).to_numpy()
+
+
+# State shared by every chunk of one run; set once per worker process
+_worker = {}
+
+
+def _init_worker(job_features, job_ids, vectorizer, sampling, sample_size):
+    _worker.update(
+        job_features=job_features,
+        job_ids=job_ids,
+        vectorizer=vectorizer,
+        sampling=sampling,
+        sample_size=sample_size,
+    )
+
+
+def pairs_for_students(students) -> pd.DataFrame:
+    """Feature rows and weak labels of a chunk of student records."""
+    job_features = _worker["job_features"]
+    profiles = [student_profile(srow) for srow in students]
+    student_vecs = _worker["vectorizer"].transform([p["text"] for p in profiles])
+
+    blocks, student_ids, job_rows = [], [], []
+    for i, (srow, profile) in enumerate(zip(students, profiles)):
+        rows = sample_job_rows(
+            job_features.size, srow["student_id"], _worker["sampling"], _worker["sample_size"]
+        )
+        blocks.append(job_features.features(profile, student_vecs[i], rows=rows))
+        student_ids.append(np.full(len(rows), srow["student_id"]))
+        job_rows.append(rows)
+
+    if not blocks:
+        return pd.DataFrame(columns=PAIR_COLS)
+    X = np.vstack(blocks)
+    pairs_df = pd.DataFrame(X, columns=FEATURE_COLS)
+    pairs_df.insert(0, "student_id", np.concatenate(student_ids))
+    pairs_df.insert(1, "job_id", _worker["job_ids"][np.concatenate(job_rows)])
+    pairs_df["label"] = weak_labels(X)
+    pairs_df[INT_COLS] = pairs_df[INT_COLS].astype(np.int64)
+    return pairs_df
+
+
+class PairWriter:
+    """Appends pair chunks to Parquet (path ending .parquet) or CSV."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.rows = 0
+        self._parquet = path.endswith(".parquet")
+        self._writer = None
+        if self._parquet and pa is None:
+            raise RuntimeError("pyarrow is required to write Parquet training pairs")
+
+    def write(self, pairs_df: pd.DataFrame):
+        if self._parquet:
+            table = pa.Table.from_pandas(pairs_df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.tmp_path, table.schema)
+            self._writer.write_table(table)
+        else:
+            pairs_df.to_csv(self.tmp_path, mode="a" if self.rows else "w",
+                            header=not self.rows, index=False)
+        self.rows += len(pairs_df)
+
+    def close(self, discard: bool = False):
+        # the file appears under its final name only when complete
+        if self._writer is not None:
+            self._writer.close()
+        if not os.path.exists(self.tmp_path):
+            return
+        if discard:
+            os.remove(self.tmp_path)
+        else:
+            os.replace(self.tmp_path, self.path)
+
+
+def generate_training_pairs(
+    students_df,
+    jobs_df,
+    job_tfidf,
+    vectorizer,
+    out_path: str,
+    sampling: str = "random",
+    sample_size: int = SAMPLE_SIZE,
+    chunk_students: int = CHUNK_STUDENTS,
+    workers: int = None,
+) -> int:
+    """
+    Build student x job training pairs and stream them to out_path.
+
+    Chunks of chunk_students students are processed by a pool of `workers`
+    processes (default: all cores; 1 runs in this process). Returns the
+    number of pairs written.
+    """
+    if sampling not in SAMPLING_STRATEGIES:
+        raise ValueError(f"unknown sampling strategy {sampling!r}, expected one of {SAMPLING_STRATEGIES}")
+
+    init_args = (
+        JobFeatureMatrix(jobs_df, job_tfidf),
+        jobs_df["job_id"].to_numpy(),
+        vectorizer,
+        sampling,
+        sample_size,
+    )
+    records = students_df.to_dict("records")
+    chunks = [records[i:i + chunk_students] for i in range(0, len(records), chunk_students)]
+    workers = min(workers or os.cpu_count() or 1, max(len(chunks), 1))
+
+    writer = PairWriter(out_path)
+    try:
+        if workers == 1:
+            _init_worker(*init_args)
+            for pairs_df in map(pairs_for_students, chunks):
+                writer.write(pairs_df)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=init_args
+            ) as pool:
+                for pairs_df in pool.map(pairs_for_students, chunks):
+                    writer.write(pairs_df)
+    except BaseException:
+        writer.close(discard=True)
+        raise
+    writer.close()
+    return writer.rows
+
+
+def read_training_pairs(path: str) -> pd.DataFrame:
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
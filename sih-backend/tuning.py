@@ -0,0 +1,169 @@
+import json
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+# -----------------------------
+# Hyperparameter search
+# -----------------------------
+# Trials train with xgb.train on QuantileDMatrix objects built once per search
+# (binning the features is the expensive part of a hist-method DMatrix), run
+# a few at a time in threads (XGBoost releases the GIL) and stop early on the
+# validation AUC.
+SEARCH_STRATEGIES = ("random", "halving")
+N_TRIALS = 20
+MAX_ROUNDS = 1000
+EARLY_STOPPING_ROUNDS = 30
+HALVING_ETA = 3
+MIN_ROUNDS = 30
+MAX_BIN = 256
+
+BASE_PARAMS = {
+    "objective": "binary:logistic",
+    "eval_metric": "auc",
+    "tree_method": "hist",
+    "max_bin": MAX_BIN,
+    "seed": 42,
+}
+
+
+def sample_params(rng) -> dict:
+    return {
+        "max_depth": int(rng.integers(3, 11)),
+        "learning_rate": float(10 ** rng.uniform(-2, math.log10(0.3))),
+        "subsample": float(rng.uniform(0.6, 1.0)),
+        "colsample_bytree": float(rng.uniform(0.6, 1.0)),
+        "min_child_weight": float(10 ** rng.uniform(0, 1)),
+        "gamma": float(rng.uniform(0, 5)),
+        "reg_lambda": float(10 ** rng.uniform(-1, 1)),
+    }
+
+
+def _rank(result: dict):
+    # higher validation AUC first; on a tie, the smaller model
+    return (result["valid_auc"], -result["best_iteration"])
+
+
+def _train_trial(trial: dict, dtrain, dvalid, rounds: int, nthread: int) -> dict:
+    params = {**BASE_PARAMS, **trial["params"], "nthread": nthread}
+    started = time.perf_counter()
+    booster = xgb.train(
+        params,
+        dtrain,
+        num_boost_round=rounds,
+        evals=[(dvalid, "valid")],
+        early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+        verbose_eval=False,
+    )
+    return {
+        **trial,
+        "rounds": rounds,
+        "best_iteration": int(booster.best_iteration),
+        "valid_auc": float(booster.best_score),
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+
+
+def run_search(
+    X_train,
+    y_train,
+    X_valid,
+    y_valid,
+    search: str = "random",
+    n_trials: int = N_TRIALS,
+    max_rounds: int = MAX_ROUNDS,
+    parallel: int = None,
+    seed: int = 42,
+):
+    """
+    Search XGBoost parameters; returns (best trial, list of all trial results).
+
+    random:  n_trials sampled configurations, each trained up to max_rounds.
+    halving: successive halving - all configurations start with a small
+             round budget, the best 1/HALVING_ETA go on with HALVING_ETA
+             times the budget, until one is left or max_rounds is reached.
+    """
+    if search not in SEARCH_STRATEGIES:
+        raise ValueError(f"unknown search {search!r}, expected one of {SEARCH_STRATEGIES}")
+
+    cores = os.cpu_count() or 1
+    parallel = max(1, min(parallel or cores, n_trials))
+    nthread = max(1, cores // parallel)
+
+    dtrain = xgb.QuantileDMatrix(X_train, label=y_train, max_bin=MAX_BIN)
+    dvalid = xgb.QuantileDMatrix(X_valid, label=y_valid, ref=dtrain)
+
+    rng = np.random.default_rng(seed)
+    trials = [{"trial": i, "params": sample_params(rng)} for i in range(n_trials)]
+
+    if search == "random":
+        rounds = max_rounds
+    else:
+        rungs = int(math.log(n_trials, HALVING_ETA)) if n_trials > 1 else 0
+        rounds = max(MIN_ROUNDS, max_rounds // HALVING_ETA ** rungs)
+
+    results = []
+    rung = 0
+    with ThreadPoolExecutor(max_workers=parallel) as pool:
+        while True:
+            done = list(pool.map(
+                lambda t: _train_trial(t, dtrain, dvalid, rounds, nthread), trials
+            ))
+            for r in done:
+                r["rung"] = rung
+                print(f"  trial {r['trial']:>3} rung {rung} rounds {rounds:>5}: "
+                      f"valid AUC {r['valid_auc']:.4f} at {r['best_iteration'] + 1} "
+                      f"trees ({r['seconds']:.2f}s)")
+            results.extend(done)
+
+            if search == "random" or len(done) == 1 or rounds >= max_rounds:
+                best = max(done, key=_rank)
+                return best, results
+
+            done.sort(key=_rank, reverse=True)
+            trials = [
+                {"trial": r["trial"], "params": r["params"]}
+                for r in done[:max(1, len(done) // HALVING_ETA)]
+            ]
+            rounds = min(max_rounds, rounds * HALVING_ETA)
+            rung += 1
+
+
+def classifier_params(best: dict) -> dict:
+    # XGBClassifier settings reproducing the best trial (n_estimators = its best iteration)
+    return {
+        **best["params"],
+        "n_estimators": best["best_iteration"] + 1,
+        "objective": BASE_PARAMS["objective"],
+        "eval_metric": BASE_PARAMS["eval_metric"],
+        "tree_method": BASE_PARAMS["tree_method"],
+        "max_bin": MAX_BIN,
+        "random_state": BASE_PARAMS["seed"],
+    }
+
+
+def save_search(model_path: str, search: str, best: dict, results: list) -> str:
+    # <model>.tuning.csv (one row per trial and rung) + <model>.tuning.json (best)
+    stem = os.path.splitext(model_path)[0]
+    table = pd.DataFrame(
+        [{k: v for k, v in r.items() if k != "params"} | r["params"] for r in results]
+    )
+    table.to_csv(stem + ".tuning.csv", index=False)
+    with open(stem + ".tuning.json", "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "search": search,
+                "trials": len({r["trial"] for r in results}),
+                "total_trial_seconds": round(sum(r["seconds"] for r in results), 4),
+                "best": best,
+                "classifier_params": classifier_params(best),
+            },
+            f,
+            indent=2,
+        )
+    return stem + ".tuning.csv"